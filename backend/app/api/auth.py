@@ -55,7 +55,7 @@ async def login(request: LoginRequest):
         logger.info(f"Login attempt for user: {request.username}")
 
         # Authenticate with HERE's endpoint
-        user_info = auth_service.authenticate_user(request.username, request.password)
+        user_info = await auth_service.authenticate_user_async(request.username, request.password)
 
         if not user_info:
             logger.warning(f"Login failed for user: {request.username}")
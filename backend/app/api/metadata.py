@@ -46,7 +46,7 @@ async def get_metadata(
         logger.info(f"Fetching metadata for: {catalog_schema_table}")
         
         # Get complete table with columns
-        table_with_columns = dynamodb_service.get_table_with_columns(catalog_schema_table)
+        table_with_columns = await dynamodb_service.get_table_with_columns_async(catalog_schema_table)
         
         if not table_with_columns:
             raise HTTPException(
@@ -101,7 +101,7 @@ async def get_relationship_status(
                 detail=f"Table '{catalog_schema_table}' not found"
             )
 
-        return {"relationship_detection_status": status.value}
+        return {"relationship_detection_status": status}
 
     except HTTPException:
         raise
@@ -336,7 +336,7 @@ async def update_table_config(
         logger.info(f"Updating table config for {catalog_schema_table}")
 
         # Check if table metadata exists
-        table_metadata = dynamodb_service.get_table_metadata(catalog_schema_table)
+        table_metadata = await dynamodb_service.get_table_metadata_async(catalog_schema_table)
         if not table_metadata:
             raise HTTPException(
                 status_code=404,
@@ -361,7 +361,7 @@ async def update_table_config(
             logger.info(f"Successfully updated {', '.join(updated_fields)} for {catalog_schema_table}")
 
             # Also update Neptune if table is imported
-            if table_metadata.neptune_import_status.value == 'imported':
+            if table_metadata.neptune_import_status == 'imported':
                 try:
                     # Update search_mode and custom_instructions in Neptune
                     update_query = """
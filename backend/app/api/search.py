@@ -1,6 +1,8 @@
 """
 API endpoints for semantic search using Neptune vector similarity
 """
+import asyncio
+
 from fastapi import APIRouter, HTTPException, Body
 from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional
@@ -276,8 +278,12 @@ async def semantic_search(request: SemanticSearchRequest = Body(...)):
             # In analytics mode, fetch metadata for ALL matched tables (including those from column search)
             # Note: table_similarity_map already created during filtering (line ~195)
 
-            for table_name in matched_table_names:
-                table_metadata = dynamodb_service.get_table_metadata(table_name)
+            # Table metadata fetched concurrently
+            table_metadatas = await asyncio.gather(*(
+                dynamodb_service.get_table_metadata_async(table_name)
+                for table_name in matched_table_names
+            ))
+            for table_name, table_metadata in zip(matched_table_names, table_metadatas):
                 if table_metadata:
                     # Use similarity from table search, or max column similarity if found via column search
                     if table_name in table_similarity_map:
@@ -292,27 +298,30 @@ async def semantic_search(request: SemanticSearchRequest = Body(...)):
                         catalog_schema_table=table_metadata.catalog_schema_table,
                         row_count=table_metadata.row_count,
                         column_count=table_metadata.column_count,
-                        schema_status=table_metadata.schema_status.value,
-                        enrichment_status=table_metadata.enrichment_status.value,
-                        relationship_detection_status=table_metadata.relationship_detection_status.value,
-                        neptune_import_status=table_metadata.neptune_import_status.value,
+                        schema_status=table_metadata.schema_status,
+                        enrichment_status=table_metadata.enrichment_status,
+                        relationship_detection_status=table_metadata.relationship_detection_status,
+                        neptune_import_status=table_metadata.neptune_import_status,
                         similarity_score=similarity,
                         search_mode=table_metadata.search_mode,
                         custom_instructions=table_metadata.custom_instructions
                     ))
         else:
             # In datamining mode, fetch metadata only for tables matched by table search
-            for table_name, similarity in matched_tables:
-                table_metadata = dynamodb_service.get_table_metadata(table_name)
+            table_metadatas = await asyncio.gather(*(
+                dynamodb_service.get_table_metadata_async(table_name)
+                for table_name, _ in matched_tables
+            ))
+            for (table_name, similarity), table_metadata in zip(matched_tables, table_metadatas):
                 if table_metadata:
                     table_metadata_list.append(TableMetadataResponse(
                         catalog_schema_table=table_metadata.catalog_schema_table,
                         row_count=table_metadata.row_count,
                         column_count=table_metadata.column_count,
-                        schema_status=table_metadata.schema_status.value,
-                        enrichment_status=table_metadata.enrichment_status.value,
-                        relationship_detection_status=table_metadata.relationship_detection_status.value,
-                        neptune_import_status=table_metadata.neptune_import_status.value,
+                        schema_status=table_metadata.schema_status,
+                        enrichment_status=table_metadata.enrichment_status,
+                        relationship_detection_status=table_metadata.relationship_detection_status,
+                        neptune_import_status=table_metadata.neptune_import_status,
                         similarity_score=similarity,
                         search_mode=table_metadata.search_mode,
                         custom_instructions=table_metadata.custom_instructions
@@ -325,29 +334,32 @@ async def semantic_search(request: SemanticSearchRequest = Body(...)):
             # Analytics mode: Fetch ALL columns for matched tables
             logger.info(f"Fetching ALL columns for {len(matched_table_names)} matched tables...")
 
-            for table_name in matched_table_names:
-                # Get all columns for this table from DynamoDB
-                table_with_columns = dynamodb_service.get_table_with_columns(table_name)
+            # Get all columns for each table from DynamoDB, tables fetched concurrently
+            tables_with_columns = await asyncio.gather(*(
+                dynamodb_service.get_table_with_columns_async(table_name)
+                for table_name in matched_table_names
+            ))
+            for table_name, table_with_columns in zip(matched_table_names, tables_with_columns):
                 if table_with_columns and table_with_columns.columns:
-                    for col_name, col_dict in table_with_columns.columns.items():
+                    for col_name, col in table_with_columns.columns.items():
                         # Skip stats-only columns if they exist
-                        if col_dict.get('column_type') in ['min', 'max', 'avg']:
+                        if col.column_type in ['min', 'max', 'avg']:
                             continue
 
                         column_metadata_list.append(ColumnMetadataResponse(
                             catalog_schema_table=table_name,
                             column_name=col_name,
-                            data_type=col_dict.get('data_type', 'unknown'),
-                            column_type=col_dict.get('column_type', 'unknown'),
-                            semantic_type=col_dict.get('semantic_type'),
-                            description=col_dict.get('description', ''),
-                            aliases=col_dict.get('aliases', []),
-                            cardinality=col_dict.get('cardinality'),
-                            null_percentage=col_dict.get('null_percentage'),
-                            sample_values=col_dict.get('sample_values', []),
-                            min_value=col_dict.get('min_value'),
-                            max_value=col_dict.get('max_value'),
-                            avg_value=col_dict.get('avg_value')
+                            data_type=col.data_type,
+                            column_type=col.column_type,
+                            semantic_type=col.semantic_type,
+                            description=col.description,
+                            aliases=col.aliases,
+                            cardinality=col.cardinality,
+                            null_percentage=col.null_percentage,
+                            sample_values=col.sample_values,
+                            min_value=col.min_value,
+                            max_value=col.max_value,
+                            avg_value=col.avg_value
                             # similarity_score omitted in Analytics mode - defaults to None
                         ))
 
@@ -365,7 +377,7 @@ async def semantic_search(request: SemanticSearchRequest = Body(...)):
 
             # Batch fetch column metadata
             column_keys = [(table, col) for table, col, _ in column_keys_with_similarity]
-            columns_batch = dynamodb_service.batch_get_column_metadata(column_keys)
+            columns_batch = await dynamodb_service.batch_get_column_metadata_async(column_keys)
 
             # Create a lookup map for similarity scores
             similarity_map = {f"{table}.{col}": sim for table, col, sim in column_keys_with_similarity}
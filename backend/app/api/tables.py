@@ -2,10 +2,17 @@
 API endpoints for table operations
 """
 
-from typing import List
-
-import pandas as pd  # Add if not already there
-from fastapi import APIRouter, HTTPException, Path, Query, Request
+import asyncio
+import datetime
+import hashlib
+from decimal import Decimal
+from typing import Any, Callable, Hashable, List, Optional
+
+import orjson
+import pandas as pd
+from fastapi import APIRouter, HTTPException, Path, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
 
 from app.models import (
     CatalogsResponse,
@@ -13,14 +20,138 @@ from app.models import (
     TableDataResponse,
     TablesInCatalogResponse,
     TablesResponse,
-    TableSummary,
 )
 from app.services import dynamodb_service, starburst_service
+from app.utils.cache import TTLCache
 from app.utils.logger import app_logger as logger
 
+# Optional import for Arrow IPC table-data responses
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    logger.warning("pyarrow library not available - Arrow table-data responses disabled")
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# Pre-serialized JSON bodies for the list endpoints: key -> (body, etag).
+# Kept short so enrichment/import status changes show up quickly; the
+# /tables key also carries dynamodb_service.tables_version, so DynamoDB
+# writes made by this process show up immediately.
+LIST_RESPONSE_CACHE_TTL_SECONDS = 15
+_list_response_cache = TTLCache(maxsize=256, ttl_seconds=LIST_RESPONSE_CACHE_TTL_SECONDS)
+
 router = APIRouter(prefix="/api", tags=["tables"])
 
 
+def _json_default(obj: Any) -> Any:
+    """
+    Fallback encoder for values orjson can't serialize natively
+
+    Mirrors what FastAPI's jsonable_encoder produced for the same Trino types
+    (Decimal, pandas Timestamp, varbinary) so clients see identical payloads.
+    """
+    if isinstance(obj, Decimal):
+        return int(obj) if obj.as_tuple().exponent >= 0 else float(obj)
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, bytes):
+        return obj.decode(errors="replace")
+    return str(obj)
+
+
+class SampleDataResponse(ORJSONResponse):
+    """ORJSONResponse that tolerates the non-native types Trino returns"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_json_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+
+
+def _cached_json_response(
+    request: Request, key: Hashable, build: Callable[[], BaseModel]
+) -> Response:
+    """
+    Serve a list endpoint from pre-serialized JSON bytes
+
+    On a cache miss the model is built and encoded once by pydantic-core's
+    JSON serializer; hits hand the stored bytes straight to the response. Requests whose If-None-Match
+    matches the body's ETag get an empty 304.
+
+    Args:
+        request: Incoming request (for If-None-Match)
+        key: Cache key for the response body
+        build: Callable producing the response model on a miss
+
+    Returns:
+        JSON Response with ETag header, or 304 Not Modified
+    """
+    cached = _list_response_cache.get(key)
+    if cached is None:
+        body = build().model_dump_json().encode()
+        cached = (body, f'"{hashlib.sha1(body).hexdigest()}"')
+        _list_response_cache.set(key, cached)
+
+    body, etag = cached
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+async def _fetch_sample_data(
+    request: Request,
+    catalog: str,
+    schema: str,
+    table_name: str,
+    limit: int,
+    columns: Optional[List[str]],
+) -> pd.DataFrame:
+    """Fetch a sample DataFrame for the table-data endpoints without blocking the event loop"""
+    # Known row count lets Starburst sample scan-side instead of sorting
+    table_metadata = await dynamodb_service.get_table_metadata_async(
+        f"{catalog}.{schema}.{table_name}"
+    )
+    row_count = table_metadata.row_count if table_metadata else None
+
+    return await asyncio.to_thread(
+        starburst_service.get_sample_data_with_catalog,
+        catalog,
+        schema,
+        table_name,
+        limit=limit,
+        username=request.state.username,
+        password=request.state.password,
+        columns=columns,
+        row_count=row_count,
+    )
+
+
+def _arrow_response(df: pd.DataFrame) -> Response:
+    """Serialize a sample DataFrame as an Arrow IPC stream"""
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed-type object columns: fall back to nullable strings
+        object_columns = df.select_dtypes(include="object").columns
+        table = pa.Table.from_pandas(
+            df.astype({col: "string" for col in object_columns}),
+            preserve_index=False,
+        )
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+
+    return Response(
+        content=sink.getvalue().to_pybytes(), media_type=ARROW_STREAM_MEDIA_TYPE
+    )
+
+
 @router.get(
     "/catalogs",
     response_model=CatalogsResponse,
@@ -31,16 +162,23 @@ async def get_catalogs(request: Request):
     Get list of all available catalogs
 
     Returns:
-        CatalogsResponse containing list of catalogs
+        CatalogsResponse containing list of catalogs (cached per user)
     """
     try:
-        logger.info("Fetching all catalogs")
-        catalogs = starburst_service.get_catalogs(
-            username=request.state.username, password=request.state.password
-        )
 
-        logger.info(f"Returning {len(catalogs)} catalogs")
-        return CatalogsResponse(catalogs=catalogs, total_count=len(catalogs))
+        def build() -> CatalogsResponse:
+            logger.info("Fetching all catalogs")
+            catalogs = starburst_service.get_catalogs(
+                username=request.state.username, password=request.state.password
+            )
+
+            logger.info(f"Returning {len(catalogs)} catalogs")
+            return CatalogsResponse(catalogs=catalogs, total_count=len(catalogs))
+
+        # Catalog visibility depends on the user's Starburst permissions
+        return _cached_json_response(
+            request, ("catalogs", request.state.username), build
+        )
 
     except Exception as e:
         logger.error(f"Error fetching catalogs: {e}")
@@ -124,7 +262,7 @@ async def get_tables_in_schema(
 @router.get(
     "/tables", response_model=TablesResponse, responses={500: {"model": ErrorResponse}}
 )
-async def get_tables():
+async def get_tables(request: Request):
     """
     Get list of all tables WITH metadata (from DynamoDB only)
 
@@ -132,17 +270,26 @@ async def get_tables():
         TablesResponse containing list of tables with summary information
     """
     try:
-        logger.info("Fetching all tables with metadata from DynamoDB")
 
-        # Get all tables from DynamoDB (only tables with generated metadata)
-        table_summaries = dynamodb_service.get_all_tables()
+        def build() -> TablesResponse:
+            logger.info("Fetching all tables with metadata from DynamoDB")
+
+            # Get all tables from DynamoDB (only tables with generated metadata)
+            table_summaries = dynamodb_service.get_all_tables()
 
-        # Sort by table name
-        table_summaries.sort(key=lambda x: x.name)
+            # Sort by table name
+            table_summaries.sort(key=lambda x: x.name)
 
-        logger.info(f"Returning {len(table_summaries)} tables with metadata")
+            logger.info(f"Returning {len(table_summaries)} tables with metadata")
+
+            return TablesResponse(
+                tables=table_summaries, total_count=len(table_summaries)
+            )
 
-        return TablesResponse(tables=table_summaries, total_count=len(table_summaries))
+        # Any table write bumps tables_version, so a stale listing is never served
+        return _cached_json_response(
+            request, ("tables", dynamodb_service.tables_version), build
+        )
 
     except Exception as e:
         logger.error(f"Error fetching tables: {e}")
@@ -151,8 +298,13 @@ async def get_tables():
 
 @router.get(
     "/table-data/{catalog}/{schema}/{table_name}",
-    response_model=TableDataResponse,
-    responses={404: {"model": ErrorResponse}, 500: {"model": ErrorResponse}},
+    response_model=None,
+    response_class=SampleDataResponse,
+    responses={
+        200: {"model": TableDataResponse},
+        404: {"model": ErrorResponse},
+        500: {"model": ErrorResponse},
+    },
 )
 async def get_table_data(
     request: Request,
@@ -162,6 +314,9 @@ async def get_table_data(
     limit: int = Query(
         default=1000, ge=1, le=10000, description="Number of rows to return"
     ),
+    columns: Optional[List[str]] = Query(
+        default=None, description="Columns to return (defaults to all columns)"
+    ),
 ):
     """
     Get random sample of data from a table
@@ -171,9 +326,13 @@ async def get_table_data(
         schema: Schema name
         table_name: Name of the table
         limit: Number of rows to return (default 1000, max 10000)
+        columns: Optional subset of columns to project
 
     Returns:
-        TableDataResponse containing sample data
+        TableDataResponse-shaped JSON containing sample data. The payload is
+        serialized directly with orjson; the model only documents the schema.
+        Requests that accept application/vnd.apache.arrow.stream receive an
+        Arrow IPC stream instead.
     """
     try:
         logger.info(
@@ -181,46 +340,41 @@ async def get_table_data(
         )
 
         # Get sample data
-        df = starburst_service.get_sample_data_with_catalog(
-            catalog,
-            schema,
-            table_name,
-            limit=limit,
-            username=request.state.username,
-            password=request.state.password,
-        )
+        df = await _fetch_sample_data(request, catalog, schema, table_name, limit, columns)
+
+        # Clients that understand Arrow get the columnar payload directly
+        if PYARROW_AVAILABLE and ARROW_STREAM_MEDIA_TYPE in request.headers.get(
+            "accept", ""
+        ):
+            return _arrow_response(df if df is not None else pd.DataFrame())
+
         if df is None or df.empty:
             logger.warning(
                 f"No sample data available for {catalog}.{schema}.{table_name}"
             )
-            return TableDataResponse(
-                table_name=f"{catalog}.{schema}.{table_name}",
-                columns=[],
-                data=[],
-                row_count=0,
+            return SampleDataResponse(
+                {
+                    "table_name": f"{catalog}.{schema}.{table_name}",
+                    "columns": [],
+                    "data": [],
+                    "row_count": 0,
+                }
             )
         # Convert DataFrame to list format
-        columns = df.columns.tolist()
-        data = []
-        for _, row in df.iterrows():
-            row_data = []
-            for val in row:
-                # Convert complex types to strings
-                if isinstance(val, (list, dict)):
-                    row_data.append(str(val))
-                elif pd.isna(val):
-                    row_data.append(None)
-                else:
-                    row_data.append(val)
-            data.append(row_data)
-
-        logger.info(f"Returning {len(data)} rows with {len(columns)} columns")
-
-        return TableDataResponse(
-            table_name=f"{catalog}.{schema}.{table_name}",
-            columns=columns,
-            data=data,
-            row_count=len(data),
+        # (complex types are already stringified by the Starburst service;
+        # NaN/NaT/pd.NA become None in a single vectorized pass)
+        column_names = df.columns.tolist()
+        data = df.to_numpy(dtype=object, na_value=None).tolist()
+
+        logger.info(f"Returning {len(data)} rows with {len(column_names)} columns")
+
+        return SampleDataResponse(
+            {
+                "table_name": f"{catalog}.{schema}.{table_name}",
+                "columns": column_names,
+                "data": data,
+                "row_count": len(data),
+            }
         )
 
     except Exception as e:
@@ -229,3 +383,63 @@ async def get_table_data(
             exc_info=True,
         )
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get(
+    "/table-data-arrow/{catalog}/{schema}/{table_name}",
+    response_class=Response,
+    responses={
+        200: {"content": {ARROW_STREAM_MEDIA_TYPE: {}}},
+        500: {"model": ErrorResponse},
+        501: {"model": ErrorResponse},
+    },
+)
+async def get_table_data_arrow(
+    request: Request,
+    catalog: str = Path(..., description="Catalog name"),
+    schema: str = Path(..., description="Schema name"),
+    table_name: str = Path(..., description="Table name"),
+    limit: int = Query(
+        default=1000, ge=1, le=10000, description="Number of rows to return"
+    ),
+    columns: Optional[List[str]] = Query(
+        default=None, description="Columns to return (defaults to all columns)"
+    ),
+):
+    """
+    Get random sample of data from a table as an Arrow IPC stream
+
+    Args:
+        catalog: Catalog name
+        schema: Schema name
+        table_name: Name of the table
+        limit: Number of rows to return (default 1000, max 10000)
+        columns: Optional subset of columns to project
+
+    Returns:
+        Arrow IPC stream (application/vnd.apache.arrow.stream) of the sample rows
+    """
+    if not PYARROW_AVAILABLE:
+        raise HTTPException(
+            status_code=501, detail="Arrow responses require the pyarrow library"
+        )
+
+    try:
+        logger.info(
+            f"Fetching Arrow data for {catalog}.{schema}.{table_name}, limit: {limit}"
+        )
+
+        df = await _fetch_sample_data(request, catalog, schema, table_name, limit, columns)
+        if df is None:
+            df = pd.DataFrame()
+
+        logger.info(f"Returning {len(df)} rows with {len(df.columns)} columns as Arrow")
+
+        return _arrow_response(df)
+
+    except Exception as e:
+        logger.error(
+            f"Error fetching Arrow table data for {catalog}.{schema}.{table_name}: {e}",
+            exc_info=True,
+        )
+        raise HTTPException(status_code=500, detail=str(e))
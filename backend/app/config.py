@@ -5,7 +5,7 @@ Configuration management using Pydantic Settings
 import os
 from typing import List, Optional
 
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -24,6 +24,12 @@ class Settings(BaseSettings):
     aws_region: str = "us-east-1"
     dynamodb_table_metadata_table: str = "table_metadata"
     dynamodb_column_metadata_table: str = "column_metadata"
+    dynamodb_scan_segments: int = 8  # Parallel scan segments for full-table listings
+    dynamodb_status_cache_ttl_seconds: float = 2.0  # Reuse relationship status reads for polling bursts (0 disables)
+    dynamodb_columns_cache_ttl_seconds: float = 30.0  # Reuse per-table column metadata reads (0 disables)
+    dynamodb_max_pool_connections: int = 50  # Keep-alive HTTP connections shared by scan/batch-get threads
+    dynamodb_max_attempts: int = 5  # Total attempts per request, including throttling retries
+    dynamodb_dax_endpoint: Optional[str] = None  # DAX cluster URL (daxs://...) for column metadata reads; needs amazon-dax-client
 
     # AWS Credentials (optional - will use boto3 default chain if not provided)
     aws_access_key_id: Optional[str] = None
@@ -39,12 +45,34 @@ class Settings(BaseSettings):
     description_model: str = "google/flan-t5-base"
     ner_model: str = "dslim/bert-base-NER"
     sentence_transformer_model: str = "sentence-transformers/all-MiniLM-L6-v2"
+    enable_hf_fallback: bool = True  # False skips loading the T5 models (pure-Azure deployments)
+    hf_load_in_8bit: bool = False  # int8 T5 weights (bitsandbytes on GPU, dynamic quantization on CPU)
+    onnx_export_path: str = "./cache/onnx"  # ONNX Runtime exports of the T5 models, reused across restarts
+
+    # Generated alias/description cache (SQLite file, survives restarts);
+    # relative cache paths resolve against the backend directory
+    metadata_cache_path: str = "./cache/metadata_cache.db"
+    # Individual GPT-5 replies (SQLite WAL file, shared by worker processes)
+    llm_cache_path: str = "./cache/llm_cache.db"
+    llm_cache_ttl_days: float = 30.0  # Replies older than this are regenerated (0 keeps them forever)
+
+    # Skip the LLM for columns tagged latitude/longitude/country/city/province/district
+    prefer_rules_for_known_tags: bool = True
+
+    # Tables wider than this use the Azure OpenAI Batch API in "auto" generation mode
+    batch_min_columns: int = 50
 
     # Azure OpenAI Configuration
     azure_openai_api_key: str = ""
     azure_openai_endpoint: str = ""
     azure_openai_deployment: str = "gpt-5"
     azure_openai_api_version: str = "2024-12-01-preview"
+    azure_openai_max_retries: int = 6  # Retries for transient GPT-5 errors (rate limits, 5xx, timeouts)
+    azure_openai_timeout_seconds: float = 60.0  # Read timeout per request
+    azure_openai_max_connections: int = 50  # HTTP connection pool size per Azure OpenAI client
+    azure_openai_max_keepalive_connections: int = 25
+    azure_openai_fast_deployment: str = ""  # Deployment for description calls (e.g. gpt-5-nano); empty sends every description to azure_openai_deployment with its defaults
+    azure_openai_fast_reasoning_effort: str = "minimal"  # Sent only to the fast deployment; empty for non-reasoning deployments
 
     # OpenAI Configuration (for embeddings - uses Azure OpenAI)
     openai_embedding_model: str = "text-embedding-3-small"  # Deployment name in Azure
@@ -56,21 +84,33 @@ class Settings(BaseSettings):
 
     # Session Configuration
     session_secret_key: str
+    auth_cache_ttl_seconds: float = 60.0  # Reuse successful logins for this long (0 disables)
 
     # API Configuration
     api_host: str = "0.0.0.0"
     api_port: int = 8000
     cors_origins: List[str] = ["http://localhost:3000"]
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
-        extra = "ignore"
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=False,
+        extra="ignore",
+    )
 
 
 # Global settings instance
 settings = Settings()
 
+# backend/ (parent of the app package)
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def resolve_backend_path(path: str) -> str:
+    """Resolve a relative settings path against the backend directory"""
+    if os.path.isabs(path):
+        return path
+    return os.path.normpath(os.path.join(BACKEND_DIR, path))
+
 
 def get_schema_file_path(table_name: str) -> str:
     """Get the full path to a schema DDL file"""
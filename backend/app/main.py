@@ -4,12 +4,14 @@ FastAPI application entry point
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 
 from app.api import admin, auth, metadata, tables, search
 from app.api.relationships_api import router as relationships_router
 from app.api.enriched_tables_api import router as enriched_tables_router
 from app.config import settings
 from app.middleware.auth_middleware import AuthMiddleware
+from app.services.auth_service import auth_service
 from app.utils.logger import app_logger as logger
 
 # Create FastAPI app
@@ -30,6 +32,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 app.add_middleware(AuthMiddleware)
+# Compress large JSON payloads (e.g. /api/table-data samples). Added after
+# AuthMiddleware so it wraps it and 401 responses go through it as well.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=4)
 # Include routers
 app.include_router(auth.router)
 app.include_router(tables.router)
@@ -51,11 +56,15 @@ async def startup_event():
     logger.info(f"DynamoDB Region: {settings.aws_region}")
     logger.info("=" * 60)
 
+    # Prime the pooled auth connection so the first login skips the TLS handshake
+    await auth_service.warm_up()
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Run on application shutdown"""
     logger.info("Shutting down Metadata Explorer API")
+    await auth_service.aclose()
 
 
 @app.get("/")
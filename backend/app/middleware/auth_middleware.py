@@ -3,6 +3,8 @@ Authentication Middleware
 Validates bearer tokens and injects user credentials into requests
 """
 
+import re
+
 from fastapi import HTTPException, Request
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -15,15 +17,24 @@ class AuthMiddleware(BaseHTTPMiddleware):
     """Middleware to validate authentication on protected routes"""
 
     # Routes that don't require authentication
-    PUBLIC_ROUTES = [
-        "/",
-        "/health",
-        "/docs",
-        "/redoc",
-        "/openapi.json",
-        "/api/auth/login",
-        "/api/auth/logout",
-    ]
+    PUBLIC_ROUTES = frozenset(
+        [
+            "/",
+            "/health",
+            "/docs",
+            "/redoc",
+            "/openapi.json",
+            "/api/auth/login",
+            "/api/auth/logout",
+        ]
+    )
+
+    # Public path prefixes (static docs assets, relationship endpoints),
+    # compiled into one alternation so matching is a single regex call
+    PUBLIC_PREFIXES = ["/docs", "/redoc", "/openapi.json", "/api/relationships"]
+    _PUBLIC_PREFIX_RE = re.compile(
+        r"^(?:" + "|".join(map(re.escape, PUBLIC_PREFIXES)) + r")(?:/|$)"
+    )
 
     async def dispatch(self, request: Request, call_next):
         """
@@ -86,14 +97,8 @@ class AuthMiddleware(BaseHTTPMiddleware):
         Returns:
             True if public, False if protected
         """
-        # Exact match
-        if path in self.PUBLIC_ROUTES:
-            return True
-
-        # Prefix match for static files, docs, etc.
-        public_prefixes = ["/docs", "/redoc", "/openapi.json", "/api/relationships"]
-        for prefix in public_prefixes:
-            if path.startswith(prefix):
-                return True
-
-        return False
+        # Exact match, then prefix match for static files, docs, etc.
+        return (
+            path in self.PUBLIC_ROUTES
+            or self._PUBLIC_PREFIX_RE.match(path) is not None
+        )
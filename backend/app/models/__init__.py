@@ -7,14 +7,22 @@ from app.models.table import (
     TableWithColumns,
     SchemaStatus,
     SchemaChange,
+    TypeChange,
     EnrichmentStatus,
     RelationshipDetectionStatus,
     NeptuneImportStatus,
+    SchemaStatusT,
+    EnrichmentStatusT,
+    RelationshipDetectionStatusT,
+    NeptuneImportStatusT,
+    UtcDatetime,
+    get_list_adapter,
 )
 from app.models.column import (
     ColumnMetadata,
     ColumnMetadataCreate,
-    ColumnMetadataUpdate
+    ColumnMetadataUpdate,
+    TableColumnMetadata,
 )
 from app.models.api import (
     TablesResponse,
@@ -40,13 +48,21 @@ __all__ = [
     "TableWithColumns",
     "SchemaStatus",
     "SchemaChange",
+    "TypeChange",
     "EnrichmentStatus",
     "RelationshipDetectionStatus",
     "NeptuneImportStatus",
+    "SchemaStatusT",
+    "EnrichmentStatusT",
+    "RelationshipDetectionStatusT",
+    "NeptuneImportStatusT",
+    "UtcDatetime",
+    "get_list_adapter",
     # Column models
     "ColumnMetadata",
     "ColumnMetadataCreate",
     "ColumnMetadataUpdate",
+    "TableColumnMetadata",
     # API models
     "TablesResponse",
     "TableDataResponse",
@@ -1,7 +1,7 @@
 """
 API request and response models
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Any
 from app.models.table import TableSummary
 
@@ -11,8 +11,8 @@ class TablesResponse(BaseModel):
     tables: List[TableSummary]
     total_count: int
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "tables": [
                     {
@@ -25,6 +25,7 @@ class TablesResponse(BaseModel):
                 "total_count": 232
             }
         }
+    )
 
 
 class TableDataResponse(BaseModel):
@@ -34,8 +35,9 @@ class TableDataResponse(BaseModel):
     data: List[List[Any]]
     row_count: int
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True,
+        json_schema_extra={
             "example": {
                 "table_name": "navigable_road_attributes_2024",
                 "columns": ["road_id", "road_name", "country"],
@@ -46,6 +48,7 @@ class TableDataResponse(BaseModel):
                 "row_count": 2
             }
         }
+    )
 
 
 class GenerateMetadataRequest(BaseModel):
@@ -53,13 +56,14 @@ class GenerateMetadataRequest(BaseModel):
     table_name: Optional[str] = None
     force_refresh: bool = False
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "table_name": "navigable_road_attributes_2024",
                 "force_refresh": False
             }
         }
+    )
 
 
 class GenerateMetadataResponse(BaseModel):
@@ -69,8 +73,8 @@ class GenerateMetadataResponse(BaseModel):
     task_id: Optional[str] = None
     tables_to_process: Optional[int] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "status": "started",
                 "message": "Metadata generation started for 232 tables",
@@ -78,6 +82,7 @@ class GenerateMetadataResponse(BaseModel):
                 "tables_to_process": 232
             }
         }
+    )
 
 
 class RefreshMetadataResponse(BaseModel):
@@ -86,26 +91,28 @@ class RefreshMetadataResponse(BaseModel):
     table_name: str
     message: str
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "status": "success",
                 "table_name": "navigable_road_attributes_2024",
                 "message": "Metadata refreshed successfully"
             }
         }
+    )
 
 
 class UpdateAliasRequest(BaseModel):
     """Request for PATCH /api/column/{table_name}/{column_name}/alias"""
     aliases: List[str] = Field(..., min_length=1)
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "aliases": ["Road ID", "Route Identifier", "Street ID"]
             }
         }
+    )
 
 
 class UpdateAliasResponse(BaseModel):
@@ -115,8 +122,8 @@ class UpdateAliasResponse(BaseModel):
     column_name: str
     aliases: List[str]
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "status": "success",
                 "table_name": "navigable_road_attributes_2024",
@@ -124,6 +131,7 @@ class UpdateAliasResponse(BaseModel):
                 "aliases": ["Road ID", "Route Identifier", "Street ID"]
             }
         }
+    )
 
 
 class ErrorResponse(BaseModel):
@@ -131,13 +139,14 @@ class ErrorResponse(BaseModel):
     error: str
     detail: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "error": "Table not found",
                 "detail": "Table 'invalid_table' does not exist"
             }
         }
+    )
 
 
 class UpdateColumnMetadataRequest(BaseModel):
@@ -147,8 +156,8 @@ class UpdateColumnMetadataRequest(BaseModel):
     column_type: Optional[str] = None
     semantic_type: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "aliases": ["Road ID", "Route Identifier"],
                 "description": "Unique identifier for each road segment",
@@ -156,6 +165,7 @@ class UpdateColumnMetadataRequest(BaseModel):
                 "semantic_type": None
             }
         }
+    )
 
 
 class UpdateColumnMetadataResponse(BaseModel):
@@ -165,8 +175,8 @@ class UpdateColumnMetadataResponse(BaseModel):
     column_name: str
     updated_fields: List[str]
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "status": "success",
                 "catalog_table": "explorer_datasets.navigable_road_attributes_2024",
@@ -174,6 +184,7 @@ class UpdateColumnMetadataResponse(BaseModel):
                 "updated_fields": ["aliases", "description"]
             }
         }
+    )
 
 
 class UpdateTableConfigRequest(BaseModel):
@@ -181,13 +192,14 @@ class UpdateTableConfigRequest(BaseModel):
     search_mode: Optional[str] = Field(None, description="Search mode: 'analytics', 'datamining', or None")
     custom_instructions: Optional[str] = Field(None, description="Custom SQL examples and LLM usage hints")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "search_mode": "analytics",
                 "custom_instructions": "Use this table for POI analysis. Always join with location_dim on location_id."
             }
         }
+    )
 
 
 class UpdateTableConfigResponse(BaseModel):
@@ -196,14 +208,15 @@ class UpdateTableConfigResponse(BaseModel):
     catalog_schema_table: str
     updated_fields: List[str]
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "status": "success",
                 "catalog_schema_table": "here_explorer.explorer_datasets.navigable_road_attributes_2024",
                 "updated_fields": ["search_mode", "custom_instructions"]
             }
         }
+    )
 
 
 class CatalogsResponse(BaseModel):
@@ -211,13 +224,14 @@ class CatalogsResponse(BaseModel):
     catalogs: List[str]
     total_count: int
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "catalogs": ["explorer_datasets", "analytics", "raw_data"],
                 "total_count": 3
             }
         }
+    )
 
 
 class TablesInCatalogResponse(BaseModel):
@@ -227,12 +241,13 @@ class TablesInCatalogResponse(BaseModel):
     tables: List[str]
     total_count: int
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "catalog": "explorer_datasets",
                 "schema": "public",
                 "tables": ["address_range_changes_apac", "navigable_road_attributes"],
                 "total_count": 232
             }
-        }
\ No newline at end of file
+        }
+    )
\ No newline at end of file
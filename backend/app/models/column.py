@@ -1,7 +1,7 @@
 """
 Pydantic models for column metadata
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Any
 from datetime import datetime
 
@@ -23,8 +23,8 @@ class ColumnMetadata(BaseModel):
     null_percentage: float = 0.0
     sample_values: List[Any] = Field(default_factory=list)
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "catalog_schema_table": "here_explorer.explorer_datasets.navigable_road_attributes_2024",
                 "column_name": "road_id",
@@ -42,6 +42,23 @@ class ColumnMetadata(BaseModel):
                 "sample_values": [1, 2, 3, 4, 5]
             }
         }
+    )
+
+
+class TableColumnMetadata(BaseModel):
+    """Per-column metadata as nested in TableWithColumns.columns (keyed by column name)"""
+    data_type: str
+    column_type: str
+    semantic_type: Optional[str] = None
+    aliases: List[str] = Field(default_factory=list)
+    description: str = ""
+    min_value: Optional[Any] = None
+    max_value: Optional[Any] = None
+    avg_value: Optional[float] = None
+    cardinality: int = 0
+    null_count: int = 0
+    null_percentage: float = 0.0
+    sample_values: List[Any] = Field(default_factory=list)
 
 
 class ColumnMetadataCreate(BaseModel):
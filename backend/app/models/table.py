@@ -1,68 +1,134 @@
 """
 Pydantic models for table metadata
+
+Models here set defer_build=True: their validators/serializers are built on
+first use instead of at import, which keeps app and worker start-up cheap.
 """
-from pydantic import BaseModel, Field
-from typing import Dict, Optional, List
-from datetime import datetime
-from enum import Enum
+from pydantic import AwareDatetime, BaseModel, BeforeValidator, ConfigDict, Field, TypeAdapter
+from typing import Annotated, Any, Dict, Final, Literal, Optional, List, Type
+from typing_extensions import TypedDict
+from datetime import datetime, timezone
+from functools import lru_cache
+
+from app.models.column import TableColumnMetadata
+
+
+class SchemaStatus:
+    """Schema status values"""
+    CURRENT: Final = "CURRENT"
+    SCHEMA_CHANGED: Final = "SCHEMA_CHANGED"
+
+
+class RelationshipDetectionStatus:
+    """Relationship detection status values"""
+    NOT_STARTED: Final = "not_started"
+    IN_PROGRESS: Final = "in_progress"
+    COMPLETED: Final = "completed"
+    FAILED: Final = "failed"
+
+
+class EnrichmentStatus:
+    """Enrichment (table+column metadata generation) status values"""
+    NOT_STARTED: Final = "not_started"
+    IN_PROGRESS: Final = "in_progress"
+    COMPLETED: Final = "completed"
+    FAILED: Final = "failed"
+
+
+class NeptuneImportStatus:
+    """Neptune Analytics import status values"""
+    NOT_IMPORTED: Final = "not_imported"
+    IMPORTING: Final = "importing"
+    IMPORTED: Final = "imported"
+    FAILED: Final = "failed"
 
 
-class SchemaStatus(str, Enum):
-    """Schema status enum"""
-    CURRENT = "CURRENT"
-    SCHEMA_CHANGED = "SCHEMA_CHANGED"
+# Literal string types used for model fields and status parameters. The
+# classes above are plain string-constant namespaces (no Enum machinery), so
+# e.g. EnrichmentStatus.COMPLETED is just "completed".
+SchemaStatusT = Literal["CURRENT", "SCHEMA_CHANGED"]
+RelationshipDetectionStatusT = Literal["not_started", "in_progress", "completed", "failed"]
+EnrichmentStatusT = Literal["not_started", "in_progress", "completed", "failed"]
+NeptuneImportStatusT = Literal["not_imported", "importing", "imported", "failed"]
 
 
-class RelationshipDetectionStatus(str, Enum):
-    """Relationship detection status enum"""
-    NOT_STARTED = "not_started"
-    IN_PROGRESS = "in_progress"
-    COMPLETED = "completed"
-    FAILED = "failed"
+def _as_utc_datetime(value: Any) -> Any:
+    """
+    Normalize timestamp input ahead of AwareDatetime validation
 
+    Epoch numbers are converted directly (no string parsing) and ISO strings
+    go through datetime.fromisoformat. Naive values are rows written before
+    timestamps were stored as UTC, with datetime.now() - i.e. the server's
+    local time - so they are interpreted in the local zone and converted.
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return datetime.fromtimestamp(value, tz=timezone.utc)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if isinstance(value, datetime) and value.tzinfo is None:
+        return value.astimezone(timezone.utc)
+    return value
 
-class EnrichmentStatus(str, Enum):
-    """Enrichment (table+column metadata generation) status enum"""
-    NOT_STARTED = "not_started"
-    IN_PROGRESS = "in_progress"
-    COMPLETED = "completed"
-    FAILED = "failed"
 
+# Timezone-aware timestamp used for all model datetime fields
+UtcDatetime = Annotated[AwareDatetime, BeforeValidator(_as_utc_datetime)]
 
-class NeptuneImportStatus(str, Enum):
-    """Neptune Analytics import status enum"""
-    NOT_IMPORTED = "not_imported"
-    IMPORTING = "importing"
-    IMPORTED = "imported"
-    FAILED = "failed"
+
+# TableMetadata fields stored as ISO strings in DynamoDB
+_TIMESTAMP_FIELDS = (
+    "last_updated",
+    "schema_change_detected_at",
+    "enrichment_timestamp",
+    "relationship_timestamp",
+    "neptune_import_timestamp",
+)
+
+
+class TypeChange(TypedDict):
+    """A column whose data type changed between stored and current schema"""
+    column: str
+    old_type: str
+    new_type: str
 
 
 class SchemaChange(BaseModel):
-    """Schema change details"""
+    """Schema change details (immutable value object)"""
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
     new_columns: List[str] = Field(default_factory=list)
     removed_columns: List[str] = Field(default_factory=list)
-    type_changes: List[Dict[str, str]] = Field(default_factory=list)
+    type_changes: List[TypeChange] = Field(default_factory=list)
 
 
-class TableMetadata(BaseModel):
-    """Table metadata model"""
+class _TableCore(BaseModel):
+    """Fields shared by the table metadata models"""
+    model_config = ConfigDict(defer_build=True)
+
     catalog_schema_table: str  # CHANGED: now catalog.schema.table
-    last_updated: datetime
+    last_updated: UtcDatetime
     row_count: int = 0
     column_count: int = 0
-    schema_status: SchemaStatus = SchemaStatus.CURRENT
-    schema_change_detected_at: Optional[datetime] = None
-    schema_changes: Optional[SchemaChange] = None
+    schema_status: SchemaStatusT = "CURRENT"
 
     # Operation status tracking
-    enrichment_status: EnrichmentStatus = EnrichmentStatus.NOT_STARTED
-    relationship_detection_status: RelationshipDetectionStatus = RelationshipDetectionStatus.NOT_STARTED
-    neptune_import_status: NeptuneImportStatus = NeptuneImportStatus.NOT_IMPORTED
+    enrichment_status: EnrichmentStatusT = "not_started"
+    relationship_detection_status: RelationshipDetectionStatusT = "not_started"
+    neptune_import_status: NeptuneImportStatusT = "not_imported"
+
+    # Search configuration
+    search_mode: Optional[str] = None  # "analytics", "datamining", or None (user-defined tag)
+    custom_instructions: Optional[str] = None  # SQL examples and LLM usage hints
+
+
+class TableMetadata(_TableCore):
+    """Table metadata model"""
+    schema_change_detected_at: Optional[UtcDatetime] = None
+    schema_changes: Optional[SchemaChange] = None
 
     # Operation timestamps
-    enrichment_timestamp: Optional[datetime] = None
-    relationship_timestamp: Optional[datetime] = None
-    neptune_import_timestamp: Optional[datetime] = None
+    enrichment_timestamp: Optional[UtcDatetime] = None
+    relationship_timestamp: Optional[UtcDatetime] = None
+    neptune_import_timestamp: Optional[UtcDatetime] = None
 
     # Retry counts (for worker script)
     enrichment_retry_count: int = 0
@@ -74,12 +140,40 @@ class TableMetadata(BaseModel):
     relationship_error: Optional[str] = None
     neptune_import_error: Optional[str] = None
 
-    # Search configuration
-    search_mode: Optional[str] = None  # "analytics", "datamining", or None (user-defined tag)
-    custom_instructions: Optional[str] = None  # SQL examples and LLM usage hints
-    
-    class Config:
-        json_schema_extra = {
+    @classmethod
+    def from_trusted_dynamo(cls, raw: Dict[str, Any]) -> "TableMetadata":
+        """
+        Build from a DynamoDB item written by this service, skipping validation
+
+        Timestamp strings are parsed once here; all other values are taken as
+        stored. Use model_validate for untrusted input such as API payloads.
+
+        Args:
+            raw: DynamoDB item with Decimals already converted to Python numbers
+
+        Returns:
+            TableMetadata instance
+        """
+        # Fill in declaration order so dumps match validated instances
+        data: Dict[str, Any] = {}
+        for field_name, field in cls.model_fields.items():
+            if field_name in raw:
+                data[field_name] = raw[field_name]
+            elif not field.is_required():
+                data[field_name] = field.get_default(call_default_factory=True)
+
+        for field_name in _TIMESTAMP_FIELDS:
+            if data.get(field_name) is not None:
+                data[field_name] = _as_utc_datetime(data[field_name])
+        if data.get("schema_changes") is not None:
+            data["schema_changes"] = SchemaChange.model_construct(**data["schema_changes"])
+
+        return cls.model_construct(_fields_set=raw.keys() & cls.model_fields.keys(), **data)
+
+    # Mutable: workers update status fields in place, without re-validating each write
+    model_config = ConfigDict(
+        validate_assignment=False,
+        json_schema_extra={
             "example": {
                 "catalog_schema_table": "here_explorer.explorer_datasets.navigable_road_attributes_2024",
                 "last_updated": "2025-10-29T10:30:00Z",
@@ -90,27 +184,21 @@ class TableMetadata(BaseModel):
                 "schema_changes": None
             }
         }
+    )
 
 
-class TableSummary(BaseModel):
+class TableSummary(_TableCore):
     """Summary information about a table"""
     name: str  # Just the table name for display
-    catalog_schema_table: str  # Full catalog.schema.table identifier
-    schema_status: SchemaStatus
-    last_updated: datetime
-    row_count: int
-    column_count: int = 0
-    enrichment_status: EnrichmentStatus = EnrichmentStatus.NOT_STARTED
-    relationship_detection_status: RelationshipDetectionStatus = RelationshipDetectionStatus.NOT_STARTED
-    neptune_import_status: NeptuneImportStatus = NeptuneImportStatus.NOT_IMPORTED
-    neptune_last_imported: Optional[datetime] = None
-    relationships_status: Optional[RelationshipDetectionStatus] = None
+    row_count: int  # Required (no default) for summaries
+    schema_status: SchemaStatusT
+    neptune_last_imported: Optional[UtcDatetime] = None
+    relationships_status: Optional[RelationshipDetectionStatusT] = None
     relationships_count: int = 0
-    search_mode: Optional[str] = None
-    custom_instructions: Optional[str] = None
-    
-    class Config:
-        json_schema_extra = {
+
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "name": "navigable_road_attributes_2024",
                 "catalog_schema_table": "here_explorer.explorer_datasets.navigable_road_attributes_2024",
@@ -120,25 +208,18 @@ class TableSummary(BaseModel):
                 "column_count": 25
             }
         }
+    )
 
 
-class TableWithColumns(BaseModel):
+class TableWithColumns(_TableCore):
     """Complete table metadata with all column metadata"""
-    catalog_schema_table: str  # CHANGED
-    last_updated: datetime
-    row_count: int
-    column_count: int = 0
-    schema_status: SchemaStatus
+    row_count: int  # Required (no default) for full table views
+    schema_status: SchemaStatusT
     schema_changes: Optional[SchemaChange] = None
-    enrichment_status: EnrichmentStatus = EnrichmentStatus.NOT_STARTED
-    relationship_detection_status: RelationshipDetectionStatus = RelationshipDetectionStatus.NOT_STARTED
-    neptune_import_status: NeptuneImportStatus = NeptuneImportStatus.NOT_IMPORTED
-    search_mode: Optional[str] = None
-    custom_instructions: Optional[str] = None
-    columns: Dict[str, dict]  # column_name -> column metadata dict
-    
-    class Config:
-        json_schema_extra = {
+    columns: Dict[str, TableColumnMetadata]  # column_name -> column metadata
+
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "catalog_schema_table": "here_explorer.explorer_datasets.navigable_road_attributes_2024",
                 "last_updated": "2025-10-29T10:30:00Z",
@@ -158,4 +239,17 @@ class TableWithColumns(BaseModel):
                     }
                 }
             }
-        }
\ No newline at end of file
+        }
+    )
+
+
+@lru_cache(maxsize=None)
+def get_list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """
+    Get the shared TypeAdapter for List[model]
+
+    Built on first request and reused, so bulk validation/serialization of
+    list payloads doesn't rebuild a validator per call.
+    """
+    return TypeAdapter(List[model])
+
@@ -1,15 +1,38 @@
 """
 Services package exports
+
+Service singletons are imported lazily on first attribute access (PEP 562),
+so `from app.services import starburst_service` only loads starburst.py and
+its dependencies.
 """
-from app.services.starburst import starburst_service
-from app.services.dynamodb import dynamodb_service
-from app.services.geographic_detector import geographic_detector
-from app.services.latlon_detector import latlon_detector
-from app.services.alias_generator import alias_generator
-from app.services.schema_comparator import schema_comparator
-from app.services.metadata_generator import metadata_generator
-from app.services.neptune_service import neptune_service
-from app.services.embedding_service import embedding_service
+import importlib
+import sys
+import types
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.services.starburst import starburst_service
+    from app.services.dynamodb import dynamodb_service
+    from app.services.geographic_detector import geographic_detector
+    from app.services.latlon_detector import latlon_detector
+    from app.services.alias_generator import alias_generator
+    from app.services.schema_comparator import schema_comparator
+    from app.services.metadata_generator import metadata_generator
+    from app.services.neptune_service import neptune_service
+    from app.services.embedding_service import embedding_service
+
+# Exported name -> module that defines it
+_SERVICE_MODULES = {
+    "starburst_service": "app.services.starburst",
+    "dynamodb_service": "app.services.dynamodb",
+    "geographic_detector": "app.services.geographic_detector",
+    "latlon_detector": "app.services.latlon_detector",
+    "alias_generator": "app.services.alias_generator",
+    "schema_comparator": "app.services.schema_comparator",
+    "metadata_generator": "app.services.metadata_generator",
+    "neptune_service": "app.services.neptune_service",
+    "embedding_service": "app.services.embedding_service",
+}
 
 __all__ = [
     "starburst_service",
@@ -21,4 +44,37 @@ __all__ = [
     "metadata_generator",
     "neptune_service",
     "embedding_service",
-]
\ No newline at end of file
+]
+
+
+class _ServicesModule(types.ModuleType):
+    """
+    Package module type that keeps exported names bound to the singletons
+
+    Importing a submodule binds it on the package under its module name. Where
+    that name is also the exported singleton (alias_generator,
+    schema_comparator, ...), bind the singleton instead so the export doesn't
+    turn into the module depending on import order.
+    """
+
+    def __setattr__(self, name, value):
+        if isinstance(value, types.ModuleType) and _SERVICE_MODULES.get(name) == value.__name__:
+            value = getattr(value, name, value)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _ServicesModule
+
+
+def __getattr__(name: str):
+    module_name = _SERVICE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return __all__
@@ -0,0 +1,423 @@
+"""
+Python <-> DynamoDB value conversion
+
+Kept free of service imports so it can be compiled in place for speed:
+
+    cythonize -i app/services/_dynamodb_convert.py
+
+The resulting extension module takes precedence over this file on import
+(Cython pure-Python mode, no code changes needed); without it the plain
+Python module is used unchanged.
+
+_convert_floats_to_decimal / _convert_decimals_to_python work with the
+boto3 Resource layer (Decimal numbers), and _convert_decimals_in_place
+converts its fresh responses without copying; _to_attribute_values emits the
+low-level client's {"S": ...}/{"N": ...} form directly, and
+_from_attribute_values reads that form straight into Python numbers.
+"""
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
+from math import isfinite
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from boto3.dynamodb.types import TypeDeserializer
+
+
+# Float lists at least this long are converted with NumPy; below it the
+# per-element walk is cheaper than building the array
+FLOAT_VECTORIZE_MIN_LENGTH = 32
+
+# Distinct float values whose Decimal conversion is memoized
+FLOAT_DECIMAL_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=FLOAT_DECIMAL_CACHE_SIZE)
+def _cached_float_to_decimal(value: float) -> Decimal:
+    """
+    Decimal for a finite non-zero float, memoized
+
+    Counts, null percentages and numeric bounds repeat heavily across a
+    table's columns; Decimal is immutable, so cached instances are shared.
+    """
+    return Decimal(str(value))
+
+
+def _finite_float_to_decimal(value: float) -> Decimal:
+    """Decimal for a finite float, identical to Decimal(str(value))"""
+    if value == 0:
+        # 0.0 and -0.0 are one lru_cache key but different Decimals
+        return Decimal(str(value))
+    return _cached_float_to_decimal(value)
+
+
+def _float_to_decimal(obj):
+    """float (and np.float64) -> Decimal; NaN/inf -> None"""
+    if not isfinite(obj):
+        return None
+    return _finite_float_to_decimal(obj)
+
+
+def _np_float_to_decimal(obj):
+    """Other numpy floats -> Decimal via float; NaN/inf -> None"""
+    value = float(obj)
+    if not isfinite(value):
+        return None
+    return _finite_float_to_decimal(value)
+
+
+def _floats_to_decimals(values: np.ndarray) -> list:
+    """
+    1-D float array -> list of Decimal in one vectorized pass; NaN/inf -> None
+
+    Widening to float64 first makes astype(str) produce the same shortest
+    repr as str(float(x)), so results match _np_float_to_decimal exactly.
+    """
+    values = values.astype(np.float64, copy=False)
+    strings = values.astype(str).tolist()
+    finite = np.isfinite(values)
+    if finite.all():
+        return list(map(Decimal, strings))
+    return [Decimal(s) if ok else None for s, ok in zip(strings, finite.tolist())]
+
+
+def _ndarray_to_dynamodb(obj: np.ndarray):
+    """Numeric 1-D arrays -> list of Decimal/int/bool; other arrays unchanged"""
+    if obj.ndim != 1:
+        return obj
+    kind = obj.dtype.kind
+    if kind == 'f':
+        return _floats_to_decimals(obj)
+    if kind in 'iub':
+        return obj.tolist()
+    return obj
+
+
+def _float_list_to_decimal(values: list) -> Optional[list]:
+    """
+    Vectorized conversion of a long list of plain floats (e.g. sample_values)
+
+    Returns None when the list is short or mixed, so the caller walks it
+    element by element instead.
+    """
+    if (
+        len(values) < FLOAT_VECTORIZE_MIN_LENGTH
+        or type(values[0]) is not float
+        or not all(type(v) is float for v in values)
+    ):
+        return None
+    return _floats_to_decimals(np.array(values, dtype=np.float64))
+
+
+def _isoformat(obj):
+    return obj.isoformat()
+
+
+def _decimal_to_number(obj: Decimal):
+    """Decimal -> int when integral, else float"""
+    # to_integral_value() measured faster than both `obj % 1 == 0` and
+    # as_tuple().exponent (which builds the digit tuple), and unlike the
+    # exponent test it still maps e.g. Decimal("1.0") to int
+    if obj == obj.to_integral_value():
+        return int(obj)
+    return float(obj)
+
+
+# Leaf converters keyed on exact type (one dict lookup per value); subclasses
+# fall back to the isinstance checks in _to_dynamodb_fallback
+_TO_DYNAMODB_CONVERTERS = {
+    float: _float_to_decimal,
+    np.float64: _float_to_decimal,
+    np.float32: _np_float_to_decimal,
+    np.float16: _np_float_to_decimal,
+    np.int64: int,
+    np.int32: int,
+    np.int16: int,
+    np.int8: int,
+    np.uint64: int,
+    np.uint32: int,
+    np.uint16: int,
+    np.uint8: int,
+    np.bool_: bool,
+    np.str_: str,
+    pd.Timestamp: _isoformat,
+    datetime: _isoformat,
+    date: _isoformat,
+    np.ndarray: _ndarray_to_dynamodb,
+}
+
+_FROM_DYNAMODB_CONVERTERS = {
+    Decimal: _decimal_to_number,
+}
+
+# Leaf types each conversion returns untouched (checked before the converters)
+_TO_DYNAMODB_PASSTHROUGH = frozenset({type(None), str, int, bool, Decimal})
+_FROM_DYNAMODB_PASSTHROUGH = frozenset({type(None), str, int, bool, float})
+
+# Containers rebuilt by each conversion (exact type -> container kind)
+_TO_DYNAMODB_CONTAINERS = {dict: dict, list: list, tuple: tuple}
+_FROM_DYNAMODB_CONTAINERS = {dict: dict, list: list}
+
+
+def _to_dynamodb_fallback(obj):
+    """isinstance-based conversion for values whose exact type isn't in _TO_DYNAMODB_CONVERTERS"""
+    # numpy scalars: one isinstance against the scalar root, then the dtype kind
+    if isinstance(obj, np.generic):
+        kind = obj.dtype.kind
+        if kind == 'f':
+            return _np_float_to_decimal(obj)
+        if kind in 'iu':
+            return int(obj)
+        if kind == 'b':
+            return bool(obj)
+        if kind == 'U':
+            return str(obj)
+        return obj
+
+    if isinstance(obj, float):
+        return _float_to_decimal(obj)
+
+    # Handle datetime types
+    if isinstance(obj, (pd.Timestamp, datetime, date)):
+        return obj.isoformat()
+
+    if isinstance(obj, bool):
+        return bool(obj)
+    if isinstance(obj, str):
+        return str(obj)
+
+    # Return as-is for other types
+    return obj
+
+
+def _from_dynamodb_fallback(obj):
+    """isinstance-based conversion for values whose exact type isn't in _FROM_DYNAMODB_CONVERTERS"""
+    if isinstance(obj, Decimal):
+        return _decimal_to_number(obj)
+    return obj
+
+
+def _container_kind(value, containers):
+    """Container kind of value from containers, or None for a leaf"""
+    kind = containers.get(type(value))
+    if kind is None:
+        kind = next((c for c in containers if isinstance(value, c)), None)
+    return kind
+
+
+def _convert_tree(obj, passthrough, converters, fallback, containers, list_fast_path=None):
+    """
+    Rebuild nested containers with every leaf converted
+
+    Walks the structure with an explicit stack of containers instead of
+    recursion. Leaves whose exact type is in passthrough are kept as-is;
+    others are converted by exact-type lookup in converters (fallback
+    otherwise); values whose kind is in containers are rebuilt as
+    that plain type (dict/list/tuple), anything else is a leaf. When given,
+    list_fast_path is tried on each list first and its result used unless
+    it returns None.
+    """
+    obj_type = type(obj)
+    if obj_type in passthrough:
+        return obj
+    convert = converters.get(obj_type)
+    if convert is not None:
+        return convert(obj)
+    kind = _container_kind(obj, containers)
+    if kind is None:
+        return fallback(obj)
+
+    root = [None]
+    stack = [(obj, kind, root, 0)]
+    tuple_slots = []  # (parent, key) slots holding lists to turn into tuples
+
+    while stack:
+        value, kind, parent, key = stack.pop()
+        if kind is dict:
+            out = {}
+            items = value.items()
+        elif kind is list and list_fast_path is not None and value:
+            out = list_fast_path(value)
+            if out is not None:
+                parent[key] = out
+                continue
+            out = [None] * len(value)
+            items = enumerate(value)
+        else:
+            out = [None] * len(value)
+            items = enumerate(value)
+            if kind is tuple:
+                tuple_slots.append((parent, key))
+        parent[key] = out
+
+        for child_key, child in items:
+            child_type = type(child)
+            if child_type in passthrough:
+                out[child_key] = child
+                continue
+            convert = converters.get(child_type)
+            if convert is not None:
+                out[child_key] = convert(child)
+                continue
+            child_kind = _container_kind(child, containers)
+            if child_kind is None:
+                out[child_key] = fallback(child)
+            else:
+                out[child_key] = None  # placeholder keeps dict key order
+                stack.append((child, child_kind, out, child_key))
+
+    # Innermost tuples were recorded last; freeze them first
+    for parent, key in reversed(tuple_slots):
+        parent[key] = tuple(parent[key])
+
+    return root[0]
+
+
+def _convert_floats_to_decimal(obj):
+    """
+    Convert Python types to DynamoDB-compatible types
+    - float -> Decimal
+    - Timestamp/datetime/date -> ISO string
+    - NaN/None -> None
+    - numpy types and 1-D numeric arrays -> Python types
+    """
+    return _convert_tree(
+        obj,
+        _TO_DYNAMODB_PASSTHROUGH,
+        _TO_DYNAMODB_CONVERTERS,
+        _to_dynamodb_fallback,
+        _TO_DYNAMODB_CONTAINERS,
+        list_fast_path=_float_list_to_decimal,
+    )
+
+
+def _convert_decimals_to_python(obj):
+    """Convert Decimal objects back to Python int/float"""
+    return _convert_tree(
+        obj,
+        _FROM_DYNAMODB_PASSTHROUGH,
+        _FROM_DYNAMODB_CONVERTERS,
+        _from_dynamodb_fallback,
+        _FROM_DYNAMODB_CONTAINERS,
+    )
+
+
+def _convert_decimals_in_place(obj):
+    """
+    _convert_decimals_to_python for a freshly deserialized response
+
+    Overwrites Decimals inside the response's own dicts and lists instead of
+    rebuilding them, so nothing is allocated beyond the converted numbers.
+    Only for trees nothing else references: the Resource layer's output is
+    exact dict/list/Decimal, so exact-type checks cover it. Any other root
+    goes through the copying converter.
+    """
+    kind = type(obj)
+    if kind is Decimal:
+        return _decimal_to_number(obj)
+    if kind is not dict and kind is not list:
+        return _convert_decimals_to_python(obj)
+
+    stack = [obj]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        container = pop()
+        items = container.items() if type(container) is dict else enumerate(container)
+        # Assigning to existing keys doesn't resize, so iterating is safe
+        for key, value in items:
+            kind = type(value)
+            if kind is Decimal:
+                container[key] = _decimal_to_number(value)
+            elif kind is dict or kind is list:
+                push(value)
+    return obj
+
+
+def _to_attribute_value(value) -> dict:
+    """
+    Low-level DynamoDB AttributeValue for a Python value
+
+    Floats are written with the same Decimal formatting boto3 would use
+    (NaN/inf -> NULL, as in _convert_floats_to_decimal); other types
+    _to_dynamodb_fallback knows are normalized first.
+    """
+    kind = type(value)
+    if kind is str:
+        return {"S": value}
+    if kind is bool:
+        return {"BOOL": value}
+    if kind is int or kind is Decimal:
+        return {"N": str(value)}
+    if kind is float:
+        if not isfinite(value):
+            return {"NULL": True}
+        return {"N": str(_finite_float_to_decimal(value))}
+    if value is None:
+        return {"NULL": True}
+    if isinstance(value, dict):
+        return {"M": {str(k): _to_attribute_value(v) for k, v in value.items()}}
+    if isinstance(value, (list, tuple)):
+        return {"L": [_to_attribute_value(v) for v in value]}
+
+    converted = _to_dynamodb_fallback(value)
+    if converted is value:
+        raise TypeError(f"Unsupported DynamoDB value type: {kind.__name__}")
+    return _to_attribute_value(converted)
+
+
+def _to_attribute_values(item: dict) -> dict:
+    """Item or ExpressionAttributeValues dict in low-level client form"""
+    return {key: _to_attribute_value(value) for key, value in item.items()}
+
+
+_DESERIALIZER = TypeDeserializer()
+
+
+def _number_from_string(value: str):
+    """
+    Python number for a DynamoDB "N" string
+
+    Same result as Decimal -> _decimal_to_number without building the
+    Decimal in the common cases: plain integer strings go to int, and a
+    string whose float isn't integral can't be an integral Decimal either.
+    Only integral-valued fractions/exponents ("1.0", "1E+2"), which
+    become int, and values past the float range take the Decimal path.
+    """
+    if "." not in value and "e" not in value and "E" not in value:
+        return int(value)
+    number = float(value)
+    if number.is_integer() or not isfinite(number):
+        return _decimal_to_number(Decimal(value))
+    return number
+
+
+def _from_attribute_value(value: dict):
+    """
+    Python value for a low-level DynamoDB AttributeValue
+
+    Numbers come back as int/float directly, matching what
+    _convert_decimals_to_python makes of the Resource layer's Decimals.
+    Sets and binary go through boto3's TypeDeserializer.
+    """
+    (tag, data), = value.items()
+    if tag == "S":
+        return data
+    if tag == "N":
+        return _number_from_string(data)
+    if tag == "M":
+        return {k: _from_attribute_value(v) for k, v in data.items()}
+    if tag == "L":
+        return [_from_attribute_value(v) for v in data]
+    if tag == "BOOL":
+        return data
+    if tag == "NULL":
+        return None
+    return _convert_decimals_in_place(_DESERIALIZER.deserialize(value))
+
+
+def _from_attribute_values(item: dict) -> dict:
+    """Plain Python item for a low-level client item"""
+    return {key: _from_attribute_value(value) for key, value in item.items()}
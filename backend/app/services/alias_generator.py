@@ -1,19 +1,110 @@
 """
 Alias and description generation service using Azure OpenAI (primary) and HuggingFace models (fallback)
 """
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
+import importlib.util
+import json
+import os
 import re
-from app.config import settings
+import tempfile
+import threading
+from types import MappingProxyType
+from app.config import settings, resolve_backend_path
+from app.services.metadata_cache import MetadataCache
 from app.utils.logger import app_logger as logger
 
-# Optional import for HuggingFace transformers (fallback only)
-try:
-    from transformers import T5Tokenizer, T5ForConditionalGeneration
-    TRANSFORMERS_AVAILABLE = True
-except ImportError:
-    TRANSFORMERS_AVAILABLE = False
+# Let the Rust tokenizers parallelize batch encode/decode (must be set before
+# transformers loads; an explicit environment value still wins)
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "true")
+
+# Optional HuggingFace transformers (fallback only). Only probed here; the
+# import itself happens in load_models() so Azure-only processes never pay
+# for loading it.
+TRANSFORMERS_AVAILABLE = importlib.util.find_spec("transformers") is not None
+if not TRANSFORMERS_AVAILABLE:
     logger.warning("transformers library not available - HuggingFace fallback disabled")
 
+# Optional ONNX Runtime T5 inference (faster fallback generation), imported lazily as well
+ONNXRUNTIME_AVAILABLE = (
+    importlib.util.find_spec("onnxruntime") is not None
+    and importlib.util.find_spec("optimum") is not None
+)
+if not ONNXRUNTIME_AVAILABLE:
+    logger.warning("optimum[onnxruntime] not available - HuggingFace fallback will use PyTorch")
+
+# Max prompts per HuggingFace generate() call in the batched fallback
+HF_BATCH_SIZE = 16
+
+# Generated descriptions this short (or empty) are replaced by the next fallback
+MIN_DESCRIPTION_LENGTH = 20
+
+# Tags whose rule/template output is good enough to skip the LLM entirely
+RULE_COVERED_TAGS = frozenset({'latitude', 'longitude', 'country', 'city', 'province', 'district'})
+
+# Concurrent per-column fallback generations (Azure allows ~10 parallel requests)
+FALLBACK_MAX_WORKERS = 10
+
+# Separate pools for the per-column fan-out and the aliases/description pair
+# inside each column, so a saturated column pool can't wait on itself
+_column_executor = ThreadPoolExecutor(max_workers=FALLBACK_MAX_WORKERS, thread_name_prefix="alias-column")
+_pair_executor = ThreadPoolExecutor(max_workers=FALLBACK_MAX_WORKERS, thread_name_prefix="alias-pair")
+
+# Abbreviation expansions for rule-based aliases (lowercase keys, read-only)
+_ABBREVIATIONS = MappingProxyType({
+    'addr': 'Address',
+    'amt': 'Amount',
+    'avg': 'Average',
+    'qty': 'Quantity',
+    'cust': 'Customer',
+    'desc': 'Description',
+    'dept': 'Department',
+    'emp': 'Employee',
+    'lat': 'Latitude',
+    'lon': 'Longitude',
+    'lng': 'Longitude',
+    'max': 'Maximum',
+    'min': 'Minimum',
+    'num': 'Number',
+    'pct': 'Percentage',
+    'std': 'Standard',
+    'temp': 'Temperature',
+    'ts': 'Timestamp',
+    'ttl': 'Total',
+    'cnt': 'Count',
+    'id': 'ID',
+    'cd': 'Code',
+    'dt': 'Date',
+    'tm': 'Time',
+    'val': 'Value',
+    'ref': 'Reference',
+    'seq': 'Sequence',
+    'src': 'Source',
+    'dst': 'Destination',
+    'pos': 'Position',
+    'dir': 'Direction',
+    'dist': 'Distance',
+    'coord': 'Coordinate',
+    'geo': 'Geographic',
+    'usd': 'USD',
+    'eur': 'EUR',
+    'gbp': 'GBP',
+    'pvid': 'ID',
+    'admin': 'Administrative',
+    'km': 'Kilometers',
+    'kms': 'Kilometers',
+    'poi': 'POI',
+    'h24x7': '24/7 Hours'
+})
+
+# Aliases added for administrative level N columns (admin_l1_..., admin_level2_...)
+ADMIN_LEVEL_ALIASES = {
+    '1': ['Province Identifier', 'Level 1 Region ID', 'State Code'],
+    '2': ['Province Name', 'State Name', 'Level 2 Region'],
+    '3': ['City Name', 'Municipality', 'Level 3 Region'],
+    '4': ['District Name', 'Locality', 'Level 4 Region'],
+}
+
 
 class AliasGenerator:
     """Service for generating column aliases and descriptions using Azure OpenAI (GPT-5) and HuggingFace models as fallback"""
@@ -25,6 +116,7 @@ class AliasGenerator:
         self.description_model = None
         self.description_tokenizer = None
         self._models_loaded = False
+        self._load_lock = threading.Lock()
 
         # Initialize Azure OpenAI generator
         self.azure_generator = None
@@ -38,70 +130,76 @@ class AliasGenerator:
         except Exception as e:
             logger.warning(f"Azure OpenAI not available, will use HuggingFace: {e}")
 
-        # Abbreviation dictionary for rule-based expansion
-        self.abbreviations = {
-            'addr': 'Address',
-            'amt': 'Amount',
-            'avg': 'Average',
-            'qty': 'Quantity',
-            'cust': 'Customer',
-            'desc': 'Description',
-            'dept': 'Department',
-            'emp': 'Employee',
-            'lat': 'Latitude',
-            'lon': 'Longitude',
-            'lng': 'Longitude',
-            'max': 'Maximum',
-            'min': 'Minimum',
-            'num': 'Number',
-            'pct': 'Percentage',
-            'std': 'Standard',
-            'temp': 'Temperature',
-            'ts': 'Timestamp',
-            'ttl': 'Total',
-            'cnt': 'Count',
-            'id': 'ID',
-            'cd': 'Code',
-            'dt': 'Date',
-            'tm': 'Time',
-            'val': 'Value',
-            'ref': 'Reference',
-            'seq': 'Sequence',
-            'src': 'Source',
-            'dst': 'Destination',
-            'pos': 'Position',
-            'dir': 'Direction',
-            'dist': 'Distance',
-            'coord': 'Coordinate',
-            'geo': 'Geographic',
-            'usd': 'USD',
-            'eur': 'EUR',
-            'gbp': 'GBP',
-            'pvid': 'ID',
-            'admin': 'Administrative',
-            'km': 'Kilometers',
-            'kms': 'Kilometers',
-            'poi': 'POI',
-            'h24x7': '24/7 Hours'
-        }
+        # Cache of LLM results for repeated / near-identical columns across tables
+        # (opened on first use, see the cache property)
+        self._cache: Optional[MetadataCache] = None
+        self._cache_lock = threading.Lock()
+
+        # Pre-compiled patterns for rule-based alias generation
+        self._splitter = re.compile(r'[_\-]|(?<=[a-z])(?=[A-Z])')
+        self._word_re = re.compile(r'\S+')
+        self._id_re = re.compile(r'pvid|_id|id$')
+        self._admin_l_re = re.compile(r'l([1-4])')
+        self._km_re = re.compile(r'km|kilometer')
+        self._class_re = re.compile(r'class|type')
+        # One line of model output holding a 1-6 word alias, bullets/dashes stripped
+        self._alias_line_re = re.compile(
+            r'^[ \t\-•*]*([^\s\-•*]\S*?(?:[ \t]+\S+?){0,5}?)[ \t\-•*]*$', re.MULTILINE
+        )
+        self._alias_reject_prefix_re = re.compile(r'(?:for |column |examples|now )', re.IGNORECASE)
+        # Leading boilerplate in model descriptions ("Description: This column ...")
+        self._desc_prefix_re = re.compile(
+            r'^(?:(?:the description is:|description:|this column|this is)\s*)+', re.IGNORECASE
+        )
     
+    @property
+    def cache(self) -> MetadataCache:
+        """Metadata cache, opened on first use so importing this module touches no files"""
+        if self._cache is None:
+            with self._cache_lock:
+                if self._cache is None:
+                    self._cache = MetadataCache(resolve_backend_path(settings.metadata_cache_path))
+        return self._cache
+
+    def _expand_word(self, match: re.Match) -> str:
+        """Expand an abbreviation, or Capitalize any other word"""
+        word = match.group(0)
+        return _ABBREVIATIONS.get(word.lower()) or word.capitalize()
+
     def load_models(self):
-        """Load HuggingFace models (lazy loading)"""
+        """Load HuggingFace models (lazy loading, once across fallback threads)"""
+        if self._models_loaded:
+            return
+        with self._load_lock:
+            self._load_models()
+
+    def _load_models(self):
+        """Load HuggingFace models; caller holds _load_lock"""
         if self._models_loaded:
             return
 
+        if not settings.enable_hf_fallback:
+            return
+
         if not TRANSFORMERS_AVAILABLE:
             logger.warning("transformers library not available, skipping HuggingFace model loading")
             return
 
         try:
+            from transformers import AutoTokenizer
+
             logger.info(f"Loading alias generation model: {settings.alias_model}")
-            self.alias_tokenizer = T5Tokenizer.from_pretrained(settings.alias_model)
-            self.alias_model = T5ForConditionalGeneration.from_pretrained(settings.alias_model)
+            self.alias_tokenizer = AutoTokenizer.from_pretrained(settings.alias_model, use_fast=True)
+            self.alias_model = self._load_seq2seq_model(settings.alias_model)
 
             logger.info(f"Loading description generation model: {settings.description_model}")
-            self.description_tokenizer = T5Tokenizer.from_pretrained(settings.description_model)
-            self.description_model = T5ForConditionalGeneration.from_pretrained(settings.description_model)
+            self.description_tokenizer = AutoTokenizer.from_pretrained(settings.description_model, use_fast=True)
+            self.description_model = self._load_seq2seq_model(settings.description_model)
+
+            # Inference only: disable dropout (ONNX Runtime models have no eval())
+            for model in (self.alias_model, self.description_model):
+                if hasattr(model, "eval"):
+                    model.eval()
 
             self._models_loaded = True
             logger.info("HuggingFace models loaded successfully")
@@ -110,6 +208,95 @@ class AliasGenerator:
             logger.error(f"Failed to load HuggingFace models: {e}")
             logger.warning("Falling back to rule-based alias generation only")
     
+    @staticmethod
+    def _inference_mode():
+        """torch.inference_mode() context for generate() calls (no autograd tracking)"""
+        import torch
+
+        return torch.inference_mode()
+
+    def _load_seq2seq_model(self, model_name: str):
+        """
+        Load a T5 model for generation
+
+        Uses an ONNX Runtime export (CUDA provider with IO binding when a GPU
+        is available) if optimum[onnxruntime] is installed, otherwise PyTorch.
+        Both expose the same generate() interface.
+        """
+        if ONNXRUNTIME_AVAILABLE:
+            try:
+                import onnxruntime
+                from optimum.onnxruntime import ORTModelForSeq2SeqLM
+
+                use_cuda = "CUDAExecutionProvider" in onnxruntime.get_available_providers()
+                provider_options = dict(
+                    provider="CUDAExecutionProvider" if use_cuda else "CPUExecutionProvider",
+                    use_io_binding=use_cuda,
+                )
+
+                # Export once, then load the saved ONNX graphs on later starts
+                export_dir = os.path.join(
+                    resolve_backend_path(settings.onnx_export_path), model_name.replace("/", "--")
+                )
+                if os.path.isdir(export_dir):
+                    model = ORTModelForSeq2SeqLM.from_pretrained(export_dir, **provider_options)
+                else:
+                    model = ORTModelForSeq2SeqLM.from_pretrained(model_name, export=True, **provider_options)
+                    try:
+                        # Save beside the target and rename, so an interrupted save is never loaded
+                        os.makedirs(os.path.dirname(export_dir), exist_ok=True)
+                        staging_dir = tempfile.mkdtemp(dir=os.path.dirname(export_dir))
+                        model.save_pretrained(staging_dir)
+                        os.replace(staging_dir, export_dir)
+                    except Exception as e:
+                        logger.warning(f"Could not save ONNX export of {model_name} to {export_dir}: {e}")
+                logger.info(f"Loaded {model_name} with ONNX Runtime (cuda={use_cuda})")
+                return model
+            except Exception as e:
+                logger.warning(f"ONNX Runtime export failed for {model_name}, using PyTorch: {e}")
+
+        return self._load_torch_seq2seq_model(model_name)
+
+    def _load_torch_seq2seq_model(self, model_name: str):
+        """
+        Load a T5 model with PyTorch in a reduced-precision format
+
+        GPU: bfloat16 weights (T5 overflows in float16), or bitsandbytes int8 when
+        settings.hf_load_in_8bit is set. CPU: float32, or dynamic int8
+        quantization of the Linear layers when settings.hf_load_in_8bit is set.
+        """
+        import torch
+        from transformers import T5ForConditionalGeneration
+
+        use_cuda = torch.cuda.is_available()
+
+        if use_cuda and settings.hf_load_in_8bit:
+            try:
+                from transformers import BitsAndBytesConfig
+                model = T5ForConditionalGeneration.from_pretrained(
+                    model_name,
+                    quantization_config=BitsAndBytesConfig(load_in_8bit=True),
+                    device_map="auto",
+                )
+                logger.info(f"Loaded {model_name} in 8-bit (bitsandbytes)")
+                return model
+            except Exception as e:
+                logger.warning(f"8-bit loading failed for {model_name}, using bfloat16: {e}")
+
+        if use_cuda and torch.cuda.is_bf16_supported():
+            model = T5ForConditionalGeneration.from_pretrained(model_name, torch_dtype=torch.bfloat16)
+            logger.info(f"Loaded {model_name} in bfloat16 on GPU")
+            return model.to("cuda")
+
+        model = T5ForConditionalGeneration.from_pretrained(model_name)
+        if use_cuda:
+            return model.to("cuda")
+
+        if settings.hf_load_in_8bit:
+            model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+            logger.info(f"Loaded {model_name} with dynamic int8 quantization on CPU")
+        return model
+
     def generate_aliases_and_description(
         self,
         column_name: str,
@@ -140,6 +327,17 @@ class AliasGenerator:
         Returns:
             Dict with 'aliases' (List[str]) and 'description' (str)
         """
+        # Well-known geographic columns: templates are as good as the LLM
+        rule_result = self._known_rule_result(column_name, data_type, tags, cardinality)
+        if rule_result:
+            return rule_result
+
+        # Serve repeated / near-identical columns from cache
+        cached = self.cache.get(column_name, data_type, tags, table_context)
+        if cached:
+            logger.debug(f"Metadata cache hit for {column_name}")
+            return cached
+
         # Try Azure OpenAI GPT-5 combined generation (FASTEST!)
         if self._azure_available and self.azure_generator:
             try:
@@ -149,22 +347,259 @@ class AliasGenerator:
                 )
                 if result.get("aliases") and result.get("description"):
                     logger.info(f"Generated metadata for {column_name} using Azure OpenAI GPT-5 (combined)")
+                    self.cache.set(column_name, data_type, tags, table_context, result)
                     return result
             except Exception as e:
                 logger.warning(f"Azure OpenAI combined generation failed: {e}, falling back to separate calls")
 
-        # Fallback to separate calls if combined fails
-        aliases = self.generate_aliases(column_name, data_type, sample_values, tags, table_context)
-        description = self.generate_description(
+        # Fallback to separate calls if combined fails (run concurrently)
+        description_future = _pair_executor.submit(
+            self.generate_description,
             column_name, data_type, sample_values, tags,
             min_value, max_value, cardinality, table_context
         )
+        aliases = self.generate_aliases(column_name, data_type, sample_values, tags, table_context)
+        description = description_future.result()
 
         return {
             "aliases": aliases,
             "description": description
         }
 
+    def generate_batch(self, columns: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Generate aliases AND descriptions for many columns at once
+
+        Rule-covered and cached columns are answered locally; the rest are sent to
+        Azure OpenAI in batched requests (one per chunk instead of one per
+        column). Columns the batch did not produce a usable result for fall
+        back to generate_aliases_and_description().
+
+        Args:
+            columns: Column descriptors, each a dict of the keyword arguments
+                accepted by generate_aliases_and_description()
+
+        Returns:
+            List of dicts with 'aliases' (List[str]) and 'description' (str),
+            in the same order as columns
+        """
+        results: List[Optional[Dict[str, Any]]] = [
+            self._known_rule_result(
+                column["column_name"], column["data_type"],
+                column.get("tags"), column.get("cardinality")
+            )
+            or self.cache.get(
+                column["column_name"], column["data_type"],
+                column.get("tags"), column.get("table_context")
+            )
+            for column in columns
+        ]
+        misses = [index for index, result in enumerate(results) if result is None]
+
+        if misses and self._azure_available and self.azure_generator:
+            try:
+                batch = self.azure_generator.generate_batch([columns[index] for index in misses])
+                for index, result in zip(misses, batch):
+                    if result.get("aliases") and result.get("description"):
+                        column = columns[index]
+                        self.cache.set(
+                            column["column_name"], column["data_type"],
+                            column.get("tags"), column.get("table_context"), result
+                        )
+                        results[index] = result
+                logger.info(
+                    f"Generated metadata for {sum(results[index] is not None for index in misses)}/"
+                    f"{len(misses)} uncached columns using Azure OpenAI GPT-5 (batched)"
+                )
+            except Exception as e:
+                logger.warning(f"Azure OpenAI batched generation failed: {e}, falling back to per-column calls")
+
+        remaining = [index for index, result in enumerate(results) if result is None]
+        if self._azure_available and self.azure_generator:
+            # Retry the columns the batch missed, FALLBACK_MAX_WORKERS at a time
+            retried = _column_executor.map(
+                lambda index: self.generate_aliases_and_description(**columns[index]), remaining
+            )
+            for index, result in zip(remaining, retried):
+                results[index] = result
+        elif remaining:
+            # No Azure: run the HuggingFace/rule fallback for all of them together
+            fallback = self.generate_aliases_and_description_batch([columns[index] for index in remaining])
+            for index, result in zip(remaining, fallback):
+                results[index] = result
+
+        return results
+
+    def generate_aliases_and_description_batch(
+        self,
+        columns: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Fallback (non-Azure) generation of aliases AND descriptions for many columns
+
+        Runs the HuggingFace models once per chunk of HF_BATCH_SIZE prompts
+        instead of once per column, then fills anything the models could not
+        produce with rule/template-based output.
+
+        Args:
+            columns: Column descriptors, each a dict of the keyword arguments
+                accepted by generate_aliases_and_description()
+
+        Returns:
+            List of dicts with 'aliases' (List[str]) and 'description' (str),
+            in the same order as columns
+        """
+        if not columns:
+            return []
+
+        ai_aliases = self._generate_aliases_with_ai_batch([
+            self._build_hf_alias_prompt(
+                column["column_name"], column["data_type"], column.get("sample_values"),
+                column.get("tags"), column.get("table_context")
+            )
+            for column in columns
+        ])
+        ai_descriptions = self._generate_descriptions_with_ai_batch([
+            self._build_hf_description_prompt(
+                column["column_name"], column["data_type"], column.get("sample_values"),
+                column.get("tags"), column.get("min_value"), column.get("max_value"),
+                column.get("cardinality"), column.get("table_context")
+            )
+            for column in columns
+        ])
+
+        results = []
+        for column, aliases, description in zip(columns, ai_aliases, ai_descriptions):
+            if len(aliases) < 2:
+                aliases = self._generate_aliases_rule_based(
+                    column["column_name"], column["data_type"], column.get("tags")
+                )
+            if len(description) <= MIN_DESCRIPTION_LENGTH:
+                description = self._generate_description_template_based(
+                    column["column_name"], column["data_type"],
+                    column.get("tags"), column.get("cardinality")
+                )
+            results.append({"aliases": aliases, "description": description})
+
+        return results
+
+    def generate_bulk_async(
+        self,
+        catalog_schema_table: str,
+        columns: List[Dict[str, Any]]
+    ) -> Optional[str]:
+        """
+        Submit alias + description generation for many columns as an Azure OpenAI Batch job
+
+        For non-interactive bulk ingestion: results arrive within 24h at lower
+        cost. Each request's custom_id is the column FQN
+        (catalog.schema.table.column). Use collect_bulk_results() to fetch them.
+
+        Args:
+            catalog_schema_table: Table the columns belong to
+            columns: Column descriptors, each a dict of the keyword arguments
+                accepted by generate_aliases_and_description()
+
+        Returns:
+            Batch job ID, or None if Azure OpenAI is unavailable or submission failed
+        """
+        if not columns or not (self._azure_available and self.azure_generator):
+            return None
+
+        fd, jsonl_path = tempfile.mkstemp(prefix="metadata_batch_", suffix=".jsonl")
+        try:
+            with os.fdopen(fd, "w") as f:
+                for column in columns:
+                    request = self.azure_generator.build_batch_request(
+                        f"{catalog_schema_table}.{column['column_name']}", column
+                    )
+                    f.write(json.dumps(request, default=str) + "\n")
+
+            return self.azure_generator.submit_batch(jsonl_path)
+
+        except Exception as e:
+            logger.error(f"Failed to submit batch metadata job for {catalog_schema_table}: {e}")
+            return None
+
+        finally:
+            os.remove(jsonl_path)
+
+    def collect_bulk_results(
+        self,
+        catalog_schema_table: str,
+        batch_id: str
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Collect the results of a generate_bulk_async() job
+
+        Args:
+            catalog_schema_table: Table the job was submitted for
+            batch_id: Batch job ID
+
+        Returns:
+            Dict of column_name -> {'aliases', 'description'} once the job has
+            completed, or None while it is still running (or Azure OpenAI is
+            not configured, so the job can't be checked yet)
+
+        Raises:
+            RuntimeError: If the job failed, expired or was cancelled
+        """
+        if not (self._azure_available and self.azure_generator):
+            logger.warning(
+                f"Azure OpenAI not configured; leaving batch job {batch_id} for {catalog_schema_table} pending"
+            )
+            return None
+
+        results = self.azure_generator.get_batch_results(batch_id)
+        if results is None:
+            return None
+
+        prefix = f"{catalog_schema_table}."
+        return {
+            custom_id[len(prefix):]: result
+            for custom_id, result in results.items()
+            if custom_id.startswith(prefix) and result.get("aliases") and result.get("description")
+        }
+
+    def _known_rule_result(
+        self,
+        column_name: str,
+        data_type: str,
+        tags: Optional[List[str]],
+        cardinality: Optional[int]
+    ) -> Optional[Dict[str, Any]]:
+        """Rule-based result for columns tagged with a RULE_COVERED_TAGS tag, else None"""
+        if settings.prefer_rules_for_known_tags and tags and not RULE_COVERED_TAGS.isdisjoint(tags):
+            logger.debug(f"Using rule-based metadata for known column: {column_name}")
+            return self.generate_rule_based(column_name, data_type, tags, cardinality)
+        return None
+
+    def generate_rule_based(
+        self,
+        column_name: str,
+        data_type: str,
+        tags: Optional[List[str]] = None,
+        cardinality: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate aliases AND description using only rules/templates (no model calls)
+
+        Args:
+            column_name: Name of the column
+            data_type: Data type of the column
+            tags: List of tags (e.g., ['country', 'geographic'])
+            cardinality: Number of distinct values
+
+        Returns:
+            Dict with 'aliases' (List[str]) and 'description' (str)
+        """
+        return {
+            "aliases": self._generate_aliases_rule_based(column_name, data_type, tags),
+            "description": self._generate_description_template_based(
+                column_name, data_type, tags, cardinality
+            )
+        }
+
     def generate_aliases(
         self,
         column_name: str,
@@ -243,7 +678,100 @@ class AliasGenerator:
         if not self._models_loaded:
             return []
         
-        # Build rich prompt
+        prompt = self._build_hf_alias_prompt(
+            column_name, data_type, sample_values, tags, table_context
+        )
+        
+        try:
+            # Generate
+            inputs = self.alias_tokenizer(
+                prompt, 
+                return_tensors="pt", 
+                max_length=512, 
+                truncation=True
+            ).to(self.alias_model.device)
+            
+            with self._inference_mode():
+                outputs = self.alias_model.generate(
+                    **inputs,
+                    max_length=100,
+                    num_return_sequences=1,
+                    temperature=0.7,
+                    do_sample=True,
+                    top_p=0.9,
+                    use_cache=True,
+                    output_scores=False,
+                    output_attentions=False,
+                    output_hidden_states=False
+                )
+            
+            result = self.alias_tokenizer.decode(outputs[0], skip_special_tokens=True)
+            
+            return self._parse_ai_aliases(result)
+        
+        except Exception as e:
+            logger.warning(f"AI alias generation error: {e}")
+            return []
+    
+    def _generate_aliases_with_ai_batch(self, prompts: List[str]) -> List[List[str]]:
+        """
+        Generate aliases for many prompts with one padded generate() call per chunk
+
+        Args:
+            prompts: Prompts built by _build_hf_alias_prompt()
+
+        Returns:
+            Parsed aliases per prompt (empty lists if the model is unavailable)
+        """
+        if not self._models_loaded:
+            self.load_models()
+        if not self._models_loaded:
+            return [[] for _ in prompts]
+
+        results: List[List[str]] = []
+        for start in range(0, len(prompts), HF_BATCH_SIZE):
+            chunk = prompts[start:start + HF_BATCH_SIZE]
+            try:
+                inputs = self.alias_tokenizer(
+                    chunk,
+                    return_tensors="pt",
+                    padding=True,
+                    max_length=512,
+                    truncation=True
+                ).to(self.alias_model.device)
+
+                with self._inference_mode():
+                    outputs = self.alias_model.generate(
+                        **inputs,
+                        max_length=100,
+                        num_beams=1,
+                        temperature=0.7,
+                        do_sample=True,
+                        top_p=0.9,
+                        use_cache=True,
+                        output_scores=False,
+                        output_attentions=False,
+                        output_hidden_states=False
+                    )
+
+                decoded = self.alias_tokenizer.batch_decode(outputs, skip_special_tokens=True)
+                results.extend(self._parse_ai_aliases(result) for result in decoded)
+
+            except Exception as e:
+                logger.warning(f"Batched AI alias generation error: {e}")
+                results.extend([] for _ in chunk)
+
+        return results
+    
+    def _build_hf_alias_prompt(
+        self,
+        column_name: str,
+        data_type: str,
+        sample_values: Optional[List[str]] = None,
+        tags: Optional[List[str]] = None,
+        table_context: Optional[str] = None
+    ) -> str:
+        """Build the HuggingFace alias generation prompt"""
         prompt = f"""Generate 3-5 clear, business-friendly aliases for this database column.
 
 Column: {column_name}
@@ -283,41 +811,15 @@ Total Route Length
 
 Now generate aliases:"""
         
-        try:
-            # Generate
-            inputs = self.alias_tokenizer(
-                prompt, 
-                return_tensors="pt", 
-                max_length=512, 
-                truncation=True
-            )
-            
-            outputs = self.alias_model.generate(
-                **inputs,
-                max_length=100,
-                num_return_sequences=1,
-                temperature=0.7,
-                do_sample=True,
-                top_p=0.9
-            )
-            
-            result = self.alias_tokenizer.decode(outputs[0], skip_special_tokens=True)
-            
-            # Parse aliases from result
-            aliases = []
-            for line in result.split('\n'):
-                line = line.strip()
-                if line and len(line.split()) <= 6:  # Max 6 words
-                    # Clean up
-                    line = line.strip('- •*')
-                    if line and not line.lower().startswith(('for ', 'column ', 'examples', 'now ')):
-                        aliases.append(line)
-            
-            return aliases[:5]
-        
-        except Exception as e:
-            logger.warning(f"AI alias generation error: {e}")
-            return []
+        return prompt
+    
+    def _parse_ai_aliases(self, result: str) -> List[str]:
+        """Parse aliases (one per line, max 6 words) from HuggingFace model output"""
+        aliases = (
+            match.group(1) for match in self._alias_line_re.finditer(result)
+            if not self._alias_reject_prefix_re.match(match.group(1))
+        )
+        return list(dict.fromkeys(aliases))[:5]
     
     def _generate_aliases_rule_based(
         self,
@@ -328,58 +830,46 @@ Now generate aliases:"""
         """Generate aliases using rules (fallback)"""
         aliases = []
         col_lower = column_name.lower()
+        tags_set = frozenset(tags or ())
         
-        # Split column name and expand abbreviations
-        parts = re.split(r'[_\-]|(?<=[a-z])(?=[A-Z])', column_name)
-        expanded_parts = []
-        for part in parts:
-            part_lower = part.lower()
-            if part_lower in self.abbreviations:
-                expanded_parts.append(self.abbreviations[part_lower])
-            else:
-                expanded_parts.append(part.capitalize())
-        
-        # Base alias: expanded words
-        base_alias = ' '.join(expanded_parts)
+        # Split column name and expand abbreviations (one regex pass over the words)
+        base_alias = self._word_re.sub(
+            self._expand_word, ' '.join(self._splitter.split(column_name))
+        )
         aliases.append(base_alias)
         
         # Pattern-based aliases
-        if 'pvid' in col_lower or '_id' in col_lower or col_lower.endswith('id'):
+        if self._id_re.search(col_lower):
             aliases.append(base_alias.replace('Pvid', 'Identifier').replace(' Id', ' Identifier'))
             aliases.append(base_alias.replace('Pvid', 'Code').replace(' Id', ' Code'))
         
-        # Administrative levels
+        # Administrative levels (lowest level mentioned wins; 'level1' contains 'l1')
         if 'admin' in col_lower:
-            if 'l1' in col_lower or 'level1' in col_lower:
-                aliases.extend(['Province Identifier', 'Level 1 Region ID', 'State Code'])
-            elif 'l2' in col_lower or 'level2' in col_lower:
-                aliases.extend(['Province Name', 'State Name', 'Level 2 Region'])
-            elif 'l3' in col_lower or 'level3' in col_lower:
-                aliases.extend(['City Name', 'Municipality', 'Level 3 Region'])
-            elif 'l4' in col_lower or 'level4' in col_lower:
-                aliases.extend(['District Name', 'Locality', 'Level 4 Region'])
+            levels = self._admin_l_re.findall(col_lower)
+            if levels:
+                aliases.extend(ADMIN_LEVEL_ALIASES[min(levels)])
         
         # Distance/measurement
-        if 'km' in col_lower or 'kilometer' in col_lower:
+        if self._km_re.search(col_lower):
             aliases.extend(['Distance (km)', 'Length in Kilometers', 'Total Distance'])
         
         # Coordinates
-        if tags:
-            if 'latitude' in tags:
+        if tags_set:
+            if 'latitude' in tags_set:
                 aliases.extend(['Latitude Coordinate', 'Lat', 'North-South Position'])
-            if 'longitude' in tags:
+            if 'longitude' in tags_set:
                 aliases.extend(['Longitude Coordinate', 'Lon', 'East-West Position'])
-            if 'country' in tags:
+            if 'country' in tags_set:
                 aliases.extend(['Country Name', 'Nation', 'Country Code'])
-            if 'city' in tags:
+            if 'city' in tags_set:
                 aliases.append('City Name')
-            if 'province' in tags:
+            if 'province' in tags_set:
                 aliases.extend(['Province Name', 'State Name'])
-            if 'district' in tags:
+            if 'district' in tags_set:
                 aliases.extend(['District Name', 'Locality Name'])
         
         # Classification
-        if 'class' in col_lower or 'type' in col_lower:
+        if self._class_re.search(col_lower):
             aliases.extend([base_alias + ' Category', base_alias + ' Type'])
         
         # Remove duplicates while preserving order
@@ -434,7 +924,7 @@ Now generate aliases:"""
                     cardinality,
                     table_context
                 )
-                if ai_description and len(ai_description) > 20:
+                if len(ai_description) > MIN_DESCRIPTION_LENGTH:
                     logger.info(f"Generated description for {column_name} using Azure OpenAI GPT-5")
                     return ai_description
             except Exception as e:
@@ -453,7 +943,7 @@ Now generate aliases:"""
                     cardinality,
                     table_context
                 )
-                if ai_description and len(ai_description) > 20:
+                if len(ai_description) > MIN_DESCRIPTION_LENGTH:
                     return ai_description
             except Exception as e:
                 logger.warning(f"HuggingFace description generation failed for {column_name}: {e}")
@@ -486,7 +976,102 @@ Now generate aliases:"""
         if not self._models_loaded:
             return ""
         
-        # Build rich prompt
+        prompt = self._build_hf_description_prompt(
+            column_name, data_type, sample_values, tags,
+            min_value, max_value, cardinality, table_context
+        )
+        
+        try:
+            # Generate
+            inputs = self.description_tokenizer(
+                prompt,
+                return_tensors="pt",
+                max_length=512,
+                truncation=True
+            ).to(self.description_model.device)
+            
+            with self._inference_mode():
+                outputs = self.description_model.generate(
+                    **inputs,
+                    max_length=100,
+                    num_return_sequences=1,
+                    temperature=0.7,
+                    do_sample=True,
+                    use_cache=True,
+                    output_scores=False,
+                    output_attentions=False,
+                    output_hidden_states=False
+                )
+            
+            result = self.description_tokenizer.decode(outputs[0], skip_special_tokens=True)
+            
+            return self._clean_ai_description(result)
+        
+        except Exception as e:
+            logger.warning(f"AI description generation error: {e}")
+            return ""
+    
+    def _generate_descriptions_with_ai_batch(self, prompts: List[str]) -> List[str]:
+        """
+        Generate descriptions for many prompts with one padded generate() call per chunk
+
+        Args:
+            prompts: Prompts built by _build_hf_description_prompt()
+
+        Returns:
+            Cleaned description per prompt (empty strings if the model is unavailable)
+        """
+        if not self._models_loaded:
+            self.load_models()
+        if not self._models_loaded:
+            return ["" for _ in prompts]
+
+        results: List[str] = []
+        for start in range(0, len(prompts), HF_BATCH_SIZE):
+            chunk = prompts[start:start + HF_BATCH_SIZE]
+            try:
+                inputs = self.description_tokenizer(
+                    chunk,
+                    return_tensors="pt",
+                    padding=True,
+                    max_length=512,
+                    truncation=True
+                ).to(self.description_model.device)
+
+                with self._inference_mode():
+                    outputs = self.description_model.generate(
+                        **inputs,
+                        max_length=100,
+                        num_beams=1,
+                        temperature=0.7,
+                        do_sample=True,
+                        use_cache=True,
+                        output_scores=False,
+                        output_attentions=False,
+                        output_hidden_states=False
+                    )
+
+                decoded = self.description_tokenizer.batch_decode(outputs, skip_special_tokens=True)
+                results.extend(self._clean_ai_description(result) for result in decoded)
+
+            except Exception as e:
+                logger.warning(f"Batched AI description generation error: {e}")
+                results.extend("" for _ in chunk)
+
+        return results
+    
+    def _build_hf_description_prompt(
+        self,
+        column_name: str,
+        data_type: str,
+        sample_values: Optional[List[str]] = None,
+        tags: Optional[List[str]] = None,
+        min_value: Optional[Any] = None,
+        max_value: Optional[Any] = None,
+        cardinality: Optional[int] = None,
+        table_context: Optional[str] = None
+    ) -> str:
+        """Build the HuggingFace description generation prompt"""
         prompt = f"""Write a clear, concise description (1-2 sentences) for this database column.
 
 Column: {column_name}
@@ -525,52 +1110,25 @@ Good examples:
 
 Write the description:"""
         
-        try:
-            # Generate
-            inputs = self.description_tokenizer(
-                prompt,
-                return_tensors="pt",
-                max_length=512,
-                truncation=True
-            )
-            
-            outputs = self.description_model.generate(
-                **inputs,
-                max_length=100,
-                num_return_sequences=1,
-                temperature=0.7,
-                do_sample=True
-            )
-            
-            result = self.description_tokenizer.decode(outputs[0], skip_special_tokens=True)
-            
-            # Clean up result
-            result = result.strip()
-            
-            # Remove common prefixes
-            prefixes_to_remove = [
-                'the description is:',
-                'description:',
-                'this column',
-                'this is',
-            ]
-            for prefix in prefixes_to_remove:
-                if result.lower().startswith(prefix):
-                    result = result[len(prefix):].strip()
-            
-            # Capitalize first letter
-            if result:
-                result = result[0].upper() + result[1:]
-            
-            # Ensure it ends with a period
-            if result and not result.endswith('.'):
-                result += '.'
-            
-            return result
+        return prompt
+    
+    def _clean_ai_description(self, result: str) -> str:
+        """Tidy a description decoded from HuggingFace model output"""
+        # Clean up result
+        result = result.strip()
         
-        except Exception as e:
-            logger.warning(f"AI description generation error: {e}")
-            return ""
+        # Remove common prefixes
+        result = self._desc_prefix_re.sub('', result, count=1)
+        
+        # Capitalize first letter
+        if result:
+            result = result[0].upper() + result[1:]
+        
+        # Ensure it ends with a period
+        if result and not result.endswith('.'):
+            result += '.'
+        
+        return result
     
     def _generate_description_template_based(
         self,
@@ -582,48 +1140,51 @@ Write the description:"""
         """Generate description using templates (fallback)"""
         
         col_lower = column_name.lower()
-        tags = tags or []
+        tags_set = frozenset(tags or ())
+        is_admin = 'admin' in col_lower
+        # Digits N of every 'lN' in the name ('levelN' contains 'lN' too)
+        admin_levels = frozenset(self._admin_l_re.findall(col_lower))
         
         # ID columns
-        if any(p in col_lower for p in ['pvid', '_id', 'uuid', 'guid']) or 'identifier' in tags:
-            if 'admin' in col_lower or 'administrative_region' in tags:
-                if 'l1' in col_lower or 'level1' in col_lower or 'province' in tags:
+        if any(p in col_lower for p in ['pvid', '_id', 'uuid', 'guid']) or 'identifier' in tags_set:
+            if is_admin or 'administrative_region' in tags_set:
+                if '1' in admin_levels or 'province' in tags_set:
                     return "Unique identifier for top-level administrative regions such as provinces or states."
-                elif 'l2' in col_lower or 'level2' in col_lower:
+                elif '2' in admin_levels:
                     return "Unique identifier for second-level administrative divisions."
-                elif 'l3' in col_lower or 'level3' in col_lower or 'city' in tags:
+                elif '3' in admin_levels or 'city' in tags_set:
                     return "Unique identifier for third-level administrative areas such as cities or municipalities."
-                elif 'l4' in col_lower or 'level4' in col_lower or 'district' in tags:
+                elif '4' in admin_levels or 'district' in tags_set:
                     return "Unique identifier for fourth-level administrative areas such as districts or localities."
                 else:
                     return "Unique identifier for an administrative region."
             return f"Unique identifier for the {column_name.replace('_', ' ').replace('pvid', '').replace('id', '').strip()} entity."
         
         # Geographic columns
-        if 'latitude' in tags:
+        if 'latitude' in tags_set:
             return "Geographic coordinate representing the north-south position, measured in decimal degrees (-90 to +90)."
         
-        if 'longitude' in tags:
+        if 'longitude' in tags_set:
             return "Geographic coordinate representing the east-west position, measured in decimal degrees (-180 to +180)."
         
-        if 'country' in tags:
+        if 'country' in tags_set:
             return "Country name or ISO country code identifying the nation where the record applies."
         
-        if 'province' in tags or ('admin' in col_lower and ('level2' in col_lower or 'l2' in col_lower)):
+        if 'province' in tags_set or (is_admin and '2' in admin_levels):
             return "Name of the province, state, or first-level administrative division."
         
-        if 'city' in tags or ('admin' in col_lower and ('level3' in col_lower or 'l3' in col_lower)):
+        if 'city' in tags_set or (is_admin and '3' in admin_levels):
             return "Name of the city, town, or municipality."
         
-        if 'district' in tags or ('admin' in col_lower and ('level4' in col_lower or 'l4' in col_lower)):
+        if 'district' in tags_set or (is_admin and '4' in admin_levels):
             return "Name of the district, locality, or sub-municipal administrative area."
         
         # Measurement columns
-        if 'km' in col_lower or 'kilometer' in col_lower:
+        if self._km_re.search(col_lower):
             return "Total distance or length measured in kilometers."
         
         # Classification columns
-        if 'class' in col_lower or 'type' in col_lower:
+        if self._class_re.search(col_lower):
             desc = f"Classification or category for {column_name.replace('_', ' ').replace('class', '').replace('type', '').strip()}."
             if cardinality and cardinality < 20:
                 desc += f" Contains {cardinality} distinct categories."
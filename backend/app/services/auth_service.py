@@ -3,13 +3,34 @@ Authentication Service
 Handles user authentication against HERE's authentication endpoint
 """
 
+import asyncio
 import base64
+import hashlib
+import hmac
 from typing import Dict, Optional
 
-import requests
+import httpx
 
+from app.config import settings
+from app.utils.cache import TTLCache
 from app.utils.logger import app_logger as logger
 
+# Auth endpoint statuses worth retrying, and how many times / how long to back off
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRIES = 3
+RETRY_BACKOFF_SECONDS = 0.5
+
+# Shared async client for authenticate_user_async (connection pool per process);
+# the transport retries failed connection attempts
+_async_client = httpx.AsyncClient(
+    timeout=10.0,
+    headers={"Accept": "application/json"},
+    transport=httpx.AsyncHTTPTransport(
+        retries=MAX_RETRIES,
+        limits=httpx.Limits(max_connections=200, max_keepalive_connections=50),
+    ),
+)
+
 
 class AuthService:
     """Service for authenticating users"""
@@ -19,9 +40,69 @@ class AuthService:
         "https://visualization-api.analytics.in.here.com/api/v1/authenticate"
     )
 
-    def authenticate_user(self, username: str, password: str) -> Optional[Dict]:
+    def __init__(self):
+        """Initialize the login cache"""
+        # Successful logins only, keyed by an HMAC of the credentials
+        self._auth_cache = TTLCache(maxsize=1024, ttl_seconds=settings.auth_cache_ttl_seconds)
+
+    @staticmethod
+    def _credentials_key(username: str, password: str) -> str:
+        """Cache key for a credential pair that never holds the password in clear"""
+        return hmac.new(
+            settings.session_secret_key.encode(),
+            f"{username}:{password}".encode(),
+            hashlib.sha256,
+        ).hexdigest()
+
+    async def warm_up(self) -> None:
+        """Open a connection to the auth endpoint so the first login skips the TLS handshake"""
+        try:
+            await _async_client.head(self.AUTH_ENDPOINT, timeout=5.0)
+        except httpx.HTTPError as e:
+            logger.warning(f"Auth endpoint warm-up failed: {e}")
+
+    @staticmethod
+    def _auth_headers(username: str, password: str) -> Dict[str, str]:
+        """Basic Auth header for a credential pair"""
+        credentials = f"{username}:{password}"
+        encoded_credentials = base64.b64encode(credentials.encode()).decode()
+        return {"Authorization": f"Basic {encoded_credentials}"}
+
+    def _handle_auth_response(self, username: str, cache_key: str, response) -> Optional[Dict]:
+        """
+        Turn an auth endpoint response into user info
+
+        Args:
+            username: User's username (for logging)
+            cache_key: Credentials key the result is cached under
+            response: HTTP response from the auth endpoint
+
+        Returns:
+            Dict with user info if successful, None if failed
+        """
+        if response.status_code != 200:
+            logger.warning(
+                f"Authentication failed for user {username}: {response.status_code}"
+            )
+            return None
+
+        user_info = response.json()
+        logger.info(f"Successfully authenticated user: {username}")
+        result = {
+            "username": user_info.get("username"),
+            "display_name": user_info.get("user-display-name"),
+            "email": user_info.get("email"),
+            "groups": user_info.get("groups", []),
+            "roles": user_info.get("roles", []),
+        }
+        # Failures are never cached so a changed password takes effect immediately
+        if settings.auth_cache_ttl_seconds > 0:
+            self._auth_cache.set(cache_key, dict(result))
+        return result
+
+    async def authenticate_user_async(self, username: str, password: str) -> Optional[Dict]:
         """
-        Authenticate user against HERE's auth endpoint
+        Authenticate user against HERE's auth endpoint without blocking the event loop
 
         Args:
             username: User's username
@@ -30,38 +111,24 @@ class AuthService:
         Returns:
             Dict with user info if successful, None if failed
         """
-        try:
-            # Create Basic Auth header
-            credentials = f"{username}:{password}"
-            encoded_credentials = base64.b64encode(credentials.encode()).decode()
-
-            headers = {
-                "Authorization": f"Basic {encoded_credentials}",
-                "Accept": "application/json",
-            }
+        cache_key = self._credentials_key(username, password)
+        cached = self._auth_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
 
+        try:
             logger.info(f"Authenticating user: {username}")
 
-            # Make request to HERE's auth endpoint
-            response = requests.get(self.AUTH_ENDPOINT, headers=headers, timeout=10)
-
-            if response.status_code == 200:
-                user_info = response.json()
-                logger.info(f"Successfully authenticated user: {username}")
-                return {
-                    "username": user_info.get("username"),
-                    "display_name": user_info.get("user-display-name"),
-                    "email": user_info.get("email"),
-                    "groups": user_info.get("groups", []),
-                    "roles": user_info.get("roles", []),
-                }
-            else:
-                logger.warning(
-                    f"Authentication failed for user {username}: {response.status_code}"
-                )
-                return None
-
-        except requests.exceptions.RequestException as e:
+            # Make request to HERE's auth endpoint, backing off on throttling / 5xx
+            headers = self._auth_headers(username, password)
+            for attempt in range(MAX_RETRIES + 1):
+                response = await _async_client.get(self.AUTH_ENDPOINT, headers=headers)
+                if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    break
+                await asyncio.sleep(RETRY_BACKOFF_SECONDS * 2 ** attempt)
+            return self._handle_auth_response(username, cache_key, response)
+
+        except httpx.HTTPError as e:
             logger.error(f"Authentication request failed for user {username}: {e}")
             return None
         except Exception as e:
@@ -70,19 +137,9 @@ class AuthService:
             )
             return None
 
-    def validate_credentials(self, username: str, password: str) -> bool:
-        """
-        Validate if credentials are correct
-
-        Args:
-            username: User's username
-            password: User's password
-
-        Returns:
-            True if valid, False otherwise
-        """
-        user_info = self.authenticate_user(username, password)
-        return user_info is not None
+    async def aclose(self) -> None:
+        """Close the async HTTP client's pooled connections"""
+        await _async_client.aclose()
 
 
 # Global instance
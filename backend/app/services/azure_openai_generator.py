@@ -3,12 +3,276 @@ Azure OpenAI text generation service for high-quality metadata generation
 Uses GPT-5 for generating column aliases and descriptions
 """
 
-from typing import List, Dict, Any, Optional
-from openai import AzureOpenAI
-
-from app.config import settings
+import functools
+import hashlib
+import importlib.util
+import itertools
+import json
+import re
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+import httpx
+
+from app.config import settings, resolve_backend_path
+from app.services.metadata_cache import ResponseCache
 from app.utils.logger import app_logger as logger
 
+if TYPE_CHECKING:
+    # The SDK is imported on first client use; it is large and not every
+    # process that loads this module generates anything
+    from openai import AzureOpenAI
+
+# Optional: h2 lets httpx multiplex concurrent requests over one HTTP/2 connection
+H2_AVAILABLE = importlib.util.find_spec("h2") is not None
+if not H2_AVAILABLE:
+    logger.warning("h2 not available. Azure OpenAI requests will use HTTP/1.1 connections.")
+
+# System prompt for combined alias + description generation
+COMBINED_SYSTEM_PROMPT = """You are a data catalog expert specializing in metadata generation for database columns.
+
+Your expertise includes:
+- Geographic data (latitude, longitude, coordinates, administrative regions)
+- POI (Point of Interest) data (locations, businesses, landmarks)
+- HERE Maps datasets (navigation, routing, mapping data)
+- Location-based services and spatial data
+
+You generate both aliases and descriptions that are clear, business-friendly, and valuable to users."""
+
+# System prompt for alias-only generation
+ALIAS_SYSTEM_PROMPT = "You are a data catalog expert specializing in generating clear, meaningful aliases for database columns. You understand geographic data, POI (Point of Interest) data, and HERE Maps datasets."
+
+# System prompt for description-only generation
+DESCRIPTION_SYSTEM_PROMPT = """You are a data catalog expert specializing in writing clear, business-friendly descriptions for database columns.
+
+Your expertise includes:
+- Geographic data (latitude, longitude, coordinates, administrative regions)
+- POI (Point of Interest) data (locations, businesses, landmarks)
+- HERE Maps datasets (navigation, routing, mapping data)
+- Location-based services and spatial data
+
+Write concise descriptions that explain what the column means in plain English, focusing on business value rather than technical details."""
+
+# Prompt pieces for per-column generation. Headers are str.format() templates;
+# the static instructions are kept separate so they are built once.
+COMBINED_PROMPT_HEADER = """Generate metadata for this database column. Provide BOTH aliases and a description.
+
+Column: {column_name}
+Data Type: {data_type}
+"""
+
+COMBINED_PROMPT_INSTRUCTIONS = """
+TASK 1 - Generate Aliases:
+- Provide 3-5 clear, business-friendly aliases
+- Make them more readable than the technical column name
+- Use proper capitalization and spaces
+- Keep each alias concise (2-4 words)
+
+TASK 2 - Generate Description:
+- Write 1-2 clear sentences (max 50 words)
+- Explain what this column represents in business terms
+- Use language understandable to non-technical users
+- Focus on what the data means and how it's used
+- Do NOT just say "value stored as [type]"
+
+Respond with a JSON object with "aliases" (array of 3-5 strings) and "description" (string).
+
+Example for "admin_level_2":
+{"aliases": ["State or Province", "Subnational Area", "First Level Division", "Primary Administrative Region", "Administrative Level 2"], "description": "State, province, or comparable administrative region where the point of interest is located, useful for regional reporting, search, and aggregation."}
+
+"""
+
+BATCH_PROMPT_INSTRUCTIONS = """
+For EACH column:
+- Aliases: 3-5 clear, business-friendly aliases (2-4 words each), more readable than the technical column name, with proper capitalization and spaces
+- Description: 1-2 clear sentences (max 50 words) explaining what the column represents in business terms, understandable to non-technical users. Do NOT just say "value stored as [type]"
+
+Return one entry per column in "columns", using the column's [index] as "index"."""
+
+ALIAS_PROMPT_HEADER = """Generate 3-5 clear, meaningful aliases for this database column.
+
+Column: {column_name}
+Data Type: {data_type}
+"""
+
+ALIAS_PROMPT_INSTRUCTIONS = """
+Requirements:
+- Provide 3-5 aliases separated by commas
+- Use clear, business-friendly language
+- Make aliases more readable than the technical column name
+- Use proper capitalization and spaces
+- Keep aliases concise (2-4 words each)
+
+Examples:
+- Column "admin_level_2" → "Administrative Level 2, State, Province, Region"
+- Column "poi_id" → "POI ID, Location ID, Place Identifier"
+- Column "has_h24x7" → "24/7 Hours, Always Open, Open 24 Hours"
+
+Generate aliases (comma-separated):"""
+
+DESCRIPTION_PROMPT_HEADER = """Write a clear, concise description (1-2 sentences) for this database column.
+
+Column: {column_name}
+Data Type: {data_type}
+"""
+
+DESCRIPTION_PROMPT_INSTRUCTIONS = """
+Requirements:
+- Write 1-2 clear sentences (max 50 words)
+- Explain what this column represents in business terms
+- Use language understandable to non-technical users
+- Do NOT repeat the column name verbatim
+- Do NOT just say "value stored as [data_type]"
+- Focus on what the data means, not how it's stored
+- For POI/location data, explain the geographic/business context
+
+Good Examples:
+- For "admin_level_2": "Name of the state, province, or primary administrative division where the location is situated."
+- For "has_h24x7": "Indicates whether the location operates 24 hours a day, 7 days a week."
+- For "latitude": "Geographic coordinate representing the north-south position, measured in decimal degrees (-90 to +90)."
+- For "poi_id": "Unique identifier for each point of interest in the dataset."
+- For "chains": "Business chain or brand affiliation, indicating if the location is part of a larger franchise network."
+
+Write the description:"""
+
+
+# Completion token caps for description calls. The fast path runs with
+# minimal reasoning, so a 1-2 sentence reply fits in the tighter cap.
+DESCRIPTION_MAX_TOKENS = 100
+DESCRIPTION_FAST_MAX_TOKENS = 60
+
+# Streamed descriptions stop after two sentences or this many characters
+DESCRIPTION_STREAM_MAX_CHARS = 280
+
+# Abbreviations whose period never ends a sentence ("e.g. HERE Maps", "St. Louis")
+_NON_TERMINAL_ABBREVIATIONS = ("e.g", "i.e", "etc", "vs", "approx", "incl", "esp", "cf", "st", "mt", "dr")
+
+# End of a sentence: ., ! or ? followed by whitespace and the start of a new
+# sentence (capital, digit, quote or bracket), not after an abbreviation
+_SENTENCE_END_RE = re.compile(
+    "".join(rf"(?<!\b(?i:{re.escape(abbr)}))" for abbr in _NON_TERMINAL_ABBREVIATIONS)
+    + r"[.!?](?=\s+[A-Z0-9\"'(\[])"
+)
+
+# Alias reply separators (commas, or one alias per line) and list numbering ("1. ", "2) ")
+_ALIAS_SPLIT_RE = re.compile(r"\s*[,\n]\s*")
+_ALIAS_NUMBER_RE = re.compile(r"^\d+[.)]\s*")
+
+# Aliases kept from one reply
+MAX_ALIASES = 5
+
+# Structured output schema for single-column alias/description generation.
+# Strict mode rejects minItems/maxItems/minLength, so the 3-5 aliases and
+# sentence length are asked for in the prompt instead.
+COMBINED_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "column_metadata",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "aliases": {"type": "array", "items": {"type": "string"}},
+                "description": {"type": "string"},
+            },
+            "required": ["aliases", "description"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+# Azure OpenAI Batch API job states that will never produce output
+BATCH_JOB_FAILED_STATES = ("failed", "expired", "cancelled")
+
+# Max columns described in a single batched request
+BATCH_MAX_COLUMNS = 20
+
+# Structured output schema for batched alias/description generation
+BATCH_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "column_metadata_batch",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "columns": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "index": {"type": "integer"},
+                            "aliases": {"type": "array", "items": {"type": "string"}},
+                            "description": {"type": "string"},
+                        },
+                        "required": ["index", "aliases", "description"],
+                        "additionalProperties": False,
+                    },
+                }
+            },
+            "required": ["columns"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+# Sample values shown in prompts (and used in response cache keys)
+PROMPT_SAMPLE_COUNT = 5
+
+
+class SampleContext(NamedTuple):
+    """Prompt-ready sample values, rendered once per column"""
+
+    joined: str  # ", "-joined str() of the first PROMPT_SAMPLE_COUNT values
+    hash: str    # order-insensitive fingerprint of the same values, for cache keys
+
+    @classmethod
+    def from_values(
+        cls, sample_values: Optional[Union[Iterable[Any], "SampleContext"]]
+    ) -> Optional["SampleContext"]:
+        """
+        Build from raw sample values (list, pandas Series, ...)
+
+        Only the first PROMPT_SAMPLE_COUNT values are read. An existing
+        SampleContext is returned unchanged.
+
+        Returns:
+            SampleContext, or None when there are no samples
+        """
+        if sample_values is None or isinstance(sample_values, cls):
+            return sample_values
+
+        samples = [str(v) for v in itertools.islice(sample_values, PROMPT_SAMPLE_COUNT)]
+        if not samples:
+            return None
+        fingerprint = hashlib.blake2b("\x1f".join(sorted(samples)).encode("utf-8"), digest_size=6)
+        return cls(", ".join(samples), fingerprint.hexdigest())
+
+
+# Raw sample values or a prebuilt SampleContext
+SampleValues = Optional[Union[List[Any], SampleContext]]
+
+
+def _http_client_options() -> Dict[str, Any]:
+    """
+    httpx connection pool settings for the Azure OpenAI client
+
+    The pool is sized well above the generators' worker count so requests never
+    queue behind the SDK's default limits, and waiting for a free connection
+    fails fast (and is retried by the SDK) instead of stalling.
+    """
+    return {
+        "limits": httpx.Limits(
+            max_connections=settings.azure_openai_max_connections,
+            max_keepalive_connections=settings.azure_openai_max_keepalive_connections,
+            keepalive_expiry=30.0,
+        ),
+        "timeout": httpx.Timeout(
+            settings.azure_openai_timeout_seconds, connect=5.0, write=10.0, pool=5.0
+        ),
+        "http2": H2_AVAILABLE,
+    }
+
 
 class AzureOpenAIGenerator:
     """Service for generating text using Azure OpenAI GPT-5"""
@@ -17,18 +281,44 @@ class AzureOpenAIGenerator:
         """Initialize Azure OpenAI client"""
         self.client = None
         self.model = settings.azure_openai_deployment  # gpt-5
+        # Cheaper deployment for routine descriptions (see _description_request_options)
+        self.fast_model = settings.azure_openai_fast_deployment or self.model
+        # Persistent cache of alias/description replies for repeated columns
+        # (opened on first use, see the response_cache property)
+        self._response_cache: Optional[ResponseCache] = None
+        self._response_cache_lock = threading.Lock()
         logger.info(f"Azure OpenAI Generator initialized with model: {self.model}")
 
-    def _get_client(self) -> AzureOpenAI:
+    @property
+    def response_cache(self) -> ResponseCache:
+        """LLM reply cache, opened on first use so constructing the generator touches no files"""
+        if self._response_cache is None:
+            with self._response_cache_lock:
+                if self._response_cache is None:
+                    self._response_cache = ResponseCache(
+                        resolve_backend_path(settings.llm_cache_path),
+                        ttl_seconds=settings.llm_cache_ttl_days * 86400,
+                    )
+        return self._response_cache
+
+    def _get_client(self) -> "AzureOpenAI":
         """Get or create Azure OpenAI client (lazy loading)"""
         if self.client is None:
             if not settings.azure_openai_api_key or not settings.azure_openai_endpoint:
                 raise ValueError("Azure OpenAI credentials not configured")
 
+            from openai import AzureOpenAI
+
+            http_options = _http_client_options()
             self.client = AzureOpenAI(
                 api_key=settings.azure_openai_api_key,
                 api_version=settings.azure_openai_api_version,
-                azure_endpoint=settings.azure_openai_endpoint
+                azure_endpoint=settings.azure_openai_endpoint,
+                # SDK retries 408/409/429/5xx, timeouts and connection errors with
+                # jittered exponential backoff (honoring Retry-After); 400/401 are not retried
+                max_retries=settings.azure_openai_max_retries,
+                timeout=http_options["timeout"],
+                http_client=httpx.Client(**http_options)
             )
             logger.info("Azure OpenAI client initialized for text generation")
 
@@ -38,7 +328,7 @@ class AzureOpenAIGenerator:
         self,
         column_name: str,
         data_type: str,
-        sample_values: Optional[List[str]] = None,
+        sample_values: SampleValues = None,
         tags: Optional[List[str]] = None,
         min_value: Optional[Any] = None,
         max_value: Optional[Any] = None,
@@ -51,7 +341,7 @@ class AzureOpenAIGenerator:
         Args:
             column_name: Name of the column
             data_type: Data type
-            sample_values: Sample values
+            sample_values: Sample values (list or SampleContext)
             tags: Semantic tags
             min_value: Minimum value
             max_value: Maximum value
@@ -66,7 +356,7 @@ class AzureOpenAIGenerator:
 
             # Build combined prompt
             prompt = self._build_combined_prompt(
-                column_name, data_type, sample_values, tags,
+                column_name, data_type, SampleContext.from_values(sample_values), tags,
                 min_value, max_value, cardinality, table_context
             )
 
@@ -76,58 +366,226 @@ class AzureOpenAIGenerator:
                 messages=[
                     {
                         "role": "system",
-                        "content": """You are a data catalog expert specializing in metadata generation for database columns.
-
-Your expertise includes:
-- Geographic data (latitude, longitude, coordinates, administrative regions)
-- POI (Point of Interest) data (locations, businesses, landmarks)
-- HERE Maps datasets (navigation, routing, mapping data)
-- Location-based services and spatial data
-
-You generate both aliases and descriptions that are clear, business-friendly, and valuable to users."""
+                        "content": COMBINED_SYSTEM_PROMPT
                     },
                     {
                         "role": "user",
                         "content": prompt
                     }
                 ],
+                response_format=COMBINED_RESPONSE_FORMAT,
                 temperature=1.0,
                 max_completion_tokens=250
             )
 
             # Parse response
-            result = response.choices[0].message.content.strip()
+            result = self._parse_combined_response(response.choices[0].message.content)
+
+            logger.debug(f"Generated {len(result['aliases'])} aliases and description for: {column_name}")
+            return result
+
+        except Exception as e:
+            logger.error(f"Failed to generate metadata with GPT-5: {e}")
+            return {"aliases": [], "description": ""}
+
+    def _parse_combined_response(self, content: str) -> Dict[str, Any]:
+        """Parse a COMBINED_RESPONSE_FORMAT JSON reply into aliases and description"""
+        payload = json.loads(content)
+        return self._normalize_metadata(payload.get("aliases", []), payload.get("description"))
+
+    @staticmethod
+    def _normalize_metadata(aliases: List[Any], description: Optional[str]) -> Dict[str, Any]:
+        """Trim structured-output aliases/description to the stored shape"""
+        aliases = [a.strip() for a in aliases if isinstance(a, str)]
+        aliases = [a for a in aliases if len(a) > 2][:5]
+
+        description = (description or "").strip()
+        if description and not description.endswith('.'):
+            description += '.'
+
+        return {
+            "aliases": aliases,
+            "description": description
+        }
+
+    def build_batch_request(self, custom_id: str, column: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build one Batch API JSONL request line for combined alias + description generation
+
+        Args:
+            custom_id: Identifier echoed back in the batch output (e.g. column FQN)
+            column: Column descriptor with the keyword arguments of
+                generate_aliases_and_description (column_name, data_type, ...)
+
+        Returns:
+            Request dict to be serialized as a single JSONL line
+        """
+        prompt = self._build_combined_prompt(
+            column["column_name"],
+            column["data_type"],
+            SampleContext.from_values(column.get("sample_values")),
+            column.get("tags"),
+            column.get("min_value"),
+            column.get("max_value"),
+            column.get("cardinality"),
+            column.get("table_context"),
+        )
+
+        return {
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/chat/completions",
+            "body": {
+                "model": self.model,
+                "messages": [
+                    {"role": "system", "content": COMBINED_SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt},
+                ],
+                "response_format": COMBINED_RESPONSE_FORMAT,
+                "temperature": 1.0,
+                "max_completion_tokens": 250,
+            },
+        }
+
+    def submit_batch(self, jsonl_path: str) -> str:
+        """
+        Upload a JSONL request file and start an Azure OpenAI Batch API job
+
+        Batch jobs complete within 24h at a lower cost than synchronous calls,
+        so they suit bulk catalog population where nobody is waiting.
+
+        Args:
+            jsonl_path: Path to a file of build_batch_request() lines
+
+        Returns:
+            Batch job ID
+        """
+        client = self._get_client()
+
+        with open(jsonl_path, "rb") as f:
+            input_file = client.files.create(file=f, purpose="batch")
+
+        batch = client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/chat/completions",
+            completion_window="24h",
+        )
+
+        logger.info(f"Submitted Azure OpenAI batch job {batch.id} ({jsonl_path})")
+        return batch.id
+
+    def get_batch_results(self, batch_id: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Fetch the results of a Batch API job
+
+        Args:
+            batch_id: Batch job ID returned by submit_batch()
 
-            # Split by "DESCRIPTION:"
-            parts = result.split("DESCRIPTION:")
+        Returns:
+            Dict of custom_id -> {'aliases', 'description'} once the job has
+            completed, or None while it is still running
+
+        Raises:
+            RuntimeError: If the job failed, expired or was cancelled
+        """
+        client = self._get_client()
+        batch = client.batches.retrieve(batch_id)
+
+        if batch.status in BATCH_JOB_FAILED_STATES:
+            raise RuntimeError(f"Batch job {batch_id} ended with status '{batch.status}'")
+
+        if batch.status != "completed":
+            return None
+
+        results: Dict[str, Dict[str, Any]] = {}
+        if not batch.output_file_id:
+            return results
+
+        output = client.files.content(batch.output_file_id).text
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+                body = entry["response"]["body"]
+                results[entry["custom_id"]] = self._parse_combined_response(
+                    body["choices"][0]["message"]["content"]
+                )
+            except (KeyError, IndexError, TypeError, ValueError) as e:
+                logger.warning(f"Skipping unreadable batch output line in {batch_id}: {e}")
+
+        logger.info(f"Batch job {batch_id} returned {len(results)} results")
+        return results
+
+    def generate_batch(self, columns: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Generate aliases AND descriptions for many columns with one GPT-5 call per chunk
+
+        Columns are sent BATCH_MAX_COLUMNS at a time in a single numbered prompt and
+        the reply is requested as structured JSON keyed by index.
+
+        Args:
+            columns: Column descriptors with the keyword arguments of
+                generate_aliases_and_description (column_name, data_type, ...)
+
+        Returns:
+            One dict with 'aliases' and 'description' per input column, in order.
+            Entries the model did not return (or on failure) are empty.
+        """
+        results: List[Dict[str, Any]] = []
+        for start in range(0, len(columns), BATCH_MAX_COLUMNS):
+            results.extend(self._generate_batch_chunk(columns[start:start + BATCH_MAX_COLUMNS]))
+        return results
+
+    def _generate_batch_chunk(self, columns: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run one structured-output request for up to BATCH_MAX_COLUMNS columns"""
+        results: List[Dict[str, Any]] = [{"aliases": [], "description": ""} for _ in columns]
+        try:
+            client = self._get_client()
+
+            response = client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": COMBINED_SYSTEM_PROMPT
+                    },
+                    {
+                        "role": "user",
+                        "content": self._build_batch_prompt(columns)
+                    }
+                ],
+                response_format=BATCH_RESPONSE_FORMAT,
+                temperature=1.0,
+                max_completion_tokens=250 * len(columns)
+            )
+
+            payload = json.loads(response.choices[0].message.content)
 
-            # Parse aliases (before DESCRIPTION:)
-            aliases_text = parts[0].replace("ALIASES:", "").strip()
-            aliases = [alias.strip() for alias in aliases_text.split(',')]
-            aliases = [a for a in aliases if a and len(a) > 2][:5]
+            for entry in payload.get("columns", []):
+                index = entry.get("index")
+                if not isinstance(index, int) or not 0 <= index < len(columns):
+                    continue
 
-            # Parse description (after DESCRIPTION:)
-            description = parts[1].strip() if len(parts) > 1 else ""
-            if description and not description.endswith('.'):
-                description += '.'
+                results[index] = self._normalize_metadata(
+                    entry.get("aliases", []), entry.get("description")
+                )
 
-            logger.debug(f"Generated {len(aliases)} aliases and description for: {column_name}")
-            return {
-                "aliases": aliases,
-                "description": description
-            }
+            logger.debug(f"Generated batched metadata for {len(columns)} columns")
 
         except Exception as e:
-            logger.error(f"Failed to generate metadata with GPT-5: {e}")
-            return {"aliases": [], "description": ""}
+            logger.error(f"Failed to generate batched metadata with GPT-5: {e}")
+
+        return results
 
     def generate_aliases(
         self,
         column_name: str,
         data_type: str,
-        sample_values: Optional[List[str]] = None,
+        sample_values: SampleValues = None,
         tags: Optional[List[str]] = None,
-        table_context: Optional[str] = None
+        table_context: Optional[str] = None,
+        cache_bust: bool = False
     ) -> List[str]:
         """
         Generate alias suggestions for a column using GPT-5
@@ -136,19 +594,34 @@ You generate both aliases and descriptions that are clear, business-friendly, an
         Args:
             column_name: Name of the column
             data_type: Data type (varchar, bigint, etc.)
-            sample_values: Sample values from the column
+            sample_values: Sample values from the column (list or SampleContext)
             tags: Semantic tags (e.g., ['country', 'geographic'])
             table_context: Brief description of the table
+            cache_bust: Skip the response cache lookup (the reply is still cached)
 
         Returns:
             List of 3-5 alias suggestions
         """
+        samples = SampleContext.from_values(sample_values)
+        cache_key = ResponseCache.make_key(
+            "aliases",
+            column_name=column_name,
+            data_type=data_type,
+            sample_values=samples.hash if samples else None,
+            tags=tags,
+            table_context=table_context,
+        )
+        if not cache_bust:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
             client = self._get_client()
 
             # Build context-rich prompt
             prompt = self._build_alias_prompt(
-                column_name, data_type, sample_values, tags, table_context
+                column_name, data_type, samples, tags, table_context
             )
 
             # Call GPT-5
@@ -157,7 +630,7 @@ You generate both aliases and descriptions that are clear, business-friendly, an
                 messages=[
                     {
                         "role": "system",
-                        "content": "You are a data catalog expert specializing in generating clear, meaningful aliases for database columns. You understand geographic data, POI (Point of Interest) data, and HERE Maps datasets."
+                        "content": ALIAS_SYSTEM_PROMPT
                     },
                     {
                         "role": "user",
@@ -169,11 +642,10 @@ You generate both aliases and descriptions that are clear, business-friendly, an
             )
 
             # Parse response
-            result = response.choices[0].message.content.strip()
-            aliases = [alias.strip() for alias in result.split(',')]
+            aliases = self._parse_alias_response(response.choices[0].message.content)
 
-            # Clean and validate
-            aliases = [a for a in aliases if a and len(a) > 2][:5]
+            if aliases:
+                self.response_cache.set(cache_key, aliases, kind="aliases")
 
             logger.debug(f"Generated {len(aliases)} aliases for column: {column_name}")
             return aliases
@@ -186,12 +658,14 @@ You generate both aliases and descriptions that are clear, business-friendly, an
         self,
         column_name: str,
         data_type: str,
-        sample_values: Optional[List[str]] = None,
+        sample_values: SampleValues = None,
         tags: Optional[List[str]] = None,
         min_value: Optional[Any] = None,
         max_value: Optional[Any] = None,
         cardinality: Optional[int] = None,
-        table_context: Optional[str] = None
+        table_context: Optional[str] = None,
+        cache_bust: bool = False,
+        high_quality: bool = False
     ) -> str:
         """
         Generate a business-friendly description for a column using GPT-5
@@ -199,40 +673,53 @@ You generate both aliases and descriptions that are clear, business-friendly, an
         Args:
             column_name: Name of the column
             data_type: Data type
-            sample_values: Sample values
+            sample_values: Sample values (list or SampleContext)
             tags: Semantic tags
             min_value: Minimum value
             max_value: Maximum value
             cardinality: Number of distinct values
             table_context: Table description
+            cache_bust: Skip the response cache lookup (the reply is still cached)
+            high_quality: Use the full GPT-5 deployment and reasoning instead of
+                the fast description settings
 
         Returns:
             1-2 sentence description
         """
+        samples = SampleContext.from_values(sample_values)
+        cache_key = ResponseCache.make_key(
+            "description",
+            column_name=column_name,
+            data_type=data_type,
+            sample_values=samples.hash if samples else None,
+            tags=tags,
+            min_value=min_value,
+            max_value=max_value,
+            cardinality=cardinality,
+            table_context=table_context,
+            high_quality=high_quality,
+        )
+        if not cache_bust:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
             client = self._get_client()
 
             # Build context-rich prompt
             prompt = self._build_description_prompt(
-                column_name, data_type, sample_values, tags,
+                column_name, data_type, samples, tags,
                 min_value, max_value, cardinality, table_context
             )
 
-            # Call GPT-5
-            response = client.chat.completions.create(
-                model=self.model,
+            # Call GPT-5 (fast deployment unless high_quality), streamed so
+            # the request can be cut off once the description is complete
+            stream = client.chat.completions.create(
                 messages=[
                     {
                         "role": "system",
-                        "content": """You are a data catalog expert specializing in writing clear, business-friendly descriptions for database columns.
-
-Your expertise includes:
-- Geographic data (latitude, longitude, coordinates, administrative regions)
-- POI (Point of Interest) data (locations, businesses, landmarks)
-- HERE Maps datasets (navigation, routing, mapping data)
-- Location-based services and spatial data
-
-Write concise descriptions that explain what the column means in plain English, focusing on business value rather than technical details."""
+                        "content": DESCRIPTION_SYSTEM_PROMPT
                     },
                     {
                         "role": "user",
@@ -240,15 +727,24 @@ Write concise descriptions that explain what the column means in plain English,
                     }
                 ],
                 temperature=1.0,
-                max_completion_tokens=100
+                stream=True,
+                **self._description_request_options(high_quality)
             )
 
+            content = ""
+            try:
+                for chunk in stream:
+                    content, done = self._extend_streamed_description(content, chunk)
+                    if done:
+                        break
+            finally:
+                stream.close()
+
             # Parse and clean response
-            description = response.choices[0].message.content.strip()
+            description = self._parse_description_response(content)
 
-            # Ensure it ends with a period
-            if description and not description.endswith('.'):
-                description += '.'
+            if description:
+                self.response_cache.set(cache_key, description, kind="description")
 
             logger.debug(f"Generated description for column: {column_name}")
             return description
@@ -257,11 +753,99 @@ Write concise descriptions that explain what the column means in plain English,
             logger.error(f"Failed to generate description with GPT-5: {e}")
             return ""
 
+    def _description_request_options(self, high_quality: bool) -> Dict[str, Any]:
+        """
+        Model and completion limits for a description call
+
+        The fast options (tighter token cap, reduced reasoning effort) only
+        apply when a separate fast deployment is configured; otherwise every
+        description uses the main deployment's defaults.
+        """
+        if high_quality or not settings.azure_openai_fast_deployment:
+            return {"model": self.model, "max_completion_tokens": DESCRIPTION_MAX_TOKENS}
+
+        options: Dict[str, Any] = {
+            "model": self.fast_model,
+            "max_completion_tokens": DESCRIPTION_FAST_MAX_TOKENS,
+        }
+        if settings.azure_openai_fast_reasoning_effort:
+            # Raw body field so it works on openai SDKs without the named argument
+            options["extra_body"] = {"reasoning_effort": settings.azure_openai_fast_reasoning_effort}
+        return options
+
+    @staticmethod
+    def _parse_alias_response(content: str) -> List[str]:
+        """Parse a comma-separated (or numbered, one-per-line) alias reply"""
+        aliases = []
+        for alias in _ALIAS_SPLIT_RE.split(content.strip()):
+            alias = _ALIAS_NUMBER_RE.sub("", alias, count=1)
+            if len(alias) > 2:
+                aliases.append(alias)
+                if len(aliases) == MAX_ALIASES:
+                    break
+        return aliases
+
+    @staticmethod
+    def _extend_streamed_description(content: str, chunk: Any) -> Tuple[str, bool]:
+        """
+        Append one streamed chunk to a description reply
+
+        Returns:
+            Tuple of (content so far, done). Done once two sentences have been
+            received (the prompt asks for 1-2) or DESCRIPTION_STREAM_MAX_CHARS
+            is exceeded; content is then cut to the last complete sentence.
+        """
+        if not chunk.choices:  # Azure sends content-filter-only chunks
+            return content, False
+
+        content += chunk.choices[0].delta.content or ""
+        sentence_ends = [match.end() for match in _SENTENCE_END_RE.finditer(content)]
+        if len(sentence_ends) >= 2:
+            return content[:sentence_ends[1]], True
+        if len(content) > DESCRIPTION_STREAM_MAX_CHARS:
+            return (content[:sentence_ends[-1]] if sentence_ends else content), True
+        return content, False
+
+    @staticmethod
+    def _parse_description_response(content: str) -> str:
+        """Trim a description reply and make sure it ends with a period"""
+        description = content.strip()
+
+        # Ensure it ends with a period
+        if description and not description.endswith('.'):
+            description += '.'
+
+        return description
+
+    @staticmethod
+    def _column_details(
+        table_context: Optional[str],
+        samples: Optional[SampleContext],
+        tags: Optional[List[str]],
+        tags_label: str,
+        min_value: Optional[Any] = None,
+        max_value: Optional[Any] = None,
+        cardinality: Optional[int] = None
+    ) -> str:
+        """Optional per-column context lines, each newline-terminated"""
+        lines = []
+        if table_context:
+            lines.append(f"Table Purpose: {table_context}\n")
+        if samples:
+            lines.append(f"Sample Values: {samples.joined}\n")
+        if min_value is not None and max_value is not None:
+            lines.append(f"Range: {min_value} to {max_value}\n")
+        if cardinality is not None:
+            lines.append(f"Distinct Values: {cardinality:,}\n")
+        if tags:
+            lines.append(f"{tags_label}: {', '.join(tags)}\n")
+        return "".join(lines)
+
     def _build_combined_prompt(
         self,
         column_name: str,
         data_type: str,
-        sample_values: Optional[List[str]],
+        samples: Optional[SampleContext],
         tags: Optional[List[str]],
         min_value: Optional[Any],
         max_value: Optional[Any],
@@ -269,104 +853,55 @@ Write concise descriptions that explain what the column means in plain English,
         table_context: Optional[str]
     ) -> str:
         """Build prompt for generating BOTH aliases AND description"""
-        prompt = f"""Generate metadata for this database column. Provide BOTH aliases and a description.
-
-Column: {column_name}
-Data Type: {data_type}
-"""
-
-        if table_context:
-            prompt += f"Table Purpose: {table_context}\n"
-
-        if sample_values and len(sample_values) > 0:
-            samples_str = ", ".join([str(v) for v in sample_values[:5]])
-            prompt += f"Sample Values: {samples_str}\n"
-
-        if min_value is not None and max_value is not None:
-            prompt += f"Range: {min_value} to {max_value}\n"
-
-        if cardinality is not None:
-            prompt += f"Distinct Values: {cardinality:,}\n"
-
-        if tags and len(tags) > 0:
-            prompt += f"Semantic Tags: {', '.join(tags)}\n"
-
-        prompt += """
-TASK 1 - Generate Aliases:
-- Provide 3-5 clear, business-friendly aliases
-- Make them more readable than the technical column name
-- Use proper capitalization and spaces
-- Keep each alias concise (2-4 words)
-
-TASK 2 - Generate Description:
-- Write 1-2 clear sentences (max 50 words)
-- Explain what this column represents in business terms
-- Use language understandable to non-technical users
-- Focus on what the data means and how it's used
-- Do NOT just say "value stored as [type]"
-
-FORMAT YOUR RESPONSE EXACTLY LIKE THIS:
-
-ALIASES: [alias 1], [alias 2], [alias 3], [alias 4], [alias 5]
-
-DESCRIPTION: [Your 1-2 sentence description here.]
-
-Example for "admin_level_2":
-ALIASES: State or Province, Subnational Area, First Level Division, Primary Administrative Region, Administrative Level 2
-
-DESCRIPTION: State, province, or comparable administrative region where the point of interest is located, useful for regional reporting, search, and aggregation.
-
-Now generate metadata for "{column_name}":"""
-
-        return prompt
+        return "".join([
+            COMBINED_PROMPT_HEADER.format(column_name=column_name, data_type=data_type),
+            self._column_details(
+                table_context, samples, tags, "Semantic Tags",
+                min_value, max_value, cardinality
+            ),
+            COMBINED_PROMPT_INSTRUCTIONS,
+            f'Now generate metadata for "{column_name}":',
+        ])
+
+    def _build_batch_prompt(self, columns: List[Dict[str, Any]]) -> str:
+        """Build a numbered prompt asking for aliases AND a description per column"""
+        parts = [
+            f"Generate metadata for each of the following {len(columns)} database columns. "
+            "Provide BOTH aliases and a description for every column.\n"
+        ]
+
+        for index, column in enumerate(columns):
+            parts.append(f"\n[{index}] Column: {column['column_name']}\nData Type: {column['data_type']}\n")
+            parts.append(self._column_details(
+                column.get("table_context"), SampleContext.from_values(column.get("sample_values")),
+                column.get("tags"),
+                "Semantic Tags", column.get("min_value"), column.get("max_value"),
+                column.get("cardinality")
+            ))
+
+        parts.append(BATCH_PROMPT_INSTRUCTIONS)
+        return "".join(parts)
 
     def _build_alias_prompt(
         self,
         column_name: str,
         data_type: str,
-        sample_values: Optional[List[str]],
+        samples: Optional[SampleContext],
         tags: Optional[List[str]],
         table_context: Optional[str]
     ) -> str:
         """Build prompt for alias generation"""
-        prompt = f"""Generate 3-5 clear, meaningful aliases for this database column.
-
-Column: {column_name}
-Data Type: {data_type}
-"""
-
-        if table_context:
-            prompt += f"Table Purpose: {table_context}\n"
-
-        if sample_values and len(sample_values) > 0:
-            samples_str = ", ".join([str(v) for v in sample_values[:5]])
-            prompt += f"Sample Values: {samples_str}\n"
-
-        if tags and len(tags) > 0:
-            prompt += f"Tags: {', '.join(tags)}\n"
-
-        prompt += """
-Requirements:
-- Provide 3-5 aliases separated by commas
-- Use clear, business-friendly language
-- Make aliases more readable than the technical column name
-- Use proper capitalization and spaces
-- Keep aliases concise (2-4 words each)
-
-Examples:
-- Column "admin_level_2" → "Administrative Level 2, State, Province, Region"
-- Column "poi_id" → "POI ID, Location ID, Place Identifier"
-- Column "has_h24x7" → "24/7 Hours, Always Open, Open 24 Hours"
-
-Generate aliases (comma-separated):"""
-
-        return prompt
+        return "".join([
+            ALIAS_PROMPT_HEADER.format(column_name=column_name, data_type=data_type),
+            self._column_details(table_context, samples, tags, "Tags"),
+            ALIAS_PROMPT_INSTRUCTIONS,
+        ])
 
     def _build_description_prompt(
         self,
         column_name: str,
         data_type: str,
-        sample_values: Optional[List[str]],
+        samples: Optional[SampleContext],
         tags: Optional[List[str]],
         min_value: Optional[Any],
         max_value: Optional[Any],
@@ -374,49 +909,25 @@ Generate aliases (comma-separated):"""
         table_context: Optional[str]
     ) -> str:
         """Build prompt for description generation"""
-        prompt = f"""Write a clear, concise description (1-2 sentences) for this database column.
-
-Column: {column_name}
-Data Type: {data_type}
-"""
-
-        if table_context:
-            prompt += f"Table Purpose: {table_context}\n"
-
-        if sample_values and len(sample_values) > 0:
-            samples_str = ", ".join([str(v) for v in sample_values[:5]])
-            prompt += f"Sample Values: {samples_str}\n"
-
-        if min_value is not None and max_value is not None:
-            prompt += f"Range: {min_value} to {max_value}\n"
-
-        if cardinality is not None:
-            prompt += f"Distinct Values: {cardinality:,}\n"
-
-        if tags and len(tags) > 0:
-            prompt += f"Tags: {', '.join(tags)}\n"
-
-        prompt += """
-Requirements:
-- Write 1-2 clear sentences (max 50 words)
-- Explain what this column represents in business terms
-- Use language understandable to non-technical users
-- Do NOT repeat the column name verbatim
-- Do NOT just say "value stored as [data_type]"
-- Focus on what the data means, not how it's stored
-- For POI/location data, explain the geographic/business context
-
-Good Examples:
-- For "admin_level_2": "Name of the state, province, or primary administrative division where the location is situated."
-- For "has_h24x7": "Indicates whether the location operates 24 hours a day, 7 days a week."
-- For "latitude": "Geographic coordinate representing the north-south position, measured in decimal degrees (-90 to +90)."
-- For "poi_id": "Unique identifier for each point of interest in the dataset."
-- For "chains": "Business chain or brand affiliation, indicating if the location is part of a larger franchise network."
-
-Write the description:"""
-
-        return prompt
-
-
-# Global instance
-azure_openai_generator = AzureOpenAIGenerator()
+        return "".join([
+            DESCRIPTION_PROMPT_HEADER.format(column_name=column_name, data_type=data_type),
+            self._column_details(
+                table_context, samples, tags, "Tags",
+                min_value, max_value, cardinality
+            ),
+            DESCRIPTION_PROMPT_INSTRUCTIONS,
+        ])
+
+
+@functools.lru_cache(maxsize=1)
+def get_generator() -> AzureOpenAIGenerator:
+    """Process-wide generator instance, created on first use"""
+    return AzureOpenAIGenerator()
+
+
+def __getattr__(name: str):
+    # Keep `from app.services.azure_openai_generator import azure_openai_generator`
+    # working without constructing the generator at import time
+    if name == "azure_openai_generator":
+        return get_generator()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -94,10 +94,121 @@ Column type detection service
 Detects whether a column is: dimension, measure, identifier, timestamp, or detail
 """
 
-from typing import Any
+import functools
+import re
+from bisect import bisect_left
+from typing import Any, Dict, Iterable
+
+import numpy as np
+import pandas as pd
 
 from app.utils.logger import app_logger as logger
 
+# Distinct (column_name, data_type) pairs whose name/type flags are memoized
+COLUMN_FLAGS_CACHE_SIZE = 4096
+
+# Optional: pyahocorasick scans a name once for every pattern set at the same time
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    logger.warning("pyahocorasick not available. Column name patterns will be matched with regexes.")
+
+
+def _any_substring_re(patterns: Iterable[str]) -> "re.Pattern[str]":
+    """Compiled alternation matching if any of patterns occurs as a substring"""
+    return re.compile("|".join(re.escape(p) for p in patterns))
+
+
+def _build_name_automaton(pattern_sets: Dict[int, Iterable[str]]):
+    """
+    One Aho-Corasick automaton over every pattern set
+
+    Each pattern maps to the OR of the category bits it belongs to, so a
+    single pass over a name yields all of its category memberships.
+
+    Returns:
+        ahocorasick.Automaton, or None if pyahocorasick is not installed
+    """
+    if not AHOCORASICK_AVAILABLE:
+        return None
+
+    categories: Dict[str, int] = {}
+    for category, patterns in pattern_sets.items():
+        for pattern in patterns:
+            categories[pattern] = categories.get(pattern, 0) | category
+
+    automaton = ahocorasick.Automaton()
+    for pattern, mask in categories.items():
+        automaton.add_word(pattern, mask)
+    automaton.make_automaton()
+    return automaton
+
+
+# Feature bits combined into the detect_column_type() decision table index
+PRIMARY_OR_ID = 1 << 0   # name matches PRIMARY_ID_PATTERNS or IDENTIFIER_PATTERNS
+FK_OR_ID = 1 << 1        # name matches FOREIGN_KEY_PATTERNS or IDENTIFIER_PATTERNS
+CATEGORICAL = 1 << 2     # name matches CATEGORICAL_PATTERNS
+MEASURE = 1 << 3         # name matches MEASURE_KEYWORDS
+NUMERIC = 1 << 4         # numeric data type
+TIMESTAMP = 1 << 5       # timestamp data type (wins over NUMERIC)
+GEOGRAPHIC = 1 << 6      # country/state/city/locality semantic type
+_FLAG_COUNT = 1 << 7
+
+# Cardinality buckets: <=20, <=100, <1000, ==1000, <=10000, >10000
+_CARD_LOW, _CARD_100, _CARD_UNDER_1000, _CARD_1000, _CARD_10000, _CARD_HIGH = range(6)
+# Uniqueness (cardinality / row_count) buckets; _UNIQUE_UNKNOWN when row_count <= 0
+_UNIQUE_UNKNOWN, _UNIQUE_HIGH, _UNIQUE_AT_THRESHOLD, _UNIQUE_LOW = range(4)
+
+
+def _decide_column_type(flags: int, card_bucket: int, unique_bucket: int) -> str:
+    """
+    Column type for one (flags, cardinality bucket, uniqueness bucket) cell
+
+    Only used to fill ColumnTypeDetector._DECISION_TABLE; the checks run in
+    priority order and the first match wins.
+    """
+    # 1. TIMESTAMP
+    if flags & TIMESTAMP:
+        return "timestamp"
+
+    # 2. IDENTIFIER (Primary Keys - highly unique (>80%) or very high cardinality)
+    if flags & PRIMARY_OR_ID and (unique_bucket == _UNIQUE_HIGH or card_bucket > _CARD_1000):
+        return "identifier"
+
+    # 3. DIMENSION (Geographic/administrative columns are always dimensions)
+    if flags & GEOGRAPHIC:
+        return "dimension"
+
+    # 4. DIMENSION (Categorical patterns - type, category, feature, etc.)
+    if flags & CATEGORICAL:
+        return "dimension"
+
+    # 5. DIMENSION (Foreign Keys: repeating IDs, or low cardinality IDs)
+    if flags & FK_OR_ID and (
+        (unique_bucket == _UNIQUE_LOW and card_bucket <= _CARD_UNDER_1000)
+        or card_bucket <= _CARD_100
+    ):
+        return "dimension"
+
+    # 6. MEASURE (numeric, measure keyword or high cardinality, NOT an ID)
+    is_numeric = bool(flags & NUMERIC)
+    if is_numeric and (flags & MEASURE or card_bucket > _CARD_LOW):
+        return "measure"
+
+    # 7. DIMENSION (low cardinality, categorical)
+    if card_bucket == _CARD_LOW:
+        return "dimension"
+
+    # 8. DETAIL (very high cardinality text; keeps admin_level columns with
+    # 3k-100k values out of detail)
+    if not is_numeric and card_bucket == _CARD_HIGH:
+        return "detail"
+
+    # Default
+    return "measure" if is_numeric else "dimension"
+
 
 class ColumnTypeDetector:
     """Detect column types (dimension, measure, identifier, timestamp, detail)"""
@@ -150,6 +261,53 @@ class ColumnTypeDetector:
     ]
     TIMESTAMP_TYPES = ["timestamp", "date", "datetime", "time"]
 
+    # Canonical base types (data type up to any parameters) matched by set lookup
+    NUMERIC_TYPE_SET = frozenset(NUMERIC_TYPES)
+    TIMESTAMP_TYPE_SET = frozenset(TIMESTAMP_TYPES)
+
+    # Compiled alternations of the pattern lists above (one C-level scan each)
+    _PRIMARY_OR_ID_RE = _any_substring_re(PRIMARY_ID_PATTERNS + IDENTIFIER_PATTERNS)
+    _FK_OR_ID_RE = _any_substring_re(FOREIGN_KEY_PATTERNS + IDENTIFIER_PATTERNS)
+    _CATEGORICAL_RE = _any_substring_re(CATEGORICAL_PATTERNS)
+    _MEASURE_RE = _any_substring_re(MEASURE_KEYWORDS)
+    _NUMERIC_TYPE_RE = _any_substring_re(NUMERIC_TYPES)
+    _TIMESTAMP_TYPE_RE = _any_substring_re(TIMESTAMP_TYPES)
+
+    _NAME_PATTERN_RES = {
+        PRIMARY_OR_ID: _PRIMARY_OR_ID_RE,
+        FK_OR_ID: _FK_OR_ID_RE,
+        CATEGORICAL: _CATEGORICAL_RE,
+        MEASURE: _MEASURE_RE,
+    }
+    _NAME_AUTOMATON = _build_name_automaton({
+        PRIMARY_OR_ID: PRIMARY_ID_PATTERNS + IDENTIFIER_PATTERNS,
+        FK_OR_ID: FOREIGN_KEY_PATTERNS + IDENTIFIER_PATTERNS,
+        CATEGORICAL: CATEGORICAL_PATTERNS,
+        MEASURE: MEASURE_KEYWORDS,
+    })
+
+    GEOGRAPHIC_SEMANTIC_TYPES = frozenset(["country", "state", "city", "locality"])
+
+    # Upper bounds of the cardinality buckets (cardinality is an integer, so
+    # "< 1000" is "<= 999"); bisect_left gives the bucket index
+    _CARDINALITY_BOUNDS = (DIMENSION_THRESHOLD, 100, 999, 1000, 10000)
+
+    # Flat (flags, cardinality bucket, uniqueness bucket) -> column type table
+    _DECISION_TABLE = tuple(
+        _decide_column_type(flags, card_bucket, unique_bucket)
+        for flags in range(_FLAG_COUNT)
+        for card_bucket in range(_CARD_HIGH + 1)
+        for unique_bucket in range(_UNIQUE_LOW + 1)
+    )
+
+    def __init__(self):
+        """Initialize detector"""
+        # The same (column_name, data_type) pairs recur across tables (poi_id
+        # BIGINT, created_at TIMESTAMP, ...), so the pattern scans are memoized
+        self._column_flags = functools.lru_cache(maxsize=COLUMN_FLAGS_CACHE_SIZE)(
+            self._compute_column_flags
+        )
+
     def detect_column_type(
         self, column_name: str, data_type: str, cardinality: int, row_count: int = 0,
         semantic_type: str = None
@@ -166,138 +324,135 @@ class ColumnTypeDetector:
 
         Returns: 'dimension', 'measure', 'identifier', 'timestamp', or 'detail'
         """
-        col_lower = column_name.lower()
-        type_lower = data_type.lower()
-
-        # 1. TIMESTAMP
-        if any(ts in type_lower for ts in self.TIMESTAMP_TYPES):
-            return "timestamp"
-
-        # 2. IDENTIFIER (Primary Keys - highly unique)
-        if self._is_primary_identifier(col_lower, cardinality, row_count):
-            return "identifier"
-
-        # 3. DIMENSION (Semantic-aware detection)
-        # Geographic/administrative columns are always dimensions
-        if semantic_type in ["country", "state", "city", "locality"]:
-            return "dimension"
-
-        # 4. DIMENSION (Categorical patterns - type, category, feature, etc.)
-        if self._is_categorical_dimension(col_lower):
-            return "dimension"
-
-        # 5. DIMENSION (Foreign Keys or low cardinality)
-        # Foreign keys with ID patterns but low uniqueness are dimensions
-        if self._is_foreign_key_dimension(col_lower, cardinality, row_count):
-            return "dimension"
-
-        # 6. MEASURE (numeric, high cardinality, NOT an ID)
-        if self._is_measure(col_lower, type_lower, cardinality):
-            return "measure"
-
-        # 7. DIMENSION (low cardinality, categorical)
-        if cardinality <= self.DIMENSION_THRESHOLD:
-            return "dimension"
-
-        # 8. DETAIL (high cardinality text)
-        if self._is_detail(type_lower, cardinality):
-            return "detail"
-
-        # Default
-        if self._is_numeric_type(type_lower):
-            return "measure"
-        return "dimension"
-
-    def _is_categorical_dimension(self, col_name: str) -> bool:
-        """
-        Check if column name indicates a categorical dimension
-        (type, category, feature, status, etc.)
-        """
-        return any(pattern in col_name for pattern in self.CATEGORICAL_PATTERNS)
-
-    def _is_primary_identifier(
-        self, col_name: str, cardinality: int, row_count: int
-    ) -> bool:
-        """
-        Check if column is a PRIMARY identifier (unique ID)
-        Must be highly unique (>80%) or have very high cardinality
-        """
-        # Check for primary ID patterns first
-        has_primary_pattern = any(p in col_name for p in self.PRIMARY_ID_PATTERNS)
-        has_id_pattern = any(p in col_name for p in self.IDENTIFIER_PATTERNS)
-
-        if not (has_primary_pattern or has_id_pattern):
-            return False
+        flags = self._column_flags(column_name, data_type)
+        if semantic_type in self.GEOGRAPHIC_SEMANTIC_TYPES:
+            flags |= GEOGRAPHIC
 
-        # Calculate uniqueness
         if row_count > 0:
             uniqueness = cardinality / row_count
-            # Primary IDs should be highly unique
-            if uniqueness > 0.8:
-                return True
-
-        # Or have very high cardinality (likely unique even without row count)
-        return cardinality > 1000
-
-    def _is_foreign_key_dimension(
-        self, col_name: str, cardinality: int, row_count: int
-    ) -> bool:
-        """
-        Check if column is a FOREIGN KEY (repeating ID used for grouping)
-        These are numeric IDs but act as dimensions (categories)
+            unique_bucket = (
+                _UNIQUE_HIGH if uniqueness > 0.8
+                else _UNIQUE_LOW if uniqueness < 0.8
+                else _UNIQUE_AT_THRESHOLD
+            )
+        else:
+            unique_bucket = _UNIQUE_UNKNOWN
+
+        card_bucket = bisect_left(self._CARDINALITY_BOUNDS, cardinality)
+        return self._DECISION_TABLE[(flags * (_CARD_HIGH + 1) + card_bucket) * (_UNIQUE_LOW + 1) + unique_bucket]
+
+    def classify_columns(self, columns: pd.DataFrame) -> pd.Series:
         """
-        # Check for foreign key patterns
-        has_fk_pattern = any(p in col_name for p in self.FOREIGN_KEY_PATTERNS)
-        has_id_pattern = any(p in col_name for p in self.IDENTIFIER_PATTERNS)
+        Vectorized detect_column_type() over many columns at once
 
-        if not (has_fk_pattern or has_id_pattern):
-            return False
-
-        # Foreign keys have LOW uniqueness (they repeat for grouping)
-        if row_count > 0:
-            uniqueness = cardinality / row_count
-            # Less than 80% unique = likely a foreign key dimension
-            if uniqueness < 0.8 and cardinality < 1000:
-                return True
-
-        # Low cardinality IDs are dimensions
-        return cardinality <= 100
+        Args:
+            columns: One row per column with 'column_name', 'data_type' and
+                'cardinality', plus optional 'row_count' and 'semantic_type'
 
-    def _is_measure(self, col_name: str, data_type: str, cardinality: int) -> bool:
+        Returns:
+            Series of 'dimension', 'measure', 'identifier', 'timestamp' or
+            'detail', aligned with columns.index
         """
-        Check if column is a measure (numeric value for calculations)
+        names = columns["column_name"].astype(str).str.lower()
+        types = columns["data_type"].astype(str).str.lower()
+        cardinality = pd.to_numeric(columns["cardinality"], errors="coerce").fillna(0).to_numpy(dtype=float)
+        if "row_count" in columns:
+            row_count = pd.to_numeric(columns["row_count"], errors="coerce").fillna(0).to_numpy(dtype=float)
+        else:
+            row_count = np.zeros(len(columns))
+
+        has_rows = row_count > 0
+        uniqueness = np.divide(
+            cardinality, row_count, out=np.zeros(len(columns)), where=has_rows
+        )
+
+        is_timestamp = types.str.contains(self._TIMESTAMP_TYPE_RE.pattern, regex=True).to_numpy()
+        is_numeric = types.str.contains(self._NUMERIC_TYPE_RE.pattern, regex=True).to_numpy()
+        name_flags = self._name_category_flags(names)
+
+        # Same precedence as detect_column_type(); np.select takes the first match
+        conditions = [
+            is_timestamp,
+            name_flags[PRIMARY_OR_ID]
+            & ((has_rows & (uniqueness > 0.8)) | (cardinality > 1000)),
+            columns["semantic_type"].isin(self.GEOGRAPHIC_SEMANTIC_TYPES).to_numpy()
+            if "semantic_type" in columns else np.zeros(len(columns), dtype=bool),
+            name_flags[CATEGORICAL],
+            name_flags[FK_OR_ID]
+            & ((has_rows & (uniqueness < 0.8) & (cardinality < 1000)) | (cardinality <= 100)),
+            is_numeric
+            & (name_flags[MEASURE]
+               | (cardinality > self.DIMENSION_THRESHOLD)),
+            cardinality <= self.DIMENSION_THRESHOLD,
+            ~is_numeric & (cardinality > 10000),
+        ]
+        choices = [
+            "timestamp", "identifier", "dimension", "dimension",
+            "dimension", "measure", "dimension", "detail",
+        ]
+        default = np.where(is_numeric, "measure", "dimension")
+
+        return pd.Series(
+            np.select(conditions, choices, default=default), index=columns.index, dtype=object
+        )
+
+    def _compute_column_flags(self, column_name: str, data_type: str) -> int:
+        """Name category and data type bits for one column (see _column_flags)"""
+        return self._name_categories(column_name.lower()) | self._type_flags(data_type.lower())
+
+    def _name_categories(self, col_name: str) -> int:
         """
-        if not self._is_numeric_type(data_type):
-            return False
-
-        # Strong indicators this is a measure, not an ID
-        if any(keyword in col_name for keyword in self.MEASURE_KEYWORDS):
-            return True
-
-        # Numeric with high cardinality (and not detected as ID earlier)
-        return cardinality > self.DIMENSION_THRESHOLD
-
-    def _is_detail(self, data_type: str, cardinality: int) -> bool:
+        Name category bits (PRIMARY_OR_ID, FK_OR_ID, CATEGORICAL, MEASURE)
+        that col_name matches, from one automaton pass when available
         """
-        Check if column is detail (high cardinality text)
-
-        Detail columns are truly unique text fields like:
-        - Descriptions, comments, notes
-        - Full addresses, full names
-        - Long-form text content
-
-        Not administrative/categorical fields with high cardinality.
-        """
-        if self._is_numeric_type(data_type):
-            return False
-
-        # Increased threshold: only very high cardinality text is detail
-        # This prevents admin_level columns (3k-100k cardinality) from being marked as detail
-        return cardinality > 10000
+        mask = 0
+        if self._NAME_AUTOMATON is None:
+            for category, pattern in self._NAME_PATTERN_RES.items():
+                if pattern.search(col_name):
+                    mask |= category
+            return mask
+
+        for _, categories in self._NAME_AUTOMATON.iter(col_name):
+            mask |= categories
+        return mask
+
+    def _name_category_flags(self, names: pd.Series) -> Dict[int, np.ndarray]:
+        """Boolean membership array per name category for a Series of lowercased names"""
+        if self._NAME_AUTOMATON is None:
+            return {
+                category: names.str.contains(pattern.pattern, regex=True).to_numpy()
+                for category, pattern in self._NAME_PATTERN_RES.items()
+            }
+
+        masks = np.fromiter((self._name_categories(name) for name in names), dtype=np.int64, count=len(names))
+        return {category: (masks & category) != 0 for category in self._NAME_PATTERN_RES}
+
+    @staticmethod
+    def _base_type(type_lower: str) -> str:
+        """Data type without parameters, e.g. 'decimal(10,2)' -> 'decimal'"""
+        return type_lower.split("(", 1)[0].strip()
 
     def _is_numeric_type(self, data_type: str) -> bool:
         """Check if numeric"""
-        return any(t in data_type for t in self.NUMERIC_TYPES)
+        if self._base_type(data_type) in self.NUMERIC_TYPE_SET:
+            return True
+        return self._NUMERIC_TYPE_RE.search(data_type) is not None
+
+    def _type_flags(self, type_lower: str) -> int:
+        """TIMESTAMP or NUMERIC bit for a lowercased data type (timestamp wins)"""
+        # Canonical types resolve with one set lookup; anything else (arrays,
+        # rows, 'timestamp(3) with time zone', ...) falls back to the substring scan
+        base_type = self._base_type(type_lower)
+        if base_type in self.TIMESTAMP_TYPE_SET:
+            return TIMESTAMP
+        if base_type in self.NUMERIC_TYPE_SET:
+            return NUMERIC
+
+        if self._TIMESTAMP_TYPE_RE.search(type_lower):
+            return TIMESTAMP
+        if self._NUMERIC_TYPE_RE.search(type_lower):
+            return NUMERIC
+        return 0
 
 
 # Global instance
@@ -2,88 +2,223 @@
 DynamoDB service for storing and retrieving metadata
 """
 
-from datetime import date, datetime
-from decimal import Decimal
-from typing import Any, Dict, List, Optional
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional
 
 import boto3
-import numpy as np
-import pandas as pd
-from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.conditions import Attr
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from app.config import settings
 from app.models import (
     ColumnMetadata,
     EnrichmentStatus,
+    EnrichmentStatusT,
     NeptuneImportStatus,
-    RelationshipDetectionStatus,
+    NeptuneImportStatusT,
+    RelationshipDetectionStatusT,
     SchemaChange,
     SchemaStatus,
+    SchemaStatusT,
     TableMetadata,
     TableSummary,
     TableWithColumns,
+    get_list_adapter,
 )
+from app.services._dynamodb_convert import (
+    _convert_decimals_in_place,
+    _convert_floats_to_decimal,
+    _from_attribute_values,
+    _to_attribute_value,
+    _to_attribute_values,
+)
+from app.utils.cache import TTLCache
 from app.utils.logger import app_logger as logger
 
 
-def _convert_floats_to_decimal(obj):
+# Optional table_metadata attributes written by save_table_metadata only when set
+_OPTIONAL_TIMESTAMP_FIELDS = (
+    "schema_change_detected_at",
+    "enrichment_timestamp",
+    "relationship_timestamp",
+    "neptune_import_timestamp",
+)
+_OPTIONAL_ERROR_FIELDS = ("enrichment_error", "relationship_error", "neptune_import_error")
+
+
+@lru_cache(maxsize=1024)
+def _cached_isoformat(value: datetime, tzinfo: Any) -> str:
+    return value.isoformat()
+
+
+def _timestamp_iso(value: datetime) -> str:
     """
-    Convert Python types to DynamoDB-compatible types
-    - float -> Decimal
-    - Timestamp/datetime/date -> ISO string
-    - NaN/None -> None
-    - numpy types -> Python types
+    value.isoformat(), memoized so re-saving the same metadata reuses strings
+
+    tzinfo is part of the key: equal instants in different zones compare
+    (and hash) equal but format differently.
     """
-    # Handle None and NaN
-    if obj is None:
-        return None
-    if isinstance(obj, float) and (np.isnan(obj) or np.isinf(obj)):
-        return None
-
-    # Handle numeric types
-    if isinstance(obj, float):
-        return Decimal(str(obj))
-    if isinstance(obj, (np.integer, np.floating)):
-        if np.isnan(obj) or np.isinf(obj):
-            return None
-        return Decimal(str(float(obj))) if isinstance(obj, np.floating) else int(obj)
-
-    # Handle datetime types
-    if isinstance(obj, (pd.Timestamp, datetime, date)):
-        return obj.isoformat()
-
-    # Handle collections recursively
-    if isinstance(obj, dict):
-        return {k: _convert_floats_to_decimal(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [_convert_floats_to_decimal(i) for i in obj]
-    if isinstance(obj, tuple):
-        return tuple(_convert_floats_to_decimal(i) for i in obj)
-
-    # Handle numpy/pandas specific types
-    if isinstance(obj, (np.bool_, bool)):
-        return bool(obj)
-    if isinstance(obj, (np.str_, str)):
-        return str(obj)
-
-    # Return as-is for other types (str, int, bool, etc.)
-    return obj
-
-
-def _convert_decimals_to_python(obj):
-    """Convert Decimal objects back to Python int/float"""
-    if isinstance(obj, list):
-        return [_convert_decimals_to_python(item) for item in obj]
-    elif isinstance(obj, dict):
-        return {key: _convert_decimals_to_python(value) for key, value in obj.items()}
-    elif isinstance(obj, Decimal):
-        if obj % 1 == 0:
-            return int(obj)
-        else:
-            return float(obj)
-    else:
-        return obj
+    return _cached_isoformat(value, value.tzinfo)
+
+
+def _item_to_column_metadata(item: dict) -> ColumnMetadata:
+    """
+    Build ColumnMetadata from a column_metadata item (Decimals already converted)
+
+    Shared by every column read path. Pydantic models only take keyword
+    arguments, so the saving is in the lookups: one bound item.get and a
+    single semantic_type read.
+    """
+    get = item.get
+    return ColumnMetadata(
+        catalog_schema_table=item["catalog_schema_table"],
+        column_name=item["column_name"],
+        data_type=item["data_type"],
+        column_type=get("column_type", "dimension"),
+        semantic_type=get("semantic_type") or None,
+        aliases=get("aliases", []),
+        description=get("description", ""),
+        min_value=get("min_value"),
+        max_value=get("max_value"),
+        avg_value=get("avg_value"),
+        cardinality=get("cardinality", 0),
+        null_count=get("null_count", 0),
+        null_percentage=get("null_percentage", 0.0),
+        sample_values=get("sample_values", []),
+    )
+
+
+def _column_projection_kwargs(projection: List[str]) -> Dict[str, Any]:
+    """
+    ProjectionExpression arguments for a column_metadata read
+
+    Attribute names go through placeholders (several, e.g. "data_type", are
+    not safe to use bare), and the attributes _item_to_column_metadata
+    requires are always included.
+    """
+    names = list(dict.fromkeys([*COLUMN_REQUIRED_ATTRIBUTES, *projection]))
+    return {
+        "ProjectionExpression": ", ".join(f"#p{i}" for i in range(len(names))),
+        "ExpressionAttributeNames": {f"#p{i}": name for i, name in enumerate(names)},
+    }
+
+
+def _item_to_table_column(item: dict) -> dict:
+    """
+    TableWithColumns.columns entry for a column_metadata item
+
+    Same defaults as _item_to_column_metadata, without the key fields.
+    """
+    get = item.get
+    return {
+        "data_type": item["data_type"],
+        "column_type": get("column_type", "dimension"),
+        "semantic_type": get("semantic_type") or None,
+        "aliases": get("aliases", []),
+        "description": get("description", ""),
+        "min_value": get("min_value"),
+        "max_value": get("max_value"),
+        "avg_value": get("avg_value"),
+        "cardinality": get("cardinality", 0),
+        "null_count": get("null_count", 0),
+        "null_percentage": get("null_percentage", 0.0),
+        "sample_values": get("sample_values", []),
+    }
+
+
+def _table_summary_row(item: dict) -> dict:
+    """
+    TableSummary input for an item scanned with TABLE_SUMMARY_PROJECTION
+
+    Status values are plain strings (the status classes are constant
+    namespaces, not Enums) and ISO timestamps are parsed once by the
+    UtcDatetime validator, so rows carry the stored values unchanged.
+    """
+    catalog_schema_table = item["catalog_schema_table"]
+    return {
+        # Just the table name for display (last part after final dot)
+        "name": catalog_schema_table.split(".")[-1],
+        "catalog_schema_table": catalog_schema_table,
+        "schema_status": item.get("schema_status", "CURRENT"),
+        "last_updated": item["last_updated"],
+        "row_count": int(item.get("row_count", 0)),
+        "column_count": int(item.get("column_count", 0)),
+        "enrichment_status": item.get("enrichment_status", "not_started"),
+        "relationship_detection_status": item.get(
+            "relationship_detection_status", "not_started"
+        ),
+        "neptune_import_status": item.get("neptune_import_status", "not_imported"),
+        "neptune_last_imported": item.get("neptune_last_imported") or None,
+        "relationships_status": item.get("relationships_status") or None,
+        "relationships_count": int(item.get("relationships_count", 0)),
+        "search_mode": item.get("search_mode"),
+        "custom_instructions": item.get("custom_instructions"),
+    }
+
+
+def _item_to_table_metadata(item: dict) -> TableMetadata:
+    """
+    Build TableMetadata from a table_metadata item
+
+    Args:
+        item: Item with Decimals already converted to Python numbers
+
+    Returns:
+        TableMetadata instance (the item was written by save_table_metadata,
+        so validation is skipped)
+    """
+    return TableMetadata.from_trusted_dynamo(item)
+
+
+def _parse_table_items(items: List[dict]) -> List[TableMetadata]:
+    """Parse already-scanned table_metadata items, skipping any that fail"""
+    tables = []
+    for item in items:
+        try:
+            tables.append(_item_to_table_metadata(item))
+        except Exception as e:
+            logger.error(
+                f"Failed to parse table metadata for {item.get('catalog_schema_table')}: {e}"
+            )
+    return tables
+
+
+# batch_get_item limits: keys per request, concurrent requests, and
+# UnprocessedKeys resubmissions (backoff doubles from the initial delay)
+BATCH_GET_MAX_KEYS = 100
+BATCH_GET_MAX_WORKERS = 8
+BATCH_GET_MAX_RETRIES = 5
+BATCH_GET_RETRY_INITIAL_DELAY = 0.05
+
+# column_metadata attributes every projected read must include (the key and
+# the fields ColumnMetadata has no default for), and the projection for
+# callers that only compare schemas
+COLUMN_REQUIRED_ATTRIBUTES = ("catalog_schema_table", "column_name", "data_type")
+COLUMN_SCHEMA_PROJECTION = ["column_name", "data_type"]
+
+# Attributes read by get_all_tables (TableSummary fields)
+TABLE_SUMMARY_PROJECTION = ", ".join([
+    "catalog_schema_table",
+    "schema_status",
+    "last_updated",
+    "row_count",
+    "column_count",
+    "enrichment_status",
+    "relationship_detection_status",
+    "neptune_import_status",
+    "neptune_last_imported",
+    "relationships_status",
+    "relationships_count",
+    "search_mode",
+    "custom_instructions",
+])
 
 
 class DynamoDBService:
@@ -105,9 +240,17 @@ class DynamoDBService:
             if settings.aws_session_token:
                 session_kwargs["aws_session_token"] = settings.aws_session_token
 
-        # Create session and resource
+        # Create session and resource. The default pool of 10 connections is
+        # smaller than the parallel scan segments plus batch-get workers, which
+        # makes urllib3 discard and reopen TLS connections under load; size it
+        # for that fan-out and keep idle sockets alive between requests
+        client_config = Config(
+            max_pool_connections=settings.dynamodb_max_pool_connections,
+            tcp_keepalive=True,
+            retries={"mode": "standard", "total_max_attempts": settings.dynamodb_max_attempts},
+        )
         self.session = boto3.Session(**session_kwargs)
-        self.dynamodb = self.session.resource("dynamodb")
+        self.dynamodb = self.session.resource("dynamodb", config=client_config)
 
         self.table_metadata_table = self.dynamodb.Table(
             settings.dynamodb_table_metadata_table
@@ -116,57 +259,252 @@ class DynamoDBService:
             settings.dynamodb_column_metadata_table
         )
 
+        # Plain low-level client for the fixed-shape table_metadata writes
+        # and the column reads, skipping the Resource layer's Decimal
+        # round-trip and response wrapping. It must be a separate client:
+        # the resource registers its type (de)serializers on its own
+        # meta.client, which would re-wrap AttributeValue dicts
+        self.client = self.session.client("dynamodb", config=client_config)
+
+        # Column metadata reads go through DAX when a cluster is configured;
+        # every write (and the table_metadata reads behind read-modify-write
+        # status updates) stays on DynamoDB
+        self.read_client = self._dax_client() or self.client
+        self.table_metadata_table_name = settings.dynamodb_table_metadata_table
+        self.column_metadata_table_name = settings.dynamodb_column_metadata_table
+
+        # Relationship detection status, polled by the UI while detection runs,
+        # and per-table column reads repeated during query planning. Entries
+        # are dropped by invalidate_table on every write made through this
+        # service; the TTLs bound staleness from other processes.
+        self._status_cache = TTLCache(
+            maxsize=1024, ttl_seconds=settings.dynamodb_status_cache_ttl_seconds
+        )
+        self._columns_cache = TTLCache(
+            maxsize=1024, ttl_seconds=settings.dynamodb_columns_cache_ttl_seconds
+        )
+        self._table_with_columns_cache = TTLCache(
+            maxsize=1024, ttl_seconds=settings.dynamodb_columns_cache_ttl_seconds
+        )
+        # Bumped by every table write; callers caching table listings key on it
+        self.tables_version = 0
+
         logger.info("DynamoDB service initialized")
 
+    def _dax_client(self):
+        """
+        DAX client for settings.dynamodb_dax_endpoint, or None
+
+        The DAX client speaks the low-level AttributeValue form, so it drops
+        in for self.client on reads. Writes bypass it, so DAX's item and
+        query caches are not refreshed by them: staleness is bounded by the
+        cluster's TTLs, which should be kept close to
+        settings.dynamodb_columns_cache_ttl_seconds.
+        """
+        endpoint = settings.dynamodb_dax_endpoint
+        if not endpoint:
+            return None
+        try:
+            from amazondax import AmazonDaxClient
+        except ImportError:
+            logger.warning("amazon-dax-client not available. Column metadata reads will go to DynamoDB.")
+            return None
+
+        try:
+            client = AmazonDaxClient(
+                session=self.session,
+                region_name=settings.aws_region,
+                endpoint_url=endpoint,
+            )
+        except Exception as e:
+            logger.warning(f"DAX client for {endpoint} failed, reading from DynamoDB: {e}")
+            return None
+        logger.info(f"Column metadata reads routed through DAX at {endpoint}")
+        return client
+
+    def invalidate_table(self, catalog_schema_table: str) -> None:
+        """Drop every cached read for a table (call after writing it)"""
+        self._status_cache.pop(catalog_schema_table)
+        self._columns_cache.pop(catalog_schema_table)
+        self._table_with_columns_cache.pop(catalog_schema_table)
+        self.tables_version += 1
+
+    def _update_table_metadata(
+        self,
+        catalog_schema_table: str,
+        update_expr: str,
+        expr_values: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """UpdateItem on one table_metadata row through the low-level client"""
+        kwargs = {
+            "TableName": self.table_metadata_table_name,
+            "Key": {"catalog_schema_table": {"S": catalog_schema_table}},
+            "UpdateExpression": update_expr,
+        }
+        if expr_values:
+            kwargs["ExpressionAttributeValues"] = _to_attribute_values(expr_values)
+        self.client.update_item(**kwargs)
+        self.invalidate_table(catalog_schema_table)
+
+    def _scan_pages(self, table, segments: Optional[int] = None, **kwargs) -> Iterator[List[dict]]:
+        """
+        Yield a table's scan pages, fetched by concurrent segment scans
+
+        Each segment is paged to completion on its own thread, so wall time is
+        roughly one segment's pages rather than every page in sequence. Pages
+        are handed over through a small bounded queue and yielded in arrival
+        order, so only a few raw pages are held at once.
+
+        Args:
+            table: DynamoDB Table resource
+            segments: Number of parallel segments (default settings.dynamodb_scan_segments)
+            **kwargs: Extra scan arguments (FilterExpression, ProjectionExpression, ...)
+
+        Yields:
+            Raw items of one scan page
+        """
+        segments = max(1, segments or settings.dynamodb_scan_segments)
+
+        if segments == 1:
+            response = table.scan(**kwargs)
+            yield response.get("Items", [])
+            while "LastEvaluatedKey" in response:
+                response = table.scan(ExclusiveStartKey=response["LastEvaluatedKey"], **kwargs)
+                yield response.get("Items", [])
+            return
+
+        pages: "queue.Queue[Any]" = queue.Queue(maxsize=2 * segments)
+        stop = threading.Event()  # set once the consumer finishes or gives up
+
+        def put(entry: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    pages.put(entry, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def scan_segment(segment: int) -> None:
+            segment_kwargs = dict(kwargs, TotalSegments=segments, Segment=segment)
+            try:
+                response = table.scan(**segment_kwargs)
+                while put(response.get("Items", [])) and "LastEvaluatedKey" in response:
+                    response = table.scan(
+                        ExclusiveStartKey=response["LastEvaluatedKey"], **segment_kwargs
+                    )
+            except Exception as e:
+                put(e)
+            finally:
+                put(None)  # segment done
+
+        with ThreadPoolExecutor(max_workers=segments, thread_name_prefix="dynamodb-scan") as executor:
+            for segment in range(segments):
+                executor.submit(scan_segment, segment)
+            try:
+                remaining = segments
+                while remaining:
+                    entry = pages.get()
+                    if entry is None:
+                        remaining -= 1
+                    elif isinstance(entry, Exception):
+                        raise entry
+                    else:
+                        yield entry
+            finally:
+                stop.set()
+
+    def _query_pages(self, table, **kwargs) -> Iterator[List[dict]]:
+        """
+        Yield a query's result pages, prefetching the next page
+
+        A query can't be split into segments, so pages still follow
+        LastEvaluatedKey in order, but each next page is requested on a
+        background thread as soon as its start key is known. The consumer's
+        work on the current page (item conversion, model building)
+        overlaps the round-trip for the next one. Single-page results never
+        start a thread.
+
+        Args:
+            table: DynamoDB Table resource, or the low-level client (then
+                pass TableName, and pages hold AttributeValue items)
+            **kwargs: Query arguments (KeyConditionExpression, ProjectionExpression, ...)
+
+        Yields:
+            Raw items of one query page
+        """
+        response = table.query(**kwargs)
+        if "LastEvaluatedKey" not in response:
+            yield response.get("Items", [])
+            return
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="dynamodb-query") as executor:
+            while True:
+                items = response.get("Items", [])
+                last_key = response.get("LastEvaluatedKey")
+                if last_key is None:
+                    yield items
+                    return
+                next_page = executor.submit(table.query, ExclusiveStartKey=last_key, **kwargs)
+                try:
+                    yield items
+                finally:
+                    # Reached on normal resumption and when the consumer stops
+                    # early; the in-flight request must finish either way
+                    response = next_page.result()
+
+    def _parallel_scan(self, table, segments: Optional[int] = None, **kwargs) -> List[dict]:
+        """
+        Scan a whole table with concurrent segment scans (see _scan_pages)
+
+        Returns:
+            Raw items from all segments
+        """
+        return [item for page in self._scan_pages(table, segments, **kwargs) for item in page]
+
     # ========== Table Metadata Operations ==========
 
     def save_table_metadata(self, table_metadata: TableMetadata) -> bool:
         """Save table metadata to DynamoDB"""
         try:
+            # Built directly in low-level attribute-value form: one dict per
+            # save, no intermediate Python-typed item to walk afterwards
             item = {
-                "catalog_schema_table": table_metadata.catalog_schema_table,  # CHANGED
-                "last_updated": table_metadata.last_updated.isoformat(),
-                "row_count": table_metadata.row_count,
-                "column_count": table_metadata.column_count,
-                "schema_status": table_metadata.schema_status.value,
-                "enrichment_status": table_metadata.enrichment_status.value,
-                "relationship_detection_status": table_metadata.relationship_detection_status.value,
-                "neptune_import_status": table_metadata.neptune_import_status.value,
-                "enrichment_retry_count": table_metadata.enrichment_retry_count,
-                "relationship_retry_count": table_metadata.relationship_retry_count,
-                "neptune_retry_count": table_metadata.neptune_retry_count,
+                "catalog_schema_table": {"S": table_metadata.catalog_schema_table},  # CHANGED
+                "last_updated": {"S": _timestamp_iso(table_metadata.last_updated)},
+                "row_count": {"N": str(table_metadata.row_count)},
+                "column_count": {"N": str(table_metadata.column_count)},
+                "schema_status": {"S": table_metadata.schema_status},
+                "enrichment_status": {"S": table_metadata.enrichment_status},
+                "relationship_detection_status": {"S": table_metadata.relationship_detection_status},
+                "neptune_import_status": {"S": table_metadata.neptune_import_status},
+                "enrichment_retry_count": {"N": str(table_metadata.enrichment_retry_count)},
+                "relationship_retry_count": {"N": str(table_metadata.relationship_retry_count)},
+                "neptune_retry_count": {"N": str(table_metadata.neptune_retry_count)},
             }
 
-            if table_metadata.schema_change_detected_at:
-                item["schema_change_detected_at"] = (
-                    table_metadata.schema_change_detected_at.isoformat()
-                )
-
             if table_metadata.schema_changes:
-                item["schema_changes"] = {
+                item["schema_changes"] = _to_attribute_value({
                     "new_columns": table_metadata.schema_changes.new_columns,
                     "removed_columns": table_metadata.schema_changes.removed_columns,
                     "type_changes": table_metadata.schema_changes.type_changes,
-                }
-
-            # Add timestamps if present
-            if table_metadata.enrichment_timestamp:
-                item["enrichment_timestamp"] = table_metadata.enrichment_timestamp.isoformat()
-            if table_metadata.relationship_timestamp:
-                item["relationship_timestamp"] = table_metadata.relationship_timestamp.isoformat()
-            if table_metadata.neptune_import_timestamp:
-                item["neptune_import_timestamp"] = table_metadata.neptune_import_timestamp.isoformat()
-
-            # Add error messages if present
-            if table_metadata.enrichment_error:
-                item["enrichment_error"] = table_metadata.enrichment_error
-            if table_metadata.relationship_error:
-                item["relationship_error"] = table_metadata.relationship_error
-            if table_metadata.neptune_import_error:
-                item["neptune_import_error"] = table_metadata.neptune_import_error
-
-            item = _convert_floats_to_decimal(item)
-            self.table_metadata_table.put_item(Item=item)
+                })
+
+            # Timestamps and error messages only when present
+            for field_name in _OPTIONAL_TIMESTAMP_FIELDS:
+                value = getattr(table_metadata, field_name)
+                if value:
+                    item[field_name] = {"S": _timestamp_iso(value)}
+            for field_name in _OPTIONAL_ERROR_FIELDS:
+                value = getattr(table_metadata, field_name)
+                if value:
+                    item[field_name] = {"S": value}
+
+            self.client.put_item(
+                TableName=self.table_metadata_table_name,
+                Item=item,
+            )
+            self.invalidate_table(table_metadata.catalog_schema_table)
             logger.info(
                 f"Saved table metadata for {table_metadata.catalog_schema_table}"
             )
@@ -179,7 +517,13 @@ class DynamoDBService:
             return False
 
     def get_table_metadata(self, catalog_schema_table: str) -> Optional[TableMetadata]:
-        """Get table metadata from DynamoDB"""
+        """
+        Get table metadata from DynamoDB
+
+        GetItem, one _convert_decimals_in_place pass, then
+        _item_to_table_metadata. Scan-based listings call the latter directly
+        on their already-converted items rather than coming back through here.
+        """
         try:
             response = self.table_metadata_table.get_item(
                 Key={"catalog_schema_table": catalog_schema_table}  # CHANGED
@@ -189,61 +533,8 @@ class DynamoDBService:
                 logger.warning(f"No metadata found for table {catalog_schema_table}")
                 return None
 
-            item = _convert_decimals_to_python(response["Item"])
-
-            # Parse schema changes if present
-            schema_changes = None
-            if "schema_changes" in item:
-                schema_changes = SchemaChange(**item["schema_changes"])
-
-            # Parse datetime fields
-            last_updated = datetime.fromisoformat(item["last_updated"])
-            schema_change_detected_at = None
-            if "schema_change_detected_at" in item:
-                schema_change_detected_at = datetime.fromisoformat(
-                    item["schema_change_detected_at"]
-                )
-
-            # Parse timestamps
-            enrichment_timestamp = None
-            if "enrichment_timestamp" in item:
-                enrichment_timestamp = datetime.fromisoformat(item["enrichment_timestamp"])
-            relationship_timestamp = None
-            if "relationship_timestamp" in item:
-                relationship_timestamp = datetime.fromisoformat(item["relationship_timestamp"])
-            neptune_import_timestamp = None
-            if "neptune_import_timestamp" in item:
-                neptune_import_timestamp = datetime.fromisoformat(item["neptune_import_timestamp"])
-
-            table_metadata = TableMetadata(
-                catalog_schema_table=item["catalog_schema_table"],  # CHANGED
-                last_updated=last_updated,
-                row_count=item.get("row_count", 0),
-                column_count=item.get("column_count", 0),
-                schema_status=SchemaStatus(item.get("schema_status", "CURRENT")),
-                schema_change_detected_at=schema_change_detected_at,
-                schema_changes=schema_changes,
-                enrichment_status=EnrichmentStatus(
-                    item.get("enrichment_status", "not_started")
-                ),
-                relationship_detection_status=RelationshipDetectionStatus(
-                    item.get("relationship_detection_status", "not_started")
-                ),
-                neptune_import_status=NeptuneImportStatus(
-                    item.get("neptune_import_status", "not_imported")
-                ),
-                enrichment_timestamp=enrichment_timestamp,
-                relationship_timestamp=relationship_timestamp,
-                neptune_import_timestamp=neptune_import_timestamp,
-                enrichment_retry_count=item.get("enrichment_retry_count", 0),
-                relationship_retry_count=item.get("relationship_retry_count", 0),
-                neptune_retry_count=item.get("neptune_retry_count", 0),
-                enrichment_error=item.get("enrichment_error"),
-                relationship_error=item.get("relationship_error"),
-                neptune_import_error=item.get("neptune_import_error"),
-                search_mode=item.get("search_mode"),
-                custom_instructions=item.get("custom_instructions"),
-            )
+            item = _convert_decimals_in_place(response["Item"])
+            table_metadata = _item_to_table_metadata(item)
 
             logger.info(f"Retrieved table metadata for {catalog_schema_table}")
             return table_metadata
@@ -263,23 +554,10 @@ class DynamoDBService:
         """
         try:
             # Scan the table_metadata table to get all tables
-            response = self.table_metadata_table.scan(
-                ProjectionExpression="catalog_schema_table"
+            items = self._parallel_scan(
+                self.table_metadata_table, ProjectionExpression="catalog_schema_table"
             )
-
-            table_identifiers = [
-                item["catalog_schema_table"] for item in response.get("Items", [])
-            ]
-
-            # Handle pagination if there are many tables
-            while "LastEvaluatedKey" in response:
-                response = self.table_metadata_table.scan(
-                    ProjectionExpression="catalog_schema_table",
-                    ExclusiveStartKey=response["LastEvaluatedKey"],
-                )
-                table_identifiers.extend(
-                    [item["catalog_schema_table"] for item in response.get("Items", [])]
-                )
+            table_identifiers = [item["catalog_schema_table"] for item in items]
 
             logger.info(f"Found {len(table_identifiers)} tables with metadata")
             return table_identifiers
@@ -288,51 +566,29 @@ class DynamoDBService:
             logger.error(f"Failed to get all table identifiers: {e}")
             return []
 
+    def iter_all_tables(self) -> Iterator[TableSummary]:
+        """
+        Stream all tables from DynamoDB, one scan page at a time
+
+        Only the current page's items and summaries are alive at once, so
+        callers that don't need a list avoid materializing every table.
+        Errors propagate to the caller.
+
+        Yields:
+            TableSummary per stored table
+        """
+        adapter = get_list_adapter(TableSummary)
+        # Only the TableSummary attributes; the counts are the only numbers
+        for page in self._scan_pages(
+            self.table_metadata_table, ProjectionExpression=TABLE_SUMMARY_PROJECTION
+        ):
+            # Validate each page in one call through the shared adapter
+            yield from adapter.validate_python([_table_summary_row(item) for item in page])
+
     def get_all_tables(self) -> List[TableSummary]:
         """Get all tables from DynamoDB"""
         try:
-            response = self.table_metadata_table.scan()
-            items = _convert_decimals_to_python(response.get("Items", []))
-
-            # Handle pagination
-            while "LastEvaluatedKey" in response:
-                response = self.table_metadata_table.scan(
-                    ExclusiveStartKey=response["LastEvaluatedKey"]
-                )
-                items.extend(_convert_decimals_to_python(response.get("Items", [])))
-
-            tables = []
-            for item in items:
-                catalog_schema_table = item["catalog_schema_table"]
-                # Extract just table name for display (last part after final dot)
-                table_name = catalog_schema_table.split(".")[-1]
-
-                tables.append(
-                    TableSummary(
-                        name=table_name,
-                        catalog_schema_table=catalog_schema_table,
-                        schema_status=SchemaStatus(
-                            item.get("schema_status", "CURRENT")
-                        ),
-                        last_updated=datetime.fromisoformat(item["last_updated"]),
-                        row_count=item.get("row_count", 0),
-                        column_count=item.get("column_count", 0),
-                        enrichment_status=EnrichmentStatus(
-                            item.get("enrichment_status", "not_started")
-                        ),
-                        relationship_detection_status=RelationshipDetectionStatus(
-                            item.get("relationship_detection_status", "not_started")
-                        ),
-                        neptune_import_status=NeptuneImportStatus(
-                            item.get("neptune_import_status", "not_imported")
-                        ),
-                        neptune_last_imported=datetime.fromisoformat(item["neptune_last_imported"]) if item.get("neptune_last_imported") else None,
-                        relationships_status=RelationshipDetectionStatus(item["relationships_status"]) if item.get("relationships_status") else None,
-                        relationships_count=item.get("relationships_count", 0),
-                        search_mode=item.get("search_mode"),
-                        custom_instructions=item.get("custom_instructions"),
-                    )
-                )
+            tables = list(self.iter_all_tables())
 
             logger.info(f"Retrieved {len(tables)} tables from DynamoDB")
             return tables
@@ -344,17 +600,19 @@ class DynamoDBService:
     def update_table_schema_status(
         self,
         catalog_schema_table: str,  # CHANGED
-        status: SchemaStatus,
+        status: SchemaStatusT,
         schema_changes: Optional[SchemaChange] = None,
     ) -> bool:
         """Update schema status for a table"""
         try:
             update_expr = "SET schema_status = :status"
-            expr_values = {":status": status.value}
+            expr_values = {":status": status}
 
             if status == SchemaStatus.SCHEMA_CHANGED and schema_changes:
                 update_expr += ", schema_change_detected_at = :detected_at, schema_changes = :changes"
-                expr_values[":detected_at"] = datetime.now().isoformat()
+                expr_values[":detected_at"] = datetime.now(timezone.utc).isoformat()
+                # SchemaChange holds only strings (column names and type
+                # names), so the values need no Decimal conversion pass
                 expr_values[":changes"] = {
                     "new_columns": schema_changes.new_columns,
                     "removed_columns": schema_changes.removed_columns,
@@ -363,16 +621,10 @@ class DynamoDBService:
             elif status == SchemaStatus.CURRENT:
                 update_expr += " REMOVE schema_change_detected_at, schema_changes"
 
-            expr_values = _convert_floats_to_decimal(expr_values)
-
-            self.table_metadata_table.update_item(
-                Key={"catalog_schema_table": catalog_schema_table},  # CHANGED
-                UpdateExpression=update_expr,
-                ExpressionAttributeValues=expr_values,
-            )
+            self._update_table_metadata(catalog_schema_table, update_expr, expr_values)
 
             logger.info(
-                f"Updated schema status for {catalog_schema_table} to {status.value}"
+                f"Updated schema status for {catalog_schema_table} to {status}"
             )
             return True
 
@@ -385,7 +637,7 @@ class DynamoDBService:
     def update_relationship_detection_status(
         self,
         catalog_schema_table: str,
-        status: RelationshipDetectionStatus,
+        status: RelationshipDetectionStatusT,
     ) -> bool:
         """
         Update relationship detection status for a table
@@ -398,14 +650,14 @@ class DynamoDBService:
             True if successful, False otherwise
         """
         try:
-            self.table_metadata_table.update_item(
-                Key={"catalog_schema_table": catalog_schema_table},
-                UpdateExpression="SET relationship_detection_status = :status",
-                ExpressionAttributeValues={":status": status.value},
+            self._update_table_metadata(
+                catalog_schema_table,
+                "SET relationship_detection_status = :status",
+                {":status": status},
             )
 
             logger.info(
-                f"Updated relationship detection status for {catalog_schema_table} to {status.value}"
+                f"Updated relationship detection status for {catalog_schema_table} to {status}"
             )
             return True
 
@@ -416,17 +668,25 @@ class DynamoDBService:
             return False
 
     def get_relationship_detection_status(
-        self, catalog_schema_table: str
-    ) -> Optional[RelationshipDetectionStatus]:
+        self, catalog_schema_table: str, use_cache: bool = True
+    ) -> Optional[RelationshipDetectionStatusT]:
         """
         Get only the relationship detection status for a table (lightweight query)
 
         Args:
             catalog_schema_table: Table identifier in format "catalog.schema.table"
+            use_cache: Reuse a status read within the last
+                settings.dynamodb_status_cache_ttl_seconds
 
         Returns:
-            RelationshipDetectionStatus enum value, or None if not found
+            Relationship detection status string, or None if not found
         """
+        caching = use_cache and settings.dynamodb_status_cache_ttl_seconds > 0
+        if caching:
+            status = self._status_cache.get(catalog_schema_table)
+            if status is not None:
+                return status
+
         try:
             response = self.table_metadata_table.get_item(
                 Key={"catalog_schema_table": catalog_schema_table},
@@ -438,9 +698,10 @@ class DynamoDBService:
                 return None
 
             item = response["Item"]
-            status_value = item.get("relationship_detection_status", "not_started")
-
-            return RelationshipDetectionStatus(status_value)
+            status = item.get("relationship_detection_status", "not_started")
+            if caching:
+                self._status_cache.set(catalog_schema_table, status)
+            return status
 
         except Exception as e:
             logger.error(
@@ -451,7 +712,7 @@ class DynamoDBService:
     def update_enrichment_status(
         self,
         catalog_schema_table: str,
-        status: EnrichmentStatus,
+        status: EnrichmentStatusT,
         error_message: Optional[str] = None,
     ) -> bool:
         """
@@ -468,8 +729,8 @@ class DynamoDBService:
         try:
             update_expr = "SET enrichment_status = :status, enrichment_timestamp = :timestamp"
             expr_values = {
-                ":status": status.value,
-                ":timestamp": datetime.now().isoformat(),
+                ":status": status,
+                ":timestamp": datetime.now(timezone.utc).isoformat(),
             }
 
             if error_message:
@@ -479,14 +740,10 @@ class DynamoDBService:
                 # Clear error message on success
                 update_expr += " REMOVE enrichment_error"
 
-            self.table_metadata_table.update_item(
-                Key={"catalog_schema_table": catalog_schema_table},
-                UpdateExpression=update_expr,
-                ExpressionAttributeValues=expr_values,
-            )
+            self._update_table_metadata(catalog_schema_table, update_expr, expr_values)
 
             logger.info(
-                f"Updated enrichment status for {catalog_schema_table} to {status.value}"
+                f"Updated enrichment status for {catalog_schema_table} to {status}"
             )
             return True
 
@@ -499,7 +756,7 @@ class DynamoDBService:
     def update_neptune_import_status(
         self,
         catalog_schema_table: str,
-        status: NeptuneImportStatus,
+        status: NeptuneImportStatusT,
         error_message: Optional[str] = None,
     ) -> bool:
         """
@@ -516,8 +773,8 @@ class DynamoDBService:
         try:
             update_expr = "SET neptune_import_status = :status, neptune_import_timestamp = :timestamp"
             expr_values = {
-                ":status": status.value,
-                ":timestamp": datetime.now().isoformat(),
+                ":status": status,
+                ":timestamp": datetime.now(timezone.utc).isoformat(),
             }
 
             if error_message:
@@ -527,14 +784,10 @@ class DynamoDBService:
                 # Clear error message on success
                 update_expr += " REMOVE neptune_import_error"
 
-            self.table_metadata_table.update_item(
-                Key={"catalog_schema_table": catalog_schema_table},
-                UpdateExpression=update_expr,
-                ExpressionAttributeValues=expr_values,
-            )
+            self._update_table_metadata(catalog_schema_table, update_expr, expr_values)
 
             logger.info(
-                f"Updated Neptune import status for {catalog_schema_table} to {status.value}"
+                f"Updated Neptune import status for {catalog_schema_table} to {status}"
             )
             return True
 
@@ -567,10 +820,8 @@ class DynamoDBService:
             retry_field = f"{operation}_retry_count"
 
             # Use ADD to increment atomically
-            self.table_metadata_table.update_item(
-                Key={"catalog_schema_table": catalog_schema_table},
-                UpdateExpression=f"ADD {retry_field} :inc",
-                ExpressionAttributeValues={":inc": 1},
+            self._update_table_metadata(
+                catalog_schema_table, f"ADD {retry_field} :inc", {":inc": 1}
             )
 
             logger.info(
@@ -584,6 +835,60 @@ class DynamoDBService:
             )
             return False
 
+    def set_metadata_batch_id(
+        self, catalog_schema_table: str, batch_id: Optional[str]
+    ) -> bool:
+        """
+        Record (or clear) the pending Azure OpenAI batch job for a table's column metadata
+
+        Args:
+            catalog_schema_table: Full table identifier
+            batch_id: Batch job ID, or None to clear it once results are applied
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            if batch_id:
+                self._update_table_metadata(
+                    catalog_schema_table,
+                    "SET metadata_batch_id = :batch_id",
+                    {":batch_id": batch_id},
+                )
+            else:
+                self._update_table_metadata(catalog_schema_table, "REMOVE metadata_batch_id")
+
+            logger.info(f"Set metadata batch job for {catalog_schema_table} to {batch_id}")
+            return True
+
+        except Exception as e:
+            logger.error(
+                f"Failed to set metadata batch job for {catalog_schema_table}: {e}"
+            )
+            return False
+
+    def get_pending_metadata_batches(self) -> Dict[str, str]:
+        """
+        Get tables with a pending Azure OpenAI metadata batch job
+
+        Returns:
+            Dict of catalog_schema_table -> batch job ID
+        """
+        try:
+            scan_kwargs = {
+                "FilterExpression": Attr("metadata_batch_id").exists(),
+                "ProjectionExpression": "catalog_schema_table, metadata_batch_id",
+            }
+            items = self._parallel_scan(self.table_metadata_table, **scan_kwargs)
+
+            return {
+                item["catalog_schema_table"]: item["metadata_batch_id"] for item in items
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to get pending metadata batch jobs: {e}")
+            return {}
+
     def get_tables_ready_for_neptune_import(self) -> List[TableMetadata]:
         """
         Get tables that are ready for Neptune import
@@ -593,34 +898,24 @@ class DynamoDBService:
             List of TableMetadata objects ready for import
         """
         try:
-            # Scan for tables with the right status
+            # Status predicates are evaluated by DynamoDB so only matching
+            # items come back; a missing neptune_import_status means not_imported
             # Note: In production with many tables, consider using a GSI for efficient querying
-            response = self.table_metadata_table.scan()
-            items = _convert_decimals_to_python(response.get("Items", []))
+            neptune_status = Attr("neptune_import_status")
+            scan_kwargs = {
+                "FilterExpression": (
+                    Attr("enrichment_status").eq("completed")
+                    & Attr("relationship_detection_status").eq("completed")
+                    & (neptune_status.is_in(["not_imported", "failed"]) | neptune_status.not_exists())
+                ),
+            }
+            items = _convert_decimals_in_place(
+                self._parallel_scan(self.table_metadata_table, **scan_kwargs)
+            )
 
-            # Handle pagination
-            while "LastEvaluatedKey" in response:
-                response = self.table_metadata_table.scan(
-                    ExclusiveStartKey=response["LastEvaluatedKey"]
-                )
-                items.extend(_convert_decimals_to_python(response.get("Items", [])))
-
-            ready_tables = []
-            for item in items:
-                enrichment_status = item.get("enrichment_status", "not_started")
-                relationship_status = item.get("relationship_detection_status", "not_started")
-                neptune_status = item.get("neptune_import_status", "not_imported")
-
-                # Check if ready for import
-                if (
-                    enrichment_status == "completed"
-                    and relationship_status == "completed"
-                    and neptune_status in ["not_imported", "failed"]
-                ):
-                    # Parse the full metadata
-                    table_metadata = self.get_table_metadata(item["catalog_schema_table"])
-                    if table_metadata:
-                        ready_tables.append(table_metadata)
+            # Scan items are complete, so parse them directly instead of
+            # re-fetching each one with get_table_metadata
+            ready_tables = _parse_table_items(items)
 
             logger.info(f"Found {len(ready_tables)} tables ready for Neptune import")
             return ready_tables
@@ -648,26 +943,19 @@ class DynamoDBService:
             status_field = f"{operation}_status" if operation != "relationship" else "relationship_detection_status"
             retry_field = f"{operation}_retry_count"
 
-            response = self.table_metadata_table.scan()
-            items = _convert_decimals_to_python(response.get("Items", []))
-
-            # Handle pagination
-            while "LastEvaluatedKey" in response:
-                response = self.table_metadata_table.scan(
-                    ExclusiveStartKey=response["LastEvaluatedKey"]
-                )
-                items.extend(_convert_decimals_to_python(response.get("Items", [])))
-
-            retry_tables = []
-            for item in items:
-                status = item.get(status_field, "not_started")
-                retry_count = item.get(retry_field, 0)
+            # Failed and under the retry limit (a missing count means 0)
+            retry_count = Attr(retry_field)
+            scan_kwargs = {
+                "FilterExpression": (
+                    Attr(status_field).eq("failed")
+                    & (retry_count.lt(max_retries) | retry_count.not_exists())
+                ),
+            }
+            items = _convert_decimals_in_place(
+                self._parallel_scan(self.table_metadata_table, **scan_kwargs)
+            )
 
-                # Check if failed and under retry limit
-                if status == "failed" and retry_count < max_retries:
-                    table_metadata = self.get_table_metadata(item["catalog_schema_table"])
-                    if table_metadata:
-                        retry_tables.append(table_metadata)
+            retry_tables = _parse_table_items(items)
 
             logger.info(
                 f"Found {len(retry_tables)} tables needing retry for {operation}"
@@ -680,42 +968,45 @@ class DynamoDBService:
 
     # ========== Column Metadata Operations ==========
 
+    @staticmethod
+    def _column_metadata_item(column_metadata: ColumnMetadata) -> dict:
+        """DynamoDB item (floats already converted to Decimal) for a column"""
+        item = {
+            "catalog_schema_table": column_metadata.catalog_schema_table,  # CHANGED
+            "column_name": column_metadata.column_name,
+            "data_type": column_metadata.data_type,
+            "column_type": column_metadata.column_type,
+            "semantic_type": column_metadata.semantic_type
+            if column_metadata.semantic_type
+            else "",
+            "aliases": column_metadata.aliases,
+            "description": column_metadata.description,
+            "cardinality": column_metadata.cardinality,
+            "null_count": column_metadata.null_count,
+            "null_percentage": column_metadata.null_percentage,
+            "sample_values": column_metadata.sample_values,
+        }
+
+        # Only add numeric fields if they're not None
+        if column_metadata.min_value is not None:
+            item["min_value"] = column_metadata.min_value
+        if column_metadata.max_value is not None:
+            item["max_value"] = column_metadata.max_value
+        if column_metadata.avg_value is not None:
+            item["avg_value"] = column_metadata.avg_value
+
+        return _convert_floats_to_decimal(item)
+
     def save_column_metadata(self, column_metadata: ColumnMetadata) -> bool:
         """Save column metadata to DynamoDB"""
         try:
-            item = {
-                "catalog_schema_table": column_metadata.catalog_schema_table,  # CHANGED
-                "column_name": column_metadata.column_name,
-                "data_type": column_metadata.data_type,
-                "column_type": column_metadata.column_type,
-                "semantic_type": column_metadata.semantic_type
-                if column_metadata.semantic_type
-                else "",
-                "aliases": column_metadata.aliases,
-                "description": column_metadata.description,
-                "cardinality": column_metadata.cardinality,
-                "null_count": column_metadata.null_count,
-                "null_percentage": column_metadata.null_percentage,
-                "sample_values": column_metadata.sample_values,
-            }
-
-            # Only add numeric fields if they're not None
-            if column_metadata.min_value is not None:
-                item["min_value"] = column_metadata.min_value
-            if column_metadata.max_value is not None:
-                item["max_value"] = column_metadata.max_value
-            if column_metadata.avg_value is not None:
-                item["avg_value"] = column_metadata.avg_value
-
-            logger.info(
-                f"Before conversion - {column_metadata.column_name}: sample_values type = {type(column_metadata.sample_values)}"
-            )
-            item = _convert_floats_to_decimal(item)
+            item = self._column_metadata_item(column_metadata)
             logger.info(
                 f"After conversion - {column_metadata.column_name}: item keys = {list(item.keys())}"
             )
 
             self.column_metadata_table.put_item(Item=item)
+            self.invalidate_table(column_metadata.catalog_schema_table)
             logger.info(
                 f"✅ DynamoDB put_item succeeded for {column_metadata.column_name}"
             )
@@ -730,16 +1021,52 @@ class DynamoDBService:
             logger.error(f"Traceback: {traceback.format_exc()}")
             return False
 
+    def save_column_metadata_batch(self, columns: List[ColumnMetadata]) -> int:
+        """
+        Save many columns' metadata with batched writes
+
+        batch_writer sends up to 25 puts per BatchWriteItem request and
+        resubmits unprocessed items, instead of one PutItem round-trip per column.
+
+        Args:
+            columns: Column metadata to save
+
+        Returns:
+            Number of columns written (0 if the batch failed)
+        """
+        if not columns:
+            return 0
+        try:
+            with self.column_metadata_table.batch_writer(
+                overwrite_by_pkeys=["catalog_schema_table", "column_name"]
+            ) as batch:
+                for column_metadata in columns:
+                    batch.put_item(Item=self._column_metadata_item(column_metadata))
+            for catalog_schema_table in {column.catalog_schema_table for column in columns}:
+                self.invalidate_table(catalog_schema_table)
+
+            logger.info(
+                f"✅ Saved metadata for {len(columns)} columns of {columns[0].catalog_schema_table}"
+            )
+            return len(columns)
+
+        except Exception as e:
+            logger.error(
+                f"Failed to batch save column metadata for {columns[0].catalog_schema_table}: {e}"
+            )
+            return 0
+
     def get_column_metadata(
         self, catalog_schema_table: str, column_name: str
     ) -> Optional[ColumnMetadata]:
         """Get column metadata from DynamoDB"""
         try:
-            response = self.column_metadata_table.get_item(
+            response = self.read_client.get_item(
+                TableName=self.column_metadata_table_name,
                 Key={
-                    "catalog_schema_table": catalog_schema_table,  # CHANGED
-                    "column_name": column_name,
-                }
+                    "catalog_schema_table": {"S": catalog_schema_table},  # CHANGED
+                    "column_name": {"S": column_name},
+                },
             )
 
             if "Item" not in response:
@@ -748,26 +1075,9 @@ class DynamoDBService:
                 )
                 return None
 
-            item = _convert_decimals_to_python(response["Item"])
-
-            column_metadata = ColumnMetadata(
-                catalog_schema_table=item["catalog_schema_table"],
-                column_name=item["column_name"],
-                data_type=item["data_type"],
-                column_type=item.get("column_type", "dimension"),
-                semantic_type=item.get("semantic_type")
-                if item.get("semantic_type")
-                else None,
-                aliases=item.get("aliases", []),
-                description=item.get("description", ""),
-                min_value=item.get("min_value"),
-                max_value=item.get("max_value"),
-                avg_value=item.get("avg_value"),
-                cardinality=item.get("cardinality", 0),
-                null_count=item.get("null_count", 0),
-                null_percentage=item.get("null_percentage", 0.0),
-                sample_values=item.get("sample_values", []),
-            )
+            item = _from_attribute_values(response["Item"])
+
+            column_metadata = _item_to_column_metadata(item)
 
             logger.debug(
                 f"Retrieved column metadata for {catalog_schema_table}.{column_name}"
@@ -780,14 +1090,60 @@ class DynamoDBService:
             )
             return None
 
+    def _batch_get_column_chunk(
+        self, chunk: List[tuple[str, str]], projection: Optional[List[str]] = None
+    ) -> List[ColumnMetadata]:
+        """
+        One batch_get_item call (up to 100 keys), retrying UnprocessedKeys
+
+        Throttled keys are resubmitted with exponential backoff, up to
+        BATCH_GET_MAX_RETRIES times, then logged and dropped. UnprocessedKeys
+        echoes the projection, so retries fetch the same attributes.
+        """
+        table_name = self.column_metadata_table_name
+        request_items = {
+            table_name: {
+                'Keys': [
+                    {
+                        'catalog_schema_table': {'S': table},
+                        'column_name': {'S': column}
+                    }
+                    for table, column in chunk
+                ]
+            }
+        }
+        if projection:
+            request_items[table_name].update(_column_projection_kwargs(projection))
+
+        items = []
+        delay = BATCH_GET_RETRY_INITIAL_DELAY
+        for attempt in range(BATCH_GET_MAX_RETRIES + 1):
+            response = self.read_client.batch_get_item(RequestItems=request_items)
+            items.extend(response.get('Responses', {}).get(table_name, []))
+
+            request_items = response.get('UnprocessedKeys')
+            if not request_items:
+                break
+            if attempt < BATCH_GET_MAX_RETRIES:
+                time.sleep(delay)
+                delay *= 2
+        else:
+            unprocessed = len(request_items.get(table_name, {}).get('Keys', []))
+            logger.warning(f"Batch get left {unprocessed} column metadata keys unprocessed after retries")
+
+        return [_item_to_column_metadata(_from_attribute_values(item)) for item in items]
+
     def batch_get_column_metadata(
-        self, column_keys: List[tuple[str, str]]
+        self, column_keys: List[tuple[str, str]], projection: Optional[List[str]] = None
     ) -> List[ColumnMetadata]:
         """
         Batch get column metadata from DynamoDB
 
         Args:
             column_keys: List of (catalog_schema_table, column_name) tuples
+            projection: Attributes to fetch (COLUMN_REQUIRED_ATTRIBUTES are
+                always added); None fetches whole items. Fields left out get
+                their ColumnMetadata defaults.
 
         Returns:
             List of ColumnMetadata objects (may be fewer than requested if some don't exist)
@@ -796,54 +1152,24 @@ class DynamoDBService:
             if not column_keys:
                 return []
 
-            # DynamoDB batch_get_item supports up to 100 items
-            # Split into chunks if needed
-            results = []
-            chunk_size = 100
-
-            for i in range(0, len(column_keys), chunk_size):
-                chunk = column_keys[i:i + chunk_size]
-
-                # Build request items
-                keys = [
-                    {
-                        'catalog_schema_table': table,
-                        'column_name': column
-                    }
-                    for table, column in chunk
-                ]
-
-                response = self.dynamodb.batch_get_item(
-                    RequestItems={
-                        settings.dynamodb_column_metadata_table: {
-                            'Keys': keys
-                        }
-                    }
-                )
-
-                # Process results
-                items = _convert_decimals_to_python(
-                    response.get('Responses', {}).get(settings.dynamodb_column_metadata_table, [])
-                )
-
-                for item in items:
-                    column_metadata = ColumnMetadata(
-                        catalog_schema_table=item["catalog_schema_table"],
-                        column_name=item["column_name"],
-                        data_type=item["data_type"],
-                        column_type=item.get("column_type", "dimension"),
-                        semantic_type=item.get("semantic_type") if item.get("semantic_type") else None,
-                        aliases=item.get("aliases", []),
-                        description=item.get("description", ""),
-                        min_value=item.get("min_value"),
-                        max_value=item.get("max_value"),
-                        avg_value=item.get("avg_value"),
-                        cardinality=item.get("cardinality", 0),
-                        null_count=item.get("null_count", 0),
-                        null_percentage=item.get("null_percentage", 0.0),
-                        sample_values=item.get("sample_values", []),
-                    )
-                    results.append(column_metadata)
+            # DynamoDB batch_get_item supports up to 100 items; chunks are
+            # fetched concurrently and merged in chunk order
+            chunks = [
+                column_keys[i:i + BATCH_GET_MAX_KEYS]
+                for i in range(0, len(column_keys), BATCH_GET_MAX_KEYS)
+            ]
+            if len(chunks) == 1:
+                chunk_results = [self._batch_get_column_chunk(chunks[0], projection)]
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=min(BATCH_GET_MAX_WORKERS, len(chunks)),
+                    thread_name_prefix="dynamodb-batch-get",
+                ) as executor:
+                    chunk_results = list(executor.map(
+                        lambda chunk: self._batch_get_column_chunk(chunk, projection), chunks
+                    ))
+
+            results = [column for chunk in chunk_results for column in chunk]
 
             logger.info(f"Batch retrieved {len(results)} column metadata records")
             return results
@@ -852,62 +1178,77 @@ class DynamoDBService:
             logger.error(f"Failed to batch get column metadata: {e}")
             return []
 
-    def get_all_columns_for_table(
-        self, catalog_schema_table: str
-    ) -> List[ColumnMetadata]:
-        """Get metadata for all columns in a table"""
-        try:
-            response = self.column_metadata_table.query(
-                KeyConditionExpression=Key("catalog_schema_table").eq(
-                    catalog_schema_table
-                )  # CHANGED
-            )
+    def _get_all_columns_raw(
+        self,
+        catalog_schema_table: str,
+        use_cache: bool = True,
+        projection: Optional[List[str]] = None,
+    ) -> List[dict]:
+        """
+        Converted column_metadata items for a table (see get_all_columns_for_table)
 
-            items = _convert_decimals_to_python(response.get("Items", []))
+        A cache hit returns the cached list itself, so callers must not
+        mutate the items. Query/DAX errors propagate, so a failed read is
+        never cached or mistaken for a table without columns.
+        """
+        caching = use_cache and settings.dynamodb_columns_cache_ttl_seconds > 0
+        items = self._columns_cache.get(catalog_schema_table) if caching else None
+        if items is not None:
+            return items
+        caching = caching and not projection
+
+        query_kwargs = _column_projection_kwargs(projection) if projection else {}
+        # Pages are converted while the next one is being fetched
+        items = []
+        for page in self._query_pages(
+            self.read_client if use_cache else self.client,
+            TableName=self.column_metadata_table_name,
+            KeyConditionExpression="catalog_schema_table = :pk",  # CHANGED
+            ExpressionAttributeValues={":pk": {"S": catalog_schema_table}},
+            **query_kwargs,
+        ):
+            items.extend(_from_attribute_values(item) for item in page)
+
+        if caching:
+            self._columns_cache.set(catalog_schema_table, items)
+
+        logger.info(
+            f"Retrieved metadata for {len(items)} columns in {catalog_schema_table}"
+        )
+        return items
 
-            # Handle pagination
-            while "LastEvaluatedKey" in response:
-                response = self.column_metadata_table.query(
-                    KeyConditionExpression=Key("catalog_schema_table").eq(
-                        catalog_schema_table
-                    ),
-                    ExclusiveStartKey=response["LastEvaluatedKey"],
-                )
-                items.extend(_convert_decimals_to_python(response.get("Items", [])))
-
-            column_metadata_list = []
-            for item in items:
-                column_metadata_list.append(
-                    ColumnMetadata(
-                        catalog_schema_table=item["catalog_schema_table"],
-                        column_name=item["column_name"],
-                        data_type=item["data_type"],
-                        column_type=item.get("column_type", "dimension"),
-                        semantic_type=item.get("semantic_type")
-                        if item.get("semantic_type")
-                        else None,
-                        aliases=item.get("aliases", []),
-                        description=item.get("description", ""),
-                        min_value=item.get("min_value"),
-                        max_value=item.get("max_value"),
-                        avg_value=item.get("avg_value"),
-                        cardinality=item.get("cardinality", 0),
-                        null_count=item.get("null_count", 0),
-                        null_percentage=item.get("null_percentage", 0.0),
-                        sample_values=item.get("sample_values", []),
-                    )
-                )
+    def get_all_columns_for_table(
+        self,
+        catalog_schema_table: str,
+        use_cache: bool = True,
+        projection: Optional[List[str]] = None,
+    ) -> List[ColumnMetadata]:
+        """
+        Get metadata for all columns in a table
 
-            logger.info(
-                f"Retrieved metadata for {len(column_metadata_list)} columns in {catalog_schema_table}"
-            )
-            return column_metadata_list
+        Args:
+            catalog_schema_table: Full table identifier
+            use_cache: Reuse a read from the last
+                settings.dynamodb_columns_cache_ttl_seconds; the cache holds the
+                converted items, so every call gets fresh ColumnMetadata objects.
+                False also reads DynamoDB directly rather than through DAX.
+            projection: Attributes to fetch (e.g. COLUMN_SCHEMA_PROJECTION;
+                COLUMN_REQUIRED_ATTRIBUTES are always added), leaving large
+                fields like sample_values on the server; omitted fields get
+                their ColumnMetadata defaults. A cached full read is still
+                served as-is, and projected reads are not cached.
 
+        Returns:
+            List of ColumnMetadata objects
+        """
+        try:
+            items = self._get_all_columns_raw(catalog_schema_table, use_cache, projection)
         except Exception as e:
             logger.error(
                 f"Failed to get column metadata for table {catalog_schema_table}: {e}"
             )
             return []
+        return [_item_to_column_metadata(item) for item in items]
 
     def update_column_aliases(
         self, catalog_schema_table: str, column_name: str, aliases: List[str]
@@ -922,6 +1263,7 @@ class DynamoDBService:
                 UpdateExpression="SET aliases = :aliases",
                 ExpressionAttributeValues={":aliases": aliases},
             )
+            self.invalidate_table(catalog_schema_table)
 
             logger.info(f"Updated aliases for {catalog_schema_table}.{column_name}")
             return True
@@ -941,38 +1283,54 @@ class DynamoDBService:
         column_type: Optional[str] = None,
         semantic_type: Optional[str] = None,
     ) -> bool:
-        """Update multiple column metadata fields"""
+        """
+        Update multiple column metadata fields
+
+        The write is conditional on at least one field differing from what
+        is stored, so replaying identical values (e.g. re-running
+        enrichment) leaves the item, its stream and the caches alone; a
+        failed condition counts as success.
+        """
         try:
-            update_parts = []
-            expr_values = {}
+            fields = []  # (attribute, value placeholder, value)
 
             if aliases is not None:
-                update_parts.append("aliases = :aliases")
-                expr_values[":aliases"] = aliases
+                fields.append(("aliases", ":aliases", aliases))
 
             if description is not None:
-                update_parts.append("description = :desc")
-                expr_values[":desc"] = description
+                fields.append(("description", ":desc", description))
 
             if column_type is not None:
-                update_parts.append("column_type = :ctype")
-                expr_values[":ctype"] = column_type
+                fields.append(("column_type", ":ctype", column_type))
 
             if semantic_type is not None:
-                update_parts.append("semantic_type = :stype")
-                expr_values[":stype"] = semantic_type if semantic_type else ""
+                fields.append(("semantic_type", ":stype", semantic_type if semantic_type else ""))
 
-            if not update_parts:
+            if not fields:
                 return True
 
-            self.column_metadata_table.update_item(
-                Key={
-                    "catalog_schema_table": catalog_schema_table,
-                    "column_name": column_name,
-                },
-                UpdateExpression="SET " + ", ".join(update_parts),
-                ExpressionAttributeValues=expr_values,
-            )
+            try:
+                self.column_metadata_table.update_item(
+                    Key={
+                        "catalog_schema_table": catalog_schema_table,
+                        "column_name": column_name,
+                    },
+                    UpdateExpression="SET " + ", ".join(
+                        f"#{attribute} = {placeholder}" for attribute, placeholder, _ in fields
+                    ),
+                    ConditionExpression=" OR ".join(
+                        f"(attribute_not_exists(#{attribute}) OR #{attribute} <> {placeholder})"
+                        for attribute, placeholder, _ in fields
+                    ),
+                    ExpressionAttributeNames={f"#{attribute}": attribute for attribute, _, _ in fields},
+                    ExpressionAttributeValues={placeholder: value for _, placeholder, value in fields},
+                )
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                    raise
+                logger.debug(f"Metadata for {catalog_schema_table}.{column_name} already up to date")
+                return True
+            self.invalidate_table(catalog_schema_table)
 
             logger.info(f"Updated metadata for {catalog_schema_table}.{column_name}")
             return True
@@ -1020,6 +1378,7 @@ class DynamoDBService:
                 UpdateExpression="SET " + ", ".join(update_parts),
                 ExpressionAttributeValues=expr_values,
             )
+            self.invalidate_table(catalog_schema_table)
 
             logger.info(f"Updated table config for {catalog_schema_table}")
             return True
@@ -1031,20 +1390,37 @@ class DynamoDBService:
             return False
 
     def delete_all_columns_for_table(self, catalog_schema_table: str) -> bool:
-        """Delete all column metadata for a table"""
-        try:
-            columns = self.get_all_columns_for_table(catalog_schema_table)
+        """
+        Delete all column metadata for a table
 
-            for column in columns:
-                self.column_metadata_table.delete_item(
-                    Key={
-                        "catalog_schema_table": catalog_schema_table,  # CHANGED
-                        "column_name": column.column_name,
-                    }
+        Only the keys are queried, and deletes go out through batch_writer
+        (25 per BatchWriteItem request, unprocessed items resubmitted).
+        """
+        try:
+            column_names = [
+                item["column_name"]["S"]
+                for page in self._query_pages(
+                    self.client,
+                    TableName=self.column_metadata_table_name,
+                    KeyConditionExpression="catalog_schema_table = :pk",
+                    ExpressionAttributeValues={":pk": {"S": catalog_schema_table}},
+                    ProjectionExpression="column_name",
                 )
+                for item in page
+            ]
+
+            with self.column_metadata_table.batch_writer() as batch:
+                for column_name in column_names:
+                    batch.delete_item(
+                        Key={
+                            "catalog_schema_table": catalog_schema_table,  # CHANGED
+                            "column_name": column_name,
+                        }
+                    )
+            self.invalidate_table(catalog_schema_table)
 
             logger.info(
-                f"Deleted {len(columns)} column metadata entries for {catalog_schema_table}"
+                f"Deleted {len(column_names)} column metadata entries for {catalog_schema_table}"
             )
             return True
 
@@ -1055,34 +1431,51 @@ class DynamoDBService:
             return False
 
     def get_table_with_columns(
-        self, catalog_schema_table: str
+        self, catalog_schema_table: str, use_cache: bool = True
     ) -> Optional[TableWithColumns]:
-        """Get complete table metadata with all columns"""
-        try:
-            table_metadata = self.get_table_metadata(catalog_schema_table)
-            if not table_metadata:
-                return None
+        """
+        Get complete table metadata with all columns
 
-            columns = self.get_all_columns_for_table(catalog_schema_table)
-
-            columns_dict = {}
-            for col in columns:
-                columns_dict[col.column_name] = {
-                    "data_type": col.data_type,
-                    "column_type": col.column_type,
-                    "semantic_type": col.semantic_type,
-                    "aliases": col.aliases,
-                    "description": col.description,
-                    "min_value": col.min_value,
-                    "max_value": col.max_value,
-                    "avg_value": col.avg_value,
-                    "cardinality": col.cardinality,
-                    "null_count": col.null_count,
-                    "null_percentage": col.null_percentage,
-                    "sample_values": col.sample_values,
-                }
+        Args:
+            catalog_schema_table: Full table identifier
+            use_cache: Reuse a result from the last
+                settings.dynamodb_columns_cache_ttl_seconds (returned as a deep
+                copy, since the models are mutable)
 
-            return TableWithColumns(
+        Returns:
+            TableWithColumns, or None if the table has no metadata
+        """
+        caching = use_cache and settings.dynamodb_columns_cache_ttl_seconds > 0
+        if caching:
+            cached = self._table_with_columns_cache.get(catalog_schema_table)
+            if cached is not None:
+                return cached.model_copy(deep=True)
+
+        try:
+            # The GetItem and the column Query hit different tables, so the
+            # columns are fetched on a helper thread meanwhile and wall time is
+            # the slower of the two. columns_dict carries every stored column
+            # attribute, so that is a whole-item read (no projection) and
+            # shares the column cache
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dynamodb-columns")
+            try:
+                items_future = executor.submit(
+                    self._get_all_columns_raw, catalog_schema_table, use_cache
+                )
+                table_metadata = self.get_table_metadata(catalog_schema_table)
+                if not table_metadata:
+                    return None
+                items = items_future.result()
+            finally:
+                # Don't wait on a column read whose table turned out missing
+                executor.shutdown(wait=False, cancel_futures=True)
+
+            # Straight from the items, no ColumnMetadata in between;
+            # TableWithColumns validates each entry (copying the lists, so
+            # the cached items stay untouched)
+            columns_dict = {item["column_name"]: _item_to_table_column(item) for item in items}
+
+            table_with_columns = TableWithColumns(
                 catalog_schema_table=table_metadata.catalog_schema_table,
                 last_updated=table_metadata.last_updated,
                 row_count=table_metadata.row_count,
@@ -1096,6 +1489,11 @@ class DynamoDBService:
                 custom_instructions=table_metadata.custom_instructions,
                 columns=columns_dict,
             )
+            if caching:
+                self._table_with_columns_cache.set(
+                    catalog_schema_table, table_with_columns.model_copy(deep=True)
+                )
+            return table_with_columns
 
         except Exception as e:
             logger.error(
@@ -1103,6 +1501,32 @@ class DynamoDBService:
             )
             return None
 
+    # ========== Async Read Operations ==========
+    # For async callers (FastAPI endpoints): each runs its sync counterpart on
+    # asyncio's default thread pool, so the event loop keeps serving other
+    # requests and independent reads can be gathered. Caching, DAX routing
+    # and the chunk/page concurrency inside the sync methods all still apply.
+
+    async def get_table_metadata_async(
+        self, catalog_schema_table: str
+    ) -> Optional[TableMetadata]:
+        """get_table_metadata without blocking the event loop"""
+        return await asyncio.to_thread(self.get_table_metadata, catalog_schema_table)
+
+    async def get_table_with_columns_async(
+        self, catalog_schema_table: str, use_cache: bool = True
+    ) -> Optional[TableWithColumns]:
+        """get_table_with_columns without blocking the event loop"""
+        return await asyncio.to_thread(
+            self.get_table_with_columns, catalog_schema_table, use_cache
+        )
+
+    async def batch_get_column_metadata_async(
+        self, column_keys: List[tuple[str, str]], projection: Optional[List[str]] = None
+    ) -> List[ColumnMetadata]:
+        """batch_get_column_metadata without blocking the event loop"""
+        return await asyncio.to_thread(self.batch_get_column_metadata, column_keys, projection)
+
 
 # Global DynamoDB service instance
 dynamodb_service = DynamoDBService()
@@ -3,13 +3,15 @@ OpenAI Embedding Service for generating vector embeddings of metadata
 Used for RAG (Retrieval Augmented Generation) with Neptune graph database
 """
 
-from typing import List, Dict, Any, Optional
-from openai import AzureOpenAI
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
 
 from app.config import settings
 from app.models import TableMetadata, ColumnMetadata
 from app.utils.logger import app_logger as logger
 
+if TYPE_CHECKING:
+    from openai import AzureOpenAI
+
 
 class EmbeddingService:
     """Service for generating embeddings using Azure OpenAI"""
@@ -20,12 +22,15 @@ class EmbeddingService:
         self.model = settings.openai_embedding_model
         logger.info(f"Embedding service initialized with model: {self.model}")
 
-    def _get_client(self) -> AzureOpenAI:
+    def _get_client(self) -> "AzureOpenAI":
         """Get or create Azure OpenAI client (lazy loading)"""
         if self.client is None:
             if not settings.azure_openai_api_key or not settings.azure_openai_endpoint:
                 raise ValueError("Azure OpenAI credentials not configured")
 
+            # SDK imported on first use to keep it out of process startup
+            from openai import AzureOpenAI
+
             self.client = AzureOpenAI(
                 api_key=settings.azure_openai_api_key,
                 api_version=settings.azure_openai_api_version,
@@ -115,7 +120,7 @@ Table: {table_name}
 Catalog: {catalog}, Schema: {schema}, Table: {table}
 Row count: {table_metadata.row_count:,}
 Column count: {table_metadata.column_count}
-Schema status: {table_metadata.schema_status.value}
+Schema status: {table_metadata.schema_status}
 
 Columns:
 {chr(10).join(column_summaries[:15])}
@@ -165,7 +170,8 @@ Purpose: Database table containing structured data with {table_metadata.column_c
                 null_percentage = column_metadata.get('null_percentage', 0)
                 sample_values = column_metadata.get('sample_values', [])
             else:
-                col_name = column_metadata.column_name
+                # TableColumnMetadata values are keyed by name and don't carry it
+                col_name = getattr(column_metadata, 'column_name', 'unknown')
                 col_type = column_metadata.column_type if column_metadata.column_type else "unknown"
                 semantic = column_metadata.semantic_type if column_metadata.semantic_type else "none"
                 data_type = column_metadata.data_type
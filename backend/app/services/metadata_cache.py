@@ -0,0 +1,354 @@
+"""
+Caches for generated column aliases and descriptions
+
+MetadataCache (combined alias + description results) has two tiers:
+exact, a sha1 of (column_name, data_type, sorted tags, table_context); and
+semantic, a sentence-transformers embedding of the column signature,
+accepted when cosine similarity clears a threshold AND both column names
+split into the same set of name tokens. That lets the same column be reused
+from other tables, or under a reordered or differently cased name
+(start_date / StartDate), while siblings such as admin_level_2 /
+admin_level_3 or start_date / end_date never share metadata.
+
+ResponseCache is an exact-match cache of individual GPT-5 replies keyed by
+a hash of the request arguments, with a TTL.
+
+Both persist to SQLite so they survive restarts.
+"""
+import copy
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+import numpy as np
+
+from app.config import settings
+from app.utils.logger import app_logger as logger
+
+# Cosine similarity required for a semantic-tier hit
+SEMANTIC_SIMILARITY_THRESHOLD = 0.95
+
+_TOKEN_SPLIT_RE = re.compile(r'[_\-\s]+|(?<=[a-z])(?=[A-Z])')
+
+
+def _name_tokens(column_name: str) -> FrozenSet[str]:
+    """Lowercased name tokens; a semantic hit needs an identical set"""
+    return frozenset(t.lower() for t in _TOKEN_SPLIT_RE.split(column_name) if t)
+
+
+class MetadataCache:
+    """Exact + semantic cache in front of LLM alias/description generation"""
+
+    def __init__(self, db_path: str, similarity_threshold: float = SEMANTIC_SIMILARITY_THRESHOLD):
+        """
+        Initialize cache and load persisted entries
+
+        Args:
+            db_path: SQLite file used for persistence
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+        """
+        self.similarity_threshold = similarity_threshold
+        self._lock = threading.Lock()
+
+        self._exact: Dict[str, Dict[str, Any]] = {}
+        # Semantic-tier rows grouped by name-token set (only these can match)
+        self._sem_rows_by_tokens: Dict[FrozenSet[str], List[int]] = {}
+        self._sem_results: List[Dict[str, Any]] = []
+        # Rows [:_sem_size] are L2-normalized embeddings; capacity doubles as it fills
+        self._sem_matrix: Optional[np.ndarray] = None
+        self._sem_size = 0
+
+        self._encoder = None
+        self._encoder_failed = False
+        # Generation threads can all miss at once; load the model only once
+        self._encoder_lock = threading.Lock()
+
+        self._db = None
+        try:
+            db_dir = os.path.dirname(db_path)
+            if db_dir:
+                os.makedirs(db_dir, exist_ok=True)
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS metadata_cache ("
+                "key TEXT PRIMARY KEY, column_name TEXT, result TEXT, embedding BLOB)"
+            )
+            # LLM replies used to live here; ResponseCache now has its own file
+            self._db.execute("DROP TABLE IF EXISTS llm_response_cache")
+            self._db.commit()
+            self._load()
+        except Exception as e:
+            logger.warning(f"Metadata cache persistence disabled ({db_path}): {e}")
+            self._db = None
+
+    @staticmethod
+    def make_key(
+        column_name: str,
+        data_type: str,
+        tags: Optional[List[str]] = None,
+        table_context: Optional[str] = None
+    ) -> str:
+        """Exact-tier cache key"""
+        raw = f"{column_name}|{data_type}|{','.join(sorted(tags or []))}|{table_context or ''}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _semantic_text(column_name: str, data_type: str, tags: Optional[List[str]]) -> str:
+        """Column signature embedded for the semantic tier"""
+        return f"column {column_name.replace('_', ' ')} of type {data_type} tagged {' '.join(sorted(tags or []))}"
+
+    def _get_encoder(self):
+        """Load the sentence-transformers model on first semantic lookup"""
+        if self._encoder is None and not self._encoder_failed:
+            with self._encoder_lock:
+                if self._encoder is None and not self._encoder_failed:
+                    try:
+                        from sentence_transformers import SentenceTransformer
+                        self._encoder = SentenceTransformer(settings.sentence_transformer_model)
+                    except Exception as e:
+                        self._encoder_failed = True
+                        logger.warning(f"Semantic metadata cache disabled: {e}")
+        return self._encoder
+
+    def _embed(self, text: str) -> Optional[np.ndarray]:
+        encoder = self._get_encoder()
+        if encoder is None:
+            return None
+        vector = np.asarray(encoder.encode(text), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    @staticmethod
+    def _copy(result: Dict[str, Any]) -> Dict[str, Any]:
+        return {"aliases": list(result["aliases"]), "description": result["description"]}
+
+    def _add_semantic(self, column_name: str, result: Dict[str, Any], embedding: np.ndarray) -> None:
+        self._sem_rows_by_tokens.setdefault(_name_tokens(column_name), []).append(self._sem_size)
+        self._sem_results.append(result)
+        if self._sem_matrix is None:
+            self._sem_matrix = np.empty((64, embedding.shape[0]), dtype=np.float32)
+        elif self._sem_size == self._sem_matrix.shape[0]:
+            grown = np.empty((self._sem_size * 2, self._sem_matrix.shape[1]), dtype=np.float32)
+            grown[:self._sem_size] = self._sem_matrix
+            self._sem_matrix = grown
+        self._sem_matrix[self._sem_size] = embedding
+        self._sem_size += 1
+
+    def _load(self) -> None:
+        """Populate in-memory tiers from SQLite"""
+        rows = self._db.execute(
+            "SELECT key, column_name, result, embedding FROM metadata_cache"
+        ).fetchall()
+        for key, column_name, result_json, embedding in rows:
+            result = json.loads(result_json)
+            self._exact[key] = result
+            if embedding is not None:
+                self._add_semantic(column_name, result, np.frombuffer(embedding, dtype=np.float32))
+        if rows:
+            logger.info(f"Loaded {len(rows)} cached column metadata entries")
+
+    def get(
+        self,
+        column_name: str,
+        data_type: str,
+        tags: Optional[List[str]] = None,
+        table_context: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up cached aliases/description for a column
+
+        Returns:
+            Dict with 'aliases' and 'description', or None on a miss
+        """
+        key = self.make_key(column_name, data_type, tags, table_context)
+        with self._lock:
+            result = self._exact.get(key)
+            if result is not None:
+                return self._copy(result)
+            rows = self._sem_rows_by_tokens.get(_name_tokens(column_name))
+            if not rows:
+                return None
+            rows = list(rows)
+
+        embedding = self._embed(self._semantic_text(column_name, data_type, tags))
+        if embedding is None:
+            return None
+
+        with self._lock:
+            scores = self._sem_matrix[rows] @ embedding
+            best = int(np.argmax(scores))
+            if scores[best] > self.similarity_threshold:
+                return self._copy(self._sem_results[rows[best]])
+        return None
+
+    def set(
+        self,
+        column_name: str,
+        data_type: str,
+        tags: Optional[List[str]],
+        table_context: Optional[str],
+        result: Dict[str, Any]
+    ) -> None:
+        """Store a successful generation result in both tiers"""
+        key = self.make_key(column_name, data_type, tags, table_context)
+        with self._lock:
+            if key in self._exact:
+                return
+        result = self._copy(result)
+        embedding = self._embed(self._semantic_text(column_name, data_type, tags))
+
+        with self._lock:
+            if key in self._exact:
+                return
+            self._exact[key] = result
+            if embedding is not None:
+                self._add_semantic(column_name, result, embedding)
+
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO metadata_cache VALUES (?, ?, ?, ?)",
+                        (
+                            key,
+                            column_name,
+                            json.dumps(result),
+                            embedding.tobytes() if embedding is not None else None,
+                        ),
+                    )
+                    self._db.commit()
+                except Exception as e:
+                    logger.warning(f"Failed to persist metadata cache entry for {column_name}: {e}")
+
+
+class ResponseCache:
+    """
+    Exact-match cache of JSON-serializable LLM replies
+
+    Entries live in an SQLite table (WAL mode, so several worker processes
+    can share one file) with an in-memory read-through layer on top. Entries
+    older than ttl_seconds are treated as misses and removed by prune().
+    """
+
+    def __init__(self, db_path: str, ttl_seconds: Optional[float] = None):
+        """
+        Initialize cache and drop expired entries
+
+        Args:
+            db_path: SQLite file used for persistence
+            ttl_seconds: Entry lifetime; None or 0 keeps entries forever
+        """
+        self.ttl_seconds = ttl_seconds or None
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[int, Any]] = {}  # key -> (created_at, value)
+
+        self._db = None
+        try:
+            db_dir = os.path.dirname(db_path)
+            if db_dir:
+                os.makedirs(db_dir, exist_ok=True)
+            self._db = sqlite3.connect(db_path, check_same_thread=False, timeout=5.0)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "key TEXT PRIMARY KEY, kind TEXT, value TEXT, created_at INTEGER)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS llm_cache_created_at ON llm_cache (created_at)")
+            self._db.commit()
+            self.prune(vacuum=False)
+        except Exception as e:
+            logger.warning(f"LLM response cache persistence disabled ({db_path}): {e}")
+            self._db = None
+
+    @staticmethod
+    def make_key(kind: str, **request: Any) -> str:
+        """
+        Cache key for one request
+
+        Args:
+            kind: Request type (e.g. 'aliases', 'description')
+            **request: Request arguments; pass sample values as their
+                SampleContext fingerprint so ordering doesn't cause misses
+
+        Returns:
+            blake2b hex digest
+        """
+        if request.get("tags"):
+            request["tags"] = sorted(request["tags"])
+        raw = json.dumps({"kind": kind, **request}, sort_keys=True, default=str)
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=20).hexdigest()
+
+    def _expired(self, created_at: int) -> bool:
+        return self.ttl_seconds is not None and created_at < time.time() - self.ttl_seconds
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached reply for key, or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None and self._db is not None:
+                # Possibly written by another process since we started
+                try:
+                    row = self._db.execute(
+                        "SELECT created_at, value FROM llm_cache WHERE key = ?", (key,)
+                    ).fetchone()
+                except Exception as e:
+                    logger.warning(f"LLM response cache lookup failed: {e}")
+                    row = None
+                if row is not None:
+                    entry = (row[0], json.loads(row[1]))
+                    self._entries[key] = entry
+
+        if entry is None or self._expired(entry[0]):
+            return None
+        return copy.deepcopy(entry[1])
+
+    def set(self, key: str, value: Any, kind: str = "") -> None:
+        """Store a successful reply"""
+        entry = (int(time.time()), copy.deepcopy(value))
+        with self._lock:
+            self._entries[key] = entry
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO llm_cache VALUES (?, ?, ?, ?)",
+                        (key, kind, json.dumps(value), entry[0]),
+                    )
+                    self._db.commit()
+                except Exception as e:
+                    logger.warning(f"Failed to persist LLM response cache entry: {e}")
+
+    def prune(self, vacuum: bool = True) -> int:
+        """
+        Delete expired entries
+
+        Args:
+            vacuum: Also VACUUM the SQLite file to reclaim the freed space
+
+        Returns:
+            Number of persisted entries removed
+        """
+        if self.ttl_seconds is None:
+            return 0
+
+        cutoff = time.time() - self.ttl_seconds
+        removed = 0
+        with self._lock:
+            self._entries = {k: e for k, e in self._entries.items() if e[0] >= cutoff}
+            if self._db is not None:
+                try:
+                    removed = self._db.execute(
+                        "DELETE FROM llm_cache WHERE created_at < ?", (int(cutoff),)
+                    ).rowcount
+                    self._db.commit()
+                    if vacuum:
+                        self._db.execute("VACUUM")
+                except Exception as e:
+                    logger.warning(f"Failed to prune LLM response cache: {e}")
+
+        if removed:
+            logger.info(f"Pruned {removed} expired LLM response cache entries")
+        return removed
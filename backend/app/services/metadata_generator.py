@@ -2,7 +2,7 @@
 Main metadata generation service - orchestrates all metadata generation tasks
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
 import pandas as pd
@@ -65,6 +65,7 @@ class MetadataGenerator:
         force_refresh: bool = False,
         username: Optional[str] = None,
         password: Optional[str] = None,
+        mode: str = "sync",
     ) -> bool:
         """
         Generate complete metadata for a single table
@@ -74,6 +75,11 @@ class MetadataGenerator:
             catalog: Catalog name (default: here_explorer)
             schema: Schema name (default: explorer_datasets)
             force_refresh: Force regeneration even if metadata exists
+            mode: "sync" generates aliases/descriptions now; "batch" saves
+                rule-based placeholders and submits an Azure OpenAI Batch job
+                whose results apply_metadata_batch_results() writes back later;
+                "auto" uses "batch" for tables with more than
+                settings.batch_min_columns columns and "sync" otherwise
 
         Returns:
             True if successful, False otherwise
@@ -105,7 +111,7 @@ class MetadataGenerator:
                 # Create initial record with IN_PROGRESS status
                 initial_metadata = TableMetadata(
                     catalog_schema_table=catalog_schema_table,
-                    last_updated=datetime.now(),
+                    last_updated=datetime.now(timezone.utc),
                     row_count=0,
                     column_count=0,
                     schema_status=SchemaStatus.CURRENT,
@@ -160,7 +166,12 @@ class MetadataGenerator:
 
             logger.info(f"Retrieved sample data: {len(sample_df)} rows")
 
-            # Step 5: Process each column
+            # Table context shared by every column prompt; no row count, so the
+            # metadata/LLM cache keys stay stable as the table grows
+            table_context = f"contains rows of {table_name.replace('_', ' ')}"
+
+            # Step 5: Detect types and collect generation inputs for each column
+            column_inputs = []
             for column_name, data_type in table_schema.items():
                 logger.debug(f"Processing column: {column_name}")
 
@@ -197,32 +208,67 @@ class MetadataGenerator:
                     cardinality=cardinality,
                 )
 
-                # DETECT COLUMN TYPE (dimension/measure/identifier/timestamp/detail)
-                # Pass semantic_type for smarter dimension detection
-                column_type = self.col_type_detector.detect_column_type(
-                    column_name=column_name,
-                    data_type=data_type,
-                    cardinality=cardinality,
-                    row_count=row_count,
-                    semantic_type=semantic_type,
+                column_inputs.append(
+                    {
+                        "column_name": column_name,
+                        "data_type": data_type,
+                        "sample_values": sample_values,
+                        "col_stats": col_stats,
+                        "cardinality": cardinality,
+                        "semantic_type": semantic_type,
+                    }
                 )
 
-                # Generate table context
-                table_context = (
-                    f"contains {row_count:,} rows of {table_name.replace('_', ' ')}"
+            # DETECT COLUMN TYPES (dimension/measure/identifier/timestamp/detail) for all
+            # columns in one vectorized pass; semantic_type enables smarter dimension detection
+            if column_inputs:
+                column_types = self.col_type_detector.classify_columns(
+                    pd.DataFrame(
+                        {
+                            "column_name": [col["column_name"] for col in column_inputs],
+                            "data_type": [col["data_type"] for col in column_inputs],
+                            "cardinality": [col["cardinality"] for col in column_inputs],
+                            "row_count": row_count,
+                            "semantic_type": [col["semantic_type"] for col in column_inputs],
+                        }
+                    )
                 )
+                for col, column_type in zip(column_inputs, column_types):
+                    col["column_type"] = column_type
+
+            # Step 5b: Generate aliases AND descriptions for all columns in batched calls
+            generation_inputs = [
+                {
+                    "column_name": col["column_name"],
+                    "data_type": col["data_type"],
+                    "sample_values": col["sample_values"][:10] if col["sample_values"] else None,
+                    "tags": [col["semantic_type"]] if col["semantic_type"] else [],
+                    "min_value": col["col_stats"].get("min_value"),
+                    "max_value": col["col_stats"].get("max_value"),
+                    "cardinality": col["cardinality"],
+                    "table_context": table_context,
+                }
+                for col in column_inputs
+            ]
+            if mode == "auto":
+                mode = "batch" if len(generation_inputs) > settings.batch_min_columns else "sync"
+                logger.info(f"Using {mode} alias/description generation for {len(generation_inputs)} columns")
+            if mode == "batch":
+                # Placeholders now; LLM results arrive via the batch poller
+                generated = [
+                    self.alias_gen.generate_rule_based(
+                        col["column_name"], col["data_type"], col["tags"], col["cardinality"]
+                    )
+                    for col in generation_inputs
+                ]
+            else:
+                generated = self.alias_gen.generate_batch(generation_inputs)
 
-                # Generate BOTH aliases AND description in ONE call (2x faster!)
-                metadata = self.alias_gen.generate_aliases_and_description(
-                    column_name=column_name,
-                    data_type=data_type,
-                    sample_values=sample_values[:10] if sample_values else None,
-                    tags=[semantic_type] if semantic_type else [],
-                    min_value=col_stats.get("min_value"),
-                    max_value=col_stats.get("max_value"),
-                    cardinality=cardinality,
-                    table_context=table_context,
-                )
+            # Step 5c: Save column metadata
+            columns_metadata = []
+            for col, metadata in zip(column_inputs, generated):
+                column_name = col["column_name"]
+                col_stats = col["col_stats"]
 
                 # Extract aliases and description from result
                 aliases = metadata.get("aliases", [])
@@ -232,24 +278,23 @@ class MetadataGenerator:
                 column_metadata = ColumnMetadata(
                     catalog_schema_table=catalog_schema_table,  # CHANGED
                     column_name=column_name,
-                    data_type=data_type,
-                    column_type=column_type,
-                    semantic_type=semantic_type,
+                    data_type=col["data_type"],
+                    column_type=col["column_type"],
+                    semantic_type=col["semantic_type"],
                     aliases=aliases,
                     description=description,
                     min_value=col_stats.get("min_value"),
                     max_value=col_stats.get("max_value"),
                     avg_value=col_stats.get("avg_value"),
-                    cardinality=cardinality,
+                    cardinality=col["cardinality"],
                     null_count=col_stats.get("null_count", 0),
                     null_percentage=col_stats.get("null_percentage", 0.0),
-                    sample_values=sample_values,
+                    sample_values=col["sample_values"],
                 )
+                columns_metadata.append(column_metadata)
 
-                # Save column metadata to DynamoDB
-                logger.info(f"About to save column {column_name}")
-                self.dynamodb.save_column_metadata(column_metadata)
-                logger.info(f"Saved column {column_name}")
+            # Save column metadata to DynamoDB in batched writes
+            self.dynamodb.save_column_metadata_batch(columns_metadata)
 
             # Step 6: Auto-detect search mode based on schema
             detected_search_mode = self.detect_search_mode(table_schema)
@@ -257,19 +302,25 @@ class MetadataGenerator:
             # Step 7: Save table-level metadata
             table_metadata = TableMetadata(
                 catalog_schema_table=catalog_schema_table,  # CHANGED
-                last_updated=datetime.now(),
+                last_updated=datetime.now(timezone.utc),
                 row_count=row_count,
                 column_count=len(table_schema),
                 schema_status=SchemaStatus.CURRENT,
                 schema_change_detected_at=None,
                 schema_changes=None,
                 enrichment_status=EnrichmentStatus.COMPLETED,
-                enrichment_timestamp=datetime.now(),
+                enrichment_timestamp=datetime.now(timezone.utc),
                 search_mode=detected_search_mode,  # Auto-detected
             )
 
             self.dynamodb.save_table_metadata(table_metadata)
 
+            # Step 7b: Batch mode - submit LLM generation, results are applied by the batch poller
+            if mode == "batch":
+                batch_id = self.alias_gen.generate_bulk_async(catalog_schema_table, generation_inputs)
+                if batch_id:
+                    self.dynamodb.set_metadata_batch_id(catalog_schema_table, batch_id)
+
             logger.info(
                 f"✅ Successfully generated metadata for: {catalog_schema_table} (search_mode: {detected_search_mode})"
             )
@@ -310,6 +361,7 @@ class MetadataGenerator:
         force_refresh: bool = False,
         username: Optional[str] = None,
         password: Optional[str] = None,
+        mode: str = "sync",
     ) -> Dict[str, bool]:
         """
         Generate metadata for multiple tables
@@ -319,6 +371,7 @@ class MetadataGenerator:
             catalog: Catalog name
             schema: Schema name
             force_refresh: Force regeneration even if metadata exists
+            mode: "sync", "batch" or "auto" (see generate_metadata_for_table)
 
         Returns:
             Dictionary mapping table names to success status
@@ -342,6 +395,7 @@ class MetadataGenerator:
                     force_refresh=force_refresh,
                     username=username,
                     password=password,
+                    mode=mode,
                 )
                 results[table_name] = success
 
@@ -417,6 +471,47 @@ class MetadataGenerator:
             logger.error(f" Failed to refresh metadata for {catalog_schema_table}: {e}")
             return False
 
+    def apply_metadata_batch_results(self, catalog_schema_table: str, batch_id: str) -> Optional[bool]:
+        """
+        Write the results of a completed metadata batch job back to column metadata
+
+        Args:
+            catalog_schema_table: Full catalog.schema.table identifier
+            batch_id: Azure OpenAI batch job ID recorded for the table
+
+        Returns:
+            True if results were applied, False if the job failed (it is cleared
+            either way), None if the job is still running or couldn't be
+            checked this time (the id is kept for the next poll)
+        """
+        try:
+            results = self.alias_gen.collect_bulk_results(catalog_schema_table, batch_id)
+        except RuntimeError as e:
+            logger.error(f"Metadata batch job {batch_id} for {catalog_schema_table} failed: {e}")
+            self.dynamodb.set_metadata_batch_id(catalog_schema_table, None)
+            return False
+        except Exception as e:
+            logger.warning(f"Could not check metadata batch job {batch_id} for {catalog_schema_table}: {e}")
+            return None
+
+        if results is None:
+            logger.info(f"Metadata batch job {batch_id} for {catalog_schema_table} still running")
+            return None
+
+        for column_name, metadata in results.items():
+            self.dynamodb.update_column_metadata_fields(
+                catalog_schema_table,
+                column_name,
+                aliases=metadata["aliases"],
+                description=metadata["description"],
+            )
+
+        self.dynamodb.set_metadata_batch_id(catalog_schema_table, None)
+        logger.info(
+            f"✅ Applied batch metadata for {len(results)} columns of {catalog_schema_table}"
+        )
+        return True
+
 
 # Global metadata generator instance
 metadata_generator = MetadataGenerator()
@@ -561,7 +561,7 @@ class NeptuneAnalyticsService:
                 table_name=catalog_schema_table,
                 row_count=table_metadata.row_count,
                 column_count=table_metadata.column_count,
-                schema_status=table_metadata.schema_status.value,
+                schema_status=table_metadata.schema_status,
                 table_embedding=table_embedding_padded,  # Use padded embedding
                 table_summary=table_summary,
                 search_mode=table_metadata.search_mode,
@@ -4,13 +4,14 @@ Hybrid approach: 3 main types + GPT-defined subtypes for granularity
 """
 
 import json
-from typing import Any, Dict, List, Optional
-
-from openai import AzureOpenAI
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from app.config import settings
 from app.utils.logger import app_logger as logger
 
+if TYPE_CHECKING:
+    from openai import AzureOpenAI
+
 
 class RelationshipDetector:
     """
@@ -19,12 +20,8 @@ class RelationshipDetector:
     """
 
     def __init__(self):
-        """Initialize Azure OpenAI client"""
-        self.client = AzureOpenAI(
-            api_key=settings.azure_openai_api_key,
-            api_version=settings.azure_openai_api_version,
-            azure_endpoint=settings.azure_openai_endpoint,
-        )
+        """Initialize detector (the Azure OpenAI client is created on first use)"""
+        self.client = None
         self.deployment = settings.azure_openai_deployment
         self.source_batch_size = 20  # Process 20 source columns at a time
 
@@ -40,6 +37,20 @@ class RelationshipDetector:
         # Exclude these column types from relationship detection
         self.excluded_column_types = {'measure'}
 
+    def _get_client(self) -> "AzureOpenAI":
+        """Get or create Azure OpenAI client (lazy loading)"""
+        if self.client is None:
+            # SDK imported on first use to keep it out of process startup
+            from openai import AzureOpenAI
+
+            self.client = AzureOpenAI(
+                api_key=settings.azure_openai_api_key,
+                api_version=settings.azure_openai_api_version,
+                azure_endpoint=settings.azure_openai_endpoint,
+            )
+
+        return self.client
+
     def _should_exclude_column(self, column: Dict[str, Any]) -> bool:
         """
         Check if column should be excluded from relationship detection
@@ -206,7 +217,7 @@ class RelationshipDetector:
             # Call GPT-4o/GPT-5
             logger.debug("      Calling Azure OpenAI...")
 
-            response = self.client.chat.completions.create(
+            response = self._get_client().chat.completions.create(
                 model=self.deployment,
                 messages=[
                     {"role": "system", "content": self._get_system_prompt()},
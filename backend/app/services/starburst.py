@@ -2,15 +2,35 @@
 Starburst/Trino connection and query service
 """
 
+import threading
+import time
 from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
 from trino.auth import BasicAuthentication
 from trino.dbapi import connect
 
 from app.config import settings
 from app.utils.logger import app_logger as logger
 
+# Oversampling factor applied to the TABLESAMPLE percentage for sample data
+SAMPLE_OVERSAMPLE_FACTOR = 3
+
+# Maximum number of columns projected when a caller selects sample columns
+MAX_SAMPLE_COLUMNS = 200
+
+# Per-user HTTP session pool: idle sessions are closed after this many seconds
+HTTP_SESSION_IDLE_TTL_SECONDS = 1800
+HTTP_SESSION_POOL_SIZE = 1024
+HTTP_SESSION_MAX_CONNECTIONS = 8
+
+
+def _quote_identifier(name: str) -> str:
+    """Quote a Trino identifier, escaping embedded double quotes"""
+    return '"' + name.replace('"', '""') + '"'
+
 
 class StarburstService:
     """Service for connecting to and querying Starburst/Trino"""
@@ -26,6 +46,57 @@ class StarburstService:
         self.http_scheme = settings.starburst_http_scheme
         self._connection = None
 
+        # username -> (password, requests.Session, last_used) so repeated
+        # queries from the same user reuse warm TLS connections
+        self._http_sessions: Dict[str, Tuple[str, requests.Session, float]] = {}
+        self._http_sessions_lock = threading.Lock()
+
+    def _get_http_session(self, user: str, pwd: str) -> requests.Session:
+        """
+        Get the pooled HTTP session for a user, creating it if needed
+
+        Sessions idle for longer than HTTP_SESSION_IDLE_TTL_SECONDS are closed
+        lazily on access; a password change replaces the user's session.
+
+        Args:
+            user: Username the session authenticates as
+            pwd: Password for the user
+
+        Returns:
+            requests.Session with keep-alive connection pooling
+        """
+        now = time.monotonic()
+        with self._http_sessions_lock:
+            expired = [
+                name
+                for name, (_, _, last_used) in self._http_sessions.items()
+                if now - last_used > HTTP_SESSION_IDLE_TTL_SECONDS
+            ]
+            for name in expired:
+                self._http_sessions.pop(name)[1].close()
+
+            entry = self._http_sessions.get(user)
+            if entry is not None and entry[0] == pwd:
+                session = entry[1]
+            else:
+                if entry is not None:
+                    entry[1].close()
+                elif len(self._http_sessions) >= HTTP_SESSION_POOL_SIZE:
+                    oldest = min(
+                        self._http_sessions, key=lambda name: self._http_sessions[name][2]
+                    )
+                    self._http_sessions.pop(oldest)[1].close()
+
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=1, pool_maxsize=HTTP_SESSION_MAX_CONNECTIONS
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+
+            self._http_sessions[user] = (pwd, session, now)
+            return session
+
     def get_connection(
         self, username: Optional[str] = None, password: Optional[str] = None
     ):
@@ -54,6 +125,7 @@ class StarburstService:
                 schema=self.schema,
                 http_scheme=self.http_scheme,
                 auth=auth,
+                http_session=self._get_http_session(user, pwd),
             )
 
             logger.info(
@@ -98,10 +170,10 @@ class StarburstService:
             raise
 
         finally:
+            # The connection's HTTP session is pooled per user, so only the
+            # cursor is closed here
             if cursor:
                 cursor.close()
-            if conn:
-                conn.close()
 
     def execute_query_to_df(
         self, query: str, username: Optional[str] = None, password: Optional[str] = None
@@ -143,10 +215,10 @@ class StarburstService:
             raise
 
         finally:
+            # The connection's HTTP session is pooled per user, so only the
+            # cursor is closed here
             if cursor:
                 cursor.close()
-            if conn:
-                conn.close()
 
     def get_table_schema(
         self,
@@ -670,24 +742,15 @@ class StarburstService:
         limit: int = 1000,
         username: Optional[str] = None,
         password: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        row_count: Optional[int] = None,
     ) -> pd.DataFrame:
         """
         Get random sample of data from a table with specific catalog and schema
 
-        Args:
-            catalog: Name of the catalog
-            schema: Name of the schema
-            table_name: Name of the table
-            limit: Number of rows to sample
-            username: Optional username for connection
-            password: Optional password for connection
-
-        Returns:
-            DataFrame with sample data
-        """
-
-        """
-        Get random sample of data from a table with specific catalog and schema
+        When the table's row count is known and larger than the limit, rows are
+        sampled scan-side with TABLESAMPLE BERNOULLI instead of sorting the whole
+        table with ORDER BY RANDOM().
 
         Args:
             catalog: Name of the catalog
@@ -696,17 +759,39 @@ class StarburstService:
             limit: Number of rows to sample
             username: Optional username for connection
             password: Optional password for connection
+            columns: Optional list of columns to project (defaults to all columns)
+            row_count: Optional known row count used to size the sample percentage
 
         Returns:
             DataFrame with sample data (complex types converted to strings)
         """
         try:
-            query = f"""
-                SELECT *
-                FROM {catalog}.{schema}.{table_name}
-                ORDER BY RANDOM()
-                LIMIT {limit}
-            """
+            if columns:
+                if len(columns) > MAX_SAMPLE_COLUMNS:
+                    logger.warning(
+                        f"Requested {len(columns)} columns, projecting first {MAX_SAMPLE_COLUMNS}"
+                    )
+                    columns = columns[:MAX_SAMPLE_COLUMNS]
+                projection = ", ".join(_quote_identifier(col) for col in columns)
+            else:
+                projection = "*"
+
+            if row_count and row_count > limit:
+                # Oversample so BERNOULLI's variance rarely yields fewer than `limit` rows
+                percentage = min(100.0, limit * SAMPLE_OVERSAMPLE_FACTOR * 100 / row_count)
+                percentage = max(percentage, 0.000001)
+                query = f"""
+                    SELECT {projection}
+                    FROM {catalog}.{schema}.{table_name} TABLESAMPLE BERNOULLI ({percentage:.6f})
+                    LIMIT {limit}
+                """
+            else:
+                query = f"""
+                    SELECT {projection}
+                    FROM {catalog}.{schema}.{table_name}
+                    ORDER BY RANDOM()
+                    LIMIT {limit}
+                """
 
             df = self.execute_query_to_df(query, username, password)
 
@@ -3,5 +3,6 @@ Utils package exports
 """
 from app.utils.logger import app_logger
 from app.utils.ddl_parser import parse_ddl_file, get_table_name_from_ddl
+from app.utils.cache import TTLCache
 
-__all__ = ["app_logger", "parse_ddl_file", "get_table_name_from_ddl"]
\ No newline at end of file
+__all__ = ["app_logger", "parse_ddl_file", "get_table_name_from_ddl", "TTLCache"]
\ No newline at end of file
@@ -40,12 +40,12 @@ def cleanup_stale_neptune_nodes(dry_run: bool = True):
     # Step 2: Filter tables that are NOT imported
     not_imported_tables = [
         t for t in all_tables
-        if t.neptune_import_status.value != 'imported'
+        if t.neptune_import_status != 'imported'
     ]
 
     logger.info(f"\n🔍 Step 2: Found {len(not_imported_tables)} tables NOT imported to Neptune:")
     for table in not_imported_tables:
-        status = table.neptune_import_status.value
+        status = table.neptune_import_status
         logger.info(f"  - {table.catalog_schema_table} (status: {status})")
 
     if not not_imported_tables:
@@ -6,6 +6,8 @@ Usage:
     python scripts/initial_setup.py                                    # Generate for all tables
     python scripts/initial_setup.py --table TABLE_NAME                 # Generate for specific table
     python scripts/initial_setup.py --table TABLE_NAME --force         # Force regeneration
+    python scripts/initial_setup.py --batch                            # Generate aliases/descriptions via Azure OpenAI Batch API
+    python scripts/initial_setup.py --sync                             # Never use the Batch API, even for wide tables
     python scripts/initial_setup.py --catalog here_explorer --schema silverstone   # Different catalog/schema
 """
 
@@ -43,6 +45,16 @@ def main():
         action="store_true",
         help="Force regeneration even if metadata already exists",
     )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Generate aliases/descriptions via the Azure OpenAI Batch API (results applied by worker_metadata_batch_poller.py)",
+    )
+    parser.add_argument(
+        "--sync",
+        action="store_true",
+        help="Generate aliases/descriptions synchronously for every table (default: Batch API for tables wider than BATCH_MIN_COLUMNS)",
+    )
     parser.add_argument(
         "--list-catalogs",
         action="store_true",
@@ -60,6 +72,7 @@ def main():
     )
 
     args = parser.parse_args()
+    generation_mode = "batch" if args.batch else "sync" if args.sync else "auto"
 
     # List catalogs if requested
     if args.list_catalogs:
@@ -117,6 +130,7 @@ def main():
                 catalog=args.catalog,
                 schema=args.schema,
                 force_refresh=args.force,
+                mode=generation_mode,
             )
 
             if success:
@@ -161,6 +175,7 @@ def main():
                 catalog=args.catalog,
                 schema=args.schema,
                 force_refresh=args.force,
+                mode=generation_mode,
             )
 
             # Show final summary
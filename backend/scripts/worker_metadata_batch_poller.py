@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Worker script - Azure OpenAI metadata batch poller
+
+Tables generated with `initial_setup.py --batch` get rule-based aliases and
+descriptions immediately and an Azure OpenAI Batch job for the real ones.
+This script should be run periodically (via cron or scheduled task) to write
+completed batch results back to DynamoDB. Each run also prunes expired
+entries from the GPT-5 response cache.
+
+Usage:
+    python scripts/worker_metadata_batch_poller.py           # Apply whatever has completed
+    python scripts/worker_metadata_batch_poller.py --wait    # Keep polling (exponential backoff) until no jobs are pending
+"""
+import argparse
+import sys
+import os
+import time
+from datetime import datetime
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services import dynamodb_service, metadata_generator
+from app.services.azure_openai_generator import get_generator
+from app.utils.logger import app_logger as logger
+
+# Backoff between polling rounds in --wait mode (seconds)
+POLL_INITIAL_DELAY = 30
+POLL_MAX_DELAY = 600
+
+
+def apply_pending_batches():
+    """
+    Apply every completed metadata batch job once
+
+    Returns:
+        Tuple of (applied, still running, failed) counts
+    """
+    pending = dynamodb_service.get_pending_metadata_batches()
+    logger.info(f"Found {len(pending)} tables with pending metadata batch jobs")
+
+    applied = running = failed = 0
+    for catalog_schema_table, batch_id in pending.items():
+        result = metadata_generator.apply_metadata_batch_results(catalog_schema_table, batch_id)
+        if result is None:
+            running += 1
+        elif result:
+            applied += 1
+        else:
+            failed += 1
+
+    return applied, running, failed
+
+
+def main():
+    """Main function for metadata batch poller worker"""
+    parser = argparse.ArgumentParser(description="Apply completed Azure OpenAI metadata batch jobs")
+    parser.add_argument(
+        "--wait",
+        action="store_true",
+        help="Keep polling with exponential backoff until no batch jobs are running",
+    )
+    args = parser.parse_args()
+
+    logger.info("=" * 70)
+    logger.info("METADATA EXPLORER - METADATA BATCH POLLER")
+    logger.info(f"Run time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    logger.info("=" * 70)
+
+    try:
+        applied, running, failed = apply_pending_batches()
+
+        delay = POLL_INITIAL_DELAY
+        while args.wait and running:
+            logger.info(f"{running} batch jobs still running, checking again in {delay}s")
+            time.sleep(delay)
+            delay = min(delay * 2, POLL_MAX_DELAY)
+
+            round_applied, running, round_failed = apply_pending_batches()
+            applied += round_applied
+            failed += round_failed
+
+        pruned = get_generator().response_cache.prune(vacuum=True)
+
+        logger.info("=" * 70)
+        logger.info("SUMMARY")
+        logger.info("=" * 70)
+        logger.info(f"Applied: {applied}")
+        logger.info(f"Still running: {running}")
+        logger.info(f"Failed: {failed}")
+        logger.info(f"Expired cache entries pruned: {pruned}")
+        logger.info("=" * 70)
+
+        return 0 if failed == 0 else 1
+
+    except KeyboardInterrupt:
+        logger.warning("\nOperation interrupted by user")
+        return 130
+
+    except Exception as e:
+        logger.error(f"Fatal error: {e}", exc_info=True)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -19,6 +19,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 from app.services import (
     starburst_service, dynamodb_service, schema_comparator
 )
+from app.services.dynamodb import COLUMN_SCHEMA_PROJECTION
 from app.models import SchemaStatus
 from app.config import get_all_table_names
 from app.utils.logger import app_logger as logger
@@ -50,8 +51,10 @@ def check_schema_for_table(table_name: str) -> bool:
             logger.warning(f"No metadata found for {table_name}. Skipping schema check.")
             return False
         
-        # Get column metadata to extract stored schema
-        column_metadata_list = dynamodb_service.get_all_columns_for_table(table_name)
+        # Get column metadata to extract stored schema (names and types only)
+        column_metadata_list = dynamodb_service.get_all_columns_for_table(
+            table_name, projection=COLUMN_SCHEMA_PROJECTION
+        )
         if not column_metadata_list:
             logger.warning(f"No column metadata found for {table_name}. Skipping schema check.")
             return False
@@ -84,7 +84,7 @@ def test_neptune_with_existing_tables():
                 table_name=table_name,
                 row_count=table_metadata.row_count,
                 column_count=table_metadata.column_count,
-                schema_status=table_metadata.schema_status.value,
+                schema_status=table_metadata.schema_status,
                 table_embedding=table_embedding,
                 table_summary=table_summary
             )
@@ -151,7 +151,7 @@ def test_neptune_with_existing_tables():
             print(f"\n💾 Step 5: Storing relationships...")
 
             # Check relationship detection status
-            rel_status = table_metadata.relationship_detection_status.value if hasattr(table_metadata.relationship_detection_status, 'value') else str(table_metadata.relationship_detection_status)
+            rel_status = table_metadata.relationship_detection_status
             print(f"   Relationship detection status: {rel_status}")
 
             try:
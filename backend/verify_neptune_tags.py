@@ -49,7 +49,7 @@ def verify_neptune_tags():
 
     # Create lookup map: table_name -> (search_mode, neptune_import_status)
     dynamodb_map = {
-        t.catalog_schema_table: (t.search_mode, t.neptune_import_status.value)
+        t.catalog_schema_table: (t.search_mode, t.neptune_import_status)
         for t in all_tables
     }
     logger.info(f"Found {len(all_tables)} tables in DynamoDB")